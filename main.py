@@ -6,6 +6,7 @@ import sys
 from models.puzzle import Puzzle
 from ui.manual_mode import ManualModeUI
 from ui.auto_mode import AutoModeUI
+from utils.telemetry import start_dump_from_env
 
 class EightPuzzleGame:
     """
@@ -213,8 +214,15 @@ class EightPuzzleGame:
         os.makedirs('ui', exist_ok=True)
         os.makedirs('utils', exist_ok=True)
         
+        # Volcado periódico de métricas si PUZZLE_METRICS_FILE está definida
+        metrics_dump = start_dump_from_env()
+        
         # Iniciar la aplicación
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            if metrics_dump is not None:
+                metrics_dump.stop()
 
 
 # Inicializar la aplicación cuando se ejecuta el script
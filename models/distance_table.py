@@ -0,0 +1,195 @@
+from models.encoding import pack_state, unpack_state, tile_shift, neighbor_positions, TILE_MASK
+from utils.lazy import lazy_import
+from utils.telemetry import record_cache
+
+# NumPy se carga en el primer uso, no al importar el módulo
+np = lazy_import('numpy')
+
+# Estado objetivo por defecto
+DEFAULT_GOAL = ((1, 2, 3), (4, 5, 6), (7, 8, 0))
+
+# Tablas ya construidas, por estado objetivo empaquetado
+_TABLES = {}
+
+
+class DistanceTable:
+    """
+    Distancia óptima exacta (número mínimo de movimientos) de todos los estados
+    resolubles del 8-puzzle al estado objetivo.
+    
+    Se construye con una BFS completa desde el objetivo, de modo que los estados
+    quedan agrupados en capas por distancia (0 a 31 para el objetivo estándar).
+    """
+    def __init__(self, goal_state=DEFAULT_GOAL):
+        """
+        Construye la tabla recorriendo todo el espacio de estados.
+        
+        Args:
+            goal_state: Estado objetivo (3x3)
+        """
+        self.goal_state = np.array(goal_state)
+        self.size = self.goal_state.shape[0]
+        self.goal_code = pack_state(self.goal_state)
+        
+        # Distancia de cada estado empaquetado y capas de estados por distancia
+        self.distances = {}
+        self.layers = []
+        
+        # Claves ordenadas y distancias para lookup() (se crean en el primer uso)
+        self._sorted_codes = None
+        self._sorted_distances = None
+        
+        self._build()
+    
+    def _build(self):
+        """Recorre el espacio de estados por capas desde el objetivo."""
+        size = self.size
+        shifts = [tile_shift(position, size) for position in range(size * size)]
+        neighbors = [[position for _, position in moves] for moves in neighbor_positions(size)]
+        
+        goal_blank = int(np.flatnonzero(self.goal_state.ravel() == 0)[0])
+        distances = {self.goal_code: 0}
+        frontier = [(self.goal_code, goal_blank)]
+        
+        while frontier:
+            self.layers.append([code for code, _ in frontier])
+            depth = len(self.layers)
+            next_frontier = []
+            
+            for code, blank in frontier:
+                blank_shift = shifts[blank]
+                for position in neighbors[blank]:
+                    # Mover la ficha vecina al hueco (el hueco vale 0)
+                    shift = shifts[position]
+                    tile = (code >> shift) & TILE_MASK
+                    child = code & ~(TILE_MASK << shift) | (tile << blank_shift)
+                    
+                    if child not in distances:
+                        distances[child] = depth
+                        next_frontier.append((child, position))
+            
+            frontier = next_frontier
+        
+        self.distances = distances
+    
+    @property
+    def max_distance(self):
+        """Distancia del estado más lejano al objetivo."""
+        return len(self.layers) - 1
+    
+    def layer_sizes(self):
+        """
+        Returns:
+            Lista con el número de estados de cada capa
+        """
+        return [len(layer) for layer in self.layers]
+    
+    def distance(self, state):
+        """
+        Devuelve la distancia óptima de un estado al objetivo.
+        
+        Args:
+            state: Estado del tablero
+        
+        Returns:
+            int o None si el estado no tiene solución
+        """
+        return self.distances.get(pack_state(state))
+    
+    def lookup(self, codes):
+        """
+        Distancia óptima de muchos estados empaquetados a la vez.
+        
+        La primera llamada ordena todos los estados de la tabla en un array;
+        después cada consulta es una búsqueda binaria vectorizada.
+        
+        Args:
+            codes: Array de estados empaquetados (pack_state)
+        
+        Returns:
+            Array int16 con la distancia de cada estado (-1 si no tiene solución)
+        """
+        if self._sorted_codes is None:
+            codes_by_layer = np.fromiter(
+                (code for layer in self.layers for code in layer), dtype=np.uint64, count=len(self.distances)
+            )
+            depths = np.repeat(np.arange(len(self.layers), dtype=np.int16), self.layer_sizes())
+            order = np.argsort(codes_by_layer)
+            self._sorted_distances = depths[order]
+            self._sorted_codes = codes_by_layer[order]
+        
+        codes = np.asarray(codes, dtype=np.uint64)
+        index = np.searchsorted(self._sorted_codes, codes)
+        index[index == len(self._sorted_codes)] = 0
+        found = self._sorted_codes[index] == codes
+        return np.where(found, self._sorted_distances[index], np.int16(-1))
+    
+    def solution(self, state):
+        """
+        Reconstruye un camino óptimo bajando de capa en capa: en cada paso se
+        elige el primer vecino cuya distancia es una menos que la actual.
+        
+        Args:
+            state: Estado del tablero
+        
+        Returns:
+            Lista de acciones del espacio vacío ('up', 'down'...), en el mismo
+            orden de preferencia que PuzzleNode.get_possible_actions(), o None
+            si el estado no tiene solución
+        """
+        code = pack_state(state)
+        distance = self.distances.get(code)
+        if distance is None:
+            return None
+        
+        cells = self.size * self.size
+        shifts = [tile_shift(position, self.size) for position in range(cells)]
+        neighbors = neighbor_positions(self.size)
+        blank = next(position for position in range(cells) if (code >> shifts[position]) & TILE_MASK == 0)
+        
+        actions = []
+        while distance > 0:
+            for action, position in neighbors[blank]:
+                # Mover la ficha vecina al hueco
+                shift = shifts[position]
+                tile = (code >> shift) & TILE_MASK
+                child = code & ~(TILE_MASK << shift) | (tile << shifts[blank])
+                if self.distances.get(child) == distance - 1:
+                    actions.append(action)
+                    code, blank, distance = child, position, distance - 1
+                    break
+        return actions
+    
+    def sample_layer(self, depth, count, rng=None):
+        """
+        Elige estados al azar, de forma uniforme y sin repetición, de una capa.
+        
+        Args:
+            depth: Distancia óptima de los estados
+            count: Número de estados. Si la capa tiene menos, se devuelven todos.
+            rng: Generador numpy.random.Generator (por defecto, uno nuevo sin semilla)
+        
+        Returns:
+            Lista de estados (arrays 3x3)
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+        layer = self.layers[depth]
+        indices = rng.choice(len(layer), size=min(count, len(layer)), replace=False)
+        return [unpack_state(layer[i], self.size) for i in sorted(indices)]
+
+
+def get_distance_table(goal_state=DEFAULT_GOAL):
+    """
+    Devuelve la tabla de distancias para un objetivo, construyéndola la primera vez.
+    
+    Args:
+        goal_state: Estado objetivo (3x3)
+    
+    Returns:
+        DistanceTable compartida por todo el proceso
+    """
+    key = pack_state(goal_state)
+    record_cache('distance_table', key in _TABLES)
+    if key not in _TABLES:
+        _TABLES[key] = DistanceTable(goal_state)
+    return _TABLES[key]
\ No newline at end of file
@@ -0,0 +1,127 @@
+from utils.lazy import lazy_import
+
+# NumPy se carga en el primer uso, no al importar el módulo
+np = lazy_import('numpy')
+
+# Cada casilla ocupa 4 bits: tableros de hasta 4x4 caben en un entero de 64 bits
+BITS_PER_TILE = 4
+TILE_MASK = (1 << BITS_PER_TILE) - 1
+
+
+def pack_state(state):
+    """
+    Empaqueta un estado en un entero (4 bits por casilla, la primera casilla
+    en los bits más significativos).
+    
+    Args:
+        state: Estado del tablero (array NumPy, lista de listas o secuencia plana)
+    
+    Returns:
+        int: Estado empaquetado
+    """
+    code = 0
+    for tile in np.asarray(state).ravel():
+        code = (code << BITS_PER_TILE) | int(tile)
+    return code
+
+
+def pack_board(board):
+    """
+    Empaqueta un tablero plano (secuencia de enteros) como pack_state(), sin NumPy.
+    
+    Returns:
+        int: Estado empaquetado
+    """
+    code = 0
+    for tile in board:
+        code = (code << BITS_PER_TILE) | tile
+    return code
+
+
+def flatten_board(state):
+    """
+    Convierte un estado en una tupla plana de enteros, sin NumPy salvo que el
+    estado ya sea un array.
+    
+    Args:
+        state: Array NumPy, lista de filas o secuencia plana
+    
+    Returns:
+        tuple: Valores de las casillas por filas
+    """
+    if hasattr(state, 'ravel'):
+        return tuple(state.ravel().tolist())
+    values = []
+    for item in state:
+        if isinstance(item, (list, tuple)):
+            values.extend(int(value) for value in item)
+        else:
+            values.append(int(item))
+    return tuple(values)
+
+
+def unpack_state(code, size=3):
+    """
+    Desempaqueta un entero generado por pack_state().
+    
+    Args:
+        code: Estado empaquetado
+        size: Lado del tablero
+    
+    Returns:
+        Array NumPy de forma (size, size)
+    """
+    cells = size * size
+    tiles = [(code >> (BITS_PER_TILE * (cells - 1 - i))) & TILE_MASK for i in range(cells)]
+    return np.array(tiles).reshape(size, size)
+
+
+def tile_shift(position, size=3):
+    """Desplazamiento en bits de la casilla `position` (índice plano)."""
+    return BITS_PER_TILE * (size * size - 1 - position)
+
+
+def neighbor_positions(size=3):
+    """
+    Calcula las casillas adyacentes a cada posición del tablero.
+    
+    Args:
+        size: Lado del tablero
+    
+    Returns:
+        Lista donde el elemento i es una lista de pares (acción, posición vecina)
+        con las acciones posibles del espacio vacío situado en i, en el mismo
+        orden que PuzzleNode.get_possible_actions()
+    """
+    neighbors = []
+    for position in range(size * size):
+        row, col = divmod(position, size)
+        moves = []
+        if row > 0:
+            moves.append(('up', position - size))
+        if row < size - 1:
+            moves.append(('down', position + size))
+        if col > 0:
+            moves.append(('left', position - 1))
+        if col < size - 1:
+            moves.append(('right', position + 1))
+        neighbors.append(moves)
+    return neighbors
+
+
+def format_state(state):
+    """Convierte un estado en el formato compacto '1,2,3,4,5,6,7,8,0'."""
+    return ','.join(str(int(tile)) for tile in np.asarray(state).ravel())
+
+
+def parse_state(text):
+    """
+    Convierte una línea de texto en un estado 3x3.
+    
+    Acepta números separados por comas o espacios, por ejemplo
+    '1,2,3,4,5,6,7,8,0' o '1 2 3 4 5 6 7 8 0'.
+    """
+    numbers = [int(num) for num in text.replace(',', ' ').split()]
+    if len(numbers) != 9 or set(numbers) != set(range(9)):
+        raise ValueError(f"Estado inválido: {text.strip()}")
+    return np.array(numbers).reshape(3, 3)
\ No newline at end of file
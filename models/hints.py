@@ -0,0 +1,282 @@
+"""
+Motor de pistas para el modo manual: movimientos óptimos y distancia al
+objetivo del tablero actual, calculados en segundo plano.
+
+HintEngine atiende las peticiones en un hilo propio, de modo que la interfaz
+nunca espera a una búsqueda: cada petición sustituye a la anterior (solo
+importa el último tablero) y, mientras no llegan peticiones nuevas, el hilo
+precalcula las pistas de los tableros vecinos, así que la pista del siguiente
+movimiento ya suele estar en la caché cuando el jugador la pide.
+
+Las pistas salen de la tabla de distancias (models.distance_table), que el
+propio hilo construye la primera vez, o de IDA* con la distancia Manhattan si
+se desactiva la tabla (por ejemplo, para no ocupar su memoria).
+"""
+import threading
+from collections import OrderedDict
+
+from models.distance_table import get_distance_table
+from models.encoding import pack_board, tile_shift, neighbor_positions, TILE_MASK
+from models.random_state import is_solvable
+from utils.telemetry import record_cache
+
+# Lado del tablero
+SIZE = 3
+
+# Estado objetivo por defecto como tupla plana
+GOAL_BOARD = (1, 2, 3, 4, 5, 6, 7, 8, 0)
+
+# Pistas guardadas como máximo (las menos usadas se descartan)
+MAX_CACHED_HINTS = 4096
+
+# Desplazamiento en bits de cada casilla y vecinos del hueco en cada posición
+SHIFTS = [tile_shift(position, SIZE) for position in range(SIZE * SIZE)]
+NEIGHBORS = neighbor_positions(SIZE)
+
+
+def _move(code, blank, position):
+    """Estado empaquetado tras mover la ficha de `position` al hueco."""
+    shift = SHIFTS[position]
+    tile = (code >> shift) & TILE_MASK
+    return code & ~(TILE_MASK << shift) | (tile << SHIFTS[blank])
+
+
+def _blank_of(code):
+    """Posición del hueco en un estado empaquetado."""
+    return next(position for position, shift in enumerate(SHIFTS) if (code >> shift) & TILE_MASK == 0)
+
+
+class IDAStar:
+    """
+    IDA* con la distancia Manhattan sobre estados empaquetados.
+    
+    Solo guarda el camino actual, así que usa muy poca memoria; la heurística
+    se actualiza de forma incremental en cada movimiento.
+    """
+    def __init__(self, goal=GOAL_BOARD):
+        """
+        Args:
+            goal: Estado objetivo plano
+        """
+        self.goal_code = pack_board(goal)
+        goal_position = {tile: position for position, tile in enumerate(goal)}
+        
+        # manhattan[ficha][posición]: distancia de la ficha a su casilla objetivo
+        self.manhattan = [[0] * (SIZE * SIZE) for _ in range(SIZE * SIZE)]
+        for tile in range(1, SIZE * SIZE):
+            goal_row, goal_col = divmod(goal_position[tile], SIZE)
+            for position in range(SIZE * SIZE):
+                row, col = divmod(position, SIZE)
+                self.manhattan[tile][position] = abs(row - goal_row) + abs(col - goal_col)
+    
+    def heuristic(self, code):
+        """Suma de las distancias Manhattan de todas las fichas."""
+        return sum(self.manhattan[(code >> shift) & TILE_MASK][position]
+                   for position, shift in enumerate(SHIFTS))
+    
+    def distance(self, code, max_distance=None):
+        """
+        Distancia óptima de un estado al objetivo.
+        
+        Args:
+            code: Estado empaquetado (debe tener solución)
+            max_distance: Si se indica, se deja de buscar por encima de esta
+                distancia
+        
+        Returns:
+            int o None si la distancia supera max_distance
+        """
+        h = self.heuristic(code)
+        blank = _blank_of(code)
+        bound = h
+        while max_distance is None or bound <= max_distance:
+            found, value = self._search(code, blank, None, 0, bound, h)
+            if found:
+                return value
+            if value is None:
+                return None  # Sin solución: no quedan ramas por explorar
+            bound = value
+        return None
+    
+    def reaches_within(self, code, limit):
+        """True si el objetivo está a `limit` movimientos o menos."""
+        return self.distance(code, max_distance=limit) is not None
+    
+    def _search(self, code, blank, previous, depth, bound, h):
+        """
+        Búsqueda en profundidad limitada por f = g + h.
+        
+        Returns:
+            Tupla (True, distancia) si llega al objetivo; (False, siguiente
+            límite o None si no queda nada por explorar) en otro caso
+        """
+        f = depth + h
+        if f > bound:
+            return False, f
+        if code == self.goal_code:
+            return True, depth
+        
+        next_bound = None
+        for _, position in NEIGHBORS[blank]:
+            if position == previous:
+                continue  # No deshacer el movimiento anterior
+            tile = (code >> SHIFTS[position]) & TILE_MASK
+            child_h = h - self.manhattan[tile][position] + self.manhattan[tile][blank]
+            found, value = self._search(_move(code, blank, position), position, blank,
+                                        depth + 1, bound, child_h)
+            if found:
+                return True, value
+            if value is not None and (next_bound is None or value < next_bound):
+                next_bound = value
+        return False, next_bound
+
+
+class HintEngine:
+    """
+    Calcula en segundo plano los movimientos óptimos del tablero actual.
+    
+    Uso:
+        engine = HintEngine(on_ready=lambda board, hint: ...)
+        engine.request(puzzle.board)   # tras cada movimiento
+        hint = engine.get(puzzle.board)  # inmediato: None si aún no está
+    
+    Cada pista es un dict con:
+        distance: Movimientos óptimos que faltan (None si no tiene solución)
+        moves: Acciones óptimas del hueco ('up', 'down'...)
+        tiles: Posiciones (fila, columna) de las fichas que hay que pulsar
+    """
+    def __init__(self, goal=GOAL_BOARD, use_table=True, on_ready=None):
+        """
+        Args:
+            goal: Estado objetivo plano
+            use_table: True para usar la tabla de distancias; False para IDA*
+            on_ready: Función on_ready(tablero, pista) llamada desde el hilo de
+                trabajo cuando termina la pista del último tablero pedido
+        """
+        self.goal = tuple(goal)
+        self.use_table = use_table
+        self.on_ready = on_ready
+        
+        self._table = None
+        self._ida = None
+        self._cache = OrderedDict()
+        self._pending = None
+        self._prefetch = []
+        self._stopped = False
+        
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="hint-engine", daemon=True)
+        self._thread.start()
+    
+    def get(self, board):
+        """
+        Pista ya calculada de un tablero.
+        
+        Returns:
+            dict o None si todavía no está en la caché
+        """
+        code = pack_board(board)
+        with self._condition:
+            hint = self._cache.get(code)
+            if hint is not None:
+                self._cache.move_to_end(code)
+        record_cache('hints', hint is not None)
+        return hint
+    
+    def request(self, board):
+        """
+        Pide la pista de un tablero sin esperar. Si ya está en la caché se
+        avisa a on_ready de inmediato (desde el hilo que llama).
+        
+        Args:
+            board: Tablero plano
+        """
+        board = tuple(board)
+        code = pack_board(board)
+        with self._condition:
+            hint = self._cache.get(code)
+            if hint is None:
+                # Solo importa el último tablero: sustituye al pendiente
+                self._pending = (board, code)
+                self._prefetch = []
+                self._condition.notify()
+            else:
+                # Precalcular los vecinos del tablero actual aunque su pista ya estuviera
+                self._queue_neighbors(code)
+                self._condition.notify()
+        if hint is not None and self.on_ready is not None and not self._stopped:
+            self.on_ready(board, hint)
+    
+    def stop(self):
+        """
+        Detiene el hilo de trabajo. Las peticiones posteriores se ignoran y
+        on_ready deja de llamarse.
+        """
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+    
+    def _queue_neighbors(self, code):
+        """Encola los vecinos de un estado que aún no tienen pista (con el cerrojo tomado)."""
+        blank = _blank_of(code)
+        self._prefetch = [child for child in (_move(code, blank, position) for _, position in NEIGHBORS[blank])
+                          if child not in self._cache]
+    
+    def _run(self):
+        """Bucle del hilo: primero la petición pendiente, después los vecinos."""
+        while True:
+            with self._condition:
+                while not self._stopped and self._pending is None and not self._prefetch:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+                if self._pending is not None:
+                    (board, code), self._pending = self._pending, None
+                    requested = True
+                else:
+                    code, board = self._prefetch.pop(), None
+                    requested = False
+            
+            hint = self._compute(code)
+            with self._condition:
+                self._cache[code] = hint
+                if len(self._cache) > MAX_CACHED_HINTS:
+                    self._cache.popitem(last=False)
+                if requested and self._pending is None:
+                    self._queue_neighbors(code)
+            
+            # Tras stop() no se avisa: quien escucha puede haber desaparecido
+            if requested and self.on_ready is not None and not self._stopped:
+                self.on_ready(board, hint)
+    
+    def _compute(self, code):
+        """Calcula la pista de un estado con la tabla de distancias o con IDA*."""
+        blank = _blank_of(code)
+        children = [(action, position, _move(code, blank, position)) for action, position in NEIGHBORS[blank]]
+        
+        if self.use_table:
+            if self._table is None:
+                # La primera vez se construye la tabla (unos segundos, en este hilo)
+                self._table = get_distance_table(tuple(self.goal[row * SIZE:(row + 1) * SIZE] for row in range(SIZE)))
+            distances = self._table.distances
+            distance = distances.get(code)
+            best = [(action, position) for action, position, child in children
+                    if distance is not None and distances.get(child) == distance - 1]
+        else:
+            if self._ida is None:
+                self._ida = IDAStar(self.goal)
+            distance = self._ida.distance(code) if self._solvable(code) else None
+            # Un vecino es óptimo si el objetivo está a distance - 1 movimientos de él
+            best = [(action, position) for action, position, child in children
+                    if distance and self._ida.reaches_within(child, distance - 1)]
+        
+        return {
+            'distance': distance,
+            'moves': [action for action, _ in best],
+            'tiles': [divmod(position, SIZE) for _, position in best]
+        }
+    
+    def _solvable(self, code):
+        """Indica si el estado tiene solución (misma paridad que el objetivo)."""
+        board = [(code >> shift) & TILE_MASK for shift in SHIFTS]
+        return is_solvable(board, self.goal, SIZE)
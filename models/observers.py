@@ -0,0 +1,278 @@
+import io
+
+from utils.lazy import lazy_import
+
+# NumPy y el perfilador se cargan en el primer uso, no al importar el módulo
+np = lazy_import('numpy')
+cProfile = lazy_import('cProfile')
+pstats = lazy_import('pstats')
+
+# Eventos que puede recibir un observador durante una búsqueda
+SEARCH_EVENTS = (
+    'on_search_start',
+    'on_expand',
+    'on_generate',
+    'on_duplicate',
+    'on_solution',
+    'on_search_end',
+)
+
+# Eventos que ocurren una vez por nodo (los únicos afectados por el muestreo)
+NODE_EVENTS = ('on_expand', 'on_generate', 'on_duplicate')
+
+
+class SearchObserver:
+    """
+    Interfaz base para observar las búsquedas de PuzzleSolver.
+    
+    Las subclases solo sobrescriben los eventos que les interesan; el solucionador
+    no conecta los eventos que no se sobrescriben, de modo que no tienen coste.
+    """
+    def __init__(self, sample_rate=1.0):
+        """
+        Inicializa el observador.
+        
+        Args:
+            sample_rate: Fracción de eventos por nodo que se notifican (0 < rate <= 1).
+                Por ejemplo, 0.01 notifica uno de cada cien eventos de cada tipo.
+        """
+        if not 0 < sample_rate <= 1:
+            raise ValueError("sample_rate debe estar en el intervalo (0, 1]")
+        
+        self.sample_rate = sample_rate
+        self.sample_every = max(1, round(1 / sample_rate))
+    
+    def on_search_start(self, solver, algorithm):
+        """Se llama al comenzar una búsqueda."""
+    
+    def on_expand(self, node):
+        """Se llama cada vez que se expande un nodo."""
+    
+    def on_generate(self, node):
+        """Se llama por cada nodo hijo generado."""
+    
+    def on_duplicate(self, node):
+        """Se llama cuando un nodo generado ya había sido visitado."""
+    
+    def on_solution(self, path):
+        """Se llama cuando se encuentra la solución, con el camino reconstruido."""
+    
+    def on_search_end(self, result):
+        """
+        Se llama al terminar una búsqueda, con el diccionario de resultados, o
+        con None si una excepción la interrumpió.
+        """
+
+
+def _sampled(callback, every):
+    """
+    Devuelve una versión de callback que solo se ejecuta una de cada `every` veces.
+    """
+    if every == 1:
+        return callback
+    
+    counter = [0]
+    
+    def sampled(*args):
+        counter[0] += 1
+        if counter[0] == every:
+            counter[0] = 0
+            callback(*args)
+    
+    return sampled
+
+
+def _chain(callbacks):
+    """Combina varias funciones en una sola que las llama en orden."""
+    if len(callbacks) == 1:
+        return callbacks[0]
+    
+    def chained(*args):
+        for callback in callbacks:
+            callback(*args)
+    
+    return chained
+
+
+def build_callbacks(observers):
+    """
+    Construye las funciones a llamar para cada evento a partir de los observadores.
+    
+    Args:
+        observers: Lista de instancias de SearchObserver
+    
+    Returns:
+        dict: Evento -> función. Solo incluye los eventos que algún observador
+        sobrescribe, así que un diccionario vacío significa búsqueda sin hooks.
+    """
+    callbacks = {}
+    for event in SEARCH_EVENTS:
+        listeners = []
+        for observer in observers:
+            # Ignorar los eventos que el observador no sobrescribe
+            if getattr(type(observer), event) is getattr(SearchObserver, event):
+                continue
+            
+            callback = getattr(observer, event)
+            if event in NODE_EVENTS:
+                callback = _sampled(callback, observer.sample_every)
+            listeners.append(callback)
+        
+        if listeners:
+            callbacks[event] = _chain(listeners)
+    
+    return callbacks
+
+
+class CounterObserver(SearchObserver):
+    """
+    Observador que cuenta los eventos de la búsqueda.
+    """
+    def __init__(self, sample_rate=1.0):
+        super().__init__(sample_rate)
+        self.counts = dict.fromkeys(NODE_EVENTS + ('on_solution',), 0)
+        self.searches = 0
+    
+    def on_search_start(self, solver, algorithm):
+        self.searches += 1
+    
+    def on_expand(self, node):
+        self.counts['on_expand'] += 1
+    
+    def on_generate(self, node):
+        self.counts['on_generate'] += 1
+    
+    def on_duplicate(self, node):
+        self.counts['on_duplicate'] += 1
+    
+    def on_solution(self, path):
+        self.counts['on_solution'] += 1
+    
+    def estimated_counts(self):
+        """
+        Estima el número real de eventos compensando el muestreo.
+        
+        Returns:
+            dict: Evento -> número estimado de eventos
+        """
+        return {
+            event: count * (self.sample_every if event in NODE_EVENTS else 1)
+            for event, count in self.counts.items()
+        }
+    
+    def reset(self):
+        """Reinicia los contadores."""
+        self.counts = dict.fromkeys(self.counts, 0)
+        self.searches = 0
+
+
+class RingBufferTracer(SearchObserver):
+    """
+    Observador que guarda las últimas expansiones en un buffer circular compacto.
+    
+    Cada expansión se guarda como el estado empaquetado en un entero de 64 bits
+    (4 bits por casilla) y su profundidad, para poder reproducirla después.
+    """
+    def __init__(self, capacity=100000, sample_rate=1.0):
+        """
+        Inicializa el trazador.
+        
+        Args:
+            capacity: Número máximo de expansiones guardadas
+            sample_rate: Fracción de expansiones que se registran
+        """
+        super().__init__(sample_rate)
+        self.capacity = capacity
+        self.states = np.zeros(capacity, dtype=np.uint64)
+        self.depths = np.zeros(capacity, dtype=np.uint16)
+        self.total = 0
+        self.shape = None
+        self._weights = None
+    
+    def on_search_start(self, solver, algorithm):
+        # Los pesos dependen del tamaño del tablero
+        self.shape = solver.initial_state.shape
+        size = solver.initial_state.size
+        self._weights = np.array([16 ** i for i in range(size - 1, -1, -1)], dtype=np.uint64)
+    
+    def on_expand(self, node):
+        slot = self.total % self.capacity
+        self.states[slot] = node.state.ravel().astype(np.uint64) @ self._weights
+        self.depths[slot] = node.depth
+        self.total += 1
+    
+    def __len__(self):
+        """Número de expansiones disponibles en el buffer."""
+        return min(self.total, self.capacity)
+    
+    def replay(self):
+        """
+        Recorre las expansiones guardadas en orden cronológico.
+        
+        Yields:
+            Tuplas (índice de la expansión, estado como array, profundidad)
+        """
+        count = len(self)
+        first = self.total - count
+        size = self.shape[0] * self.shape[1]
+        
+        for index in range(first, self.total):
+            slot = index % self.capacity
+            packed = int(self.states[slot])
+            
+            # Desempaquetar las casillas (4 bits cada una)
+            tiles = [(packed >> (4 * i)) & 0xF for i in range(size - 1, -1, -1)]
+            yield index, np.array(tiles).reshape(self.shape), int(self.depths[slot])
+    
+    def clear(self):
+        """Vacía el buffer."""
+        self.total = 0
+
+
+class CProfileObserver(SearchObserver):
+    """
+    Observador que ejecuta cProfile durante cada búsqueda.
+    
+    El perfilador se desactiva en on_search_end, que el solucionador llama
+    también cuando la búsqueda termina con una excepción.
+    """
+    def __init__(self):
+        super().__init__()
+        self.profiler = cProfile.Profile()
+    
+    def on_search_start(self, solver, algorithm):
+        self.profiler.enable()
+    
+    def on_search_end(self, result):
+        self.profiler.disable()
+    
+    def stats(self, sort='cumulative'):
+        """
+        Devuelve las estadísticas acumuladas.
+        
+        Args:
+            sort: Criterio de ordenación de pstats
+        
+        Returns:
+            pstats.Stats con los datos del perfil
+        """
+        return pstats.Stats(self.profiler).sort_stats(sort)
+    
+    def report(self, limit=20, sort='cumulative'):
+        """
+        Genera un resumen en texto de las funciones más costosas.
+        
+        Args:
+            limit: Número de funciones a mostrar
+            sort: Criterio de ordenación de pstats
+        
+        Returns:
+            str: Informe de pstats
+        """
+        stream = io.StringIO()
+        pstats.Stats(self.profiler, stream=stream).sort_stats(sort).print_stats(limit)
+        return stream.getvalue()
+    
+    def dump(self, path):
+        """Guarda el perfil en un archivo compatible con pstats/snakeviz."""
+        self.profiler.dump_stats(path)
\ No newline at end of file
@@ -0,0 +1,174 @@
+from models.encoding import neighbor_positions
+from models.solver import MOVE_CODES
+from utils.lazy import lazy_import
+
+# NumPy se carga en el primer uso, no al importar el módulo
+np = lazy_import('numpy')
+
+# Cada cuántos pasos se guarda una copia del tablero para acelerar seek()
+CHECKPOINT_INTERVAL = 64
+
+# Movimiento que deshace cada acción
+OPPOSITE_ACTIONS = {'up': 'down', 'down': 'up', 'left': 'right', 'right': 'left'}
+
+# Acción correspondiente a cada código compacto ('U' -> 'up', ...)
+CODE_ACTIONS = {code: action for action, code in MOVE_CODES.items()}
+
+
+class Playback:
+    """
+    Reproduce una solución movimiento a movimiento sobre un tablero en caché.
+    
+    El tablero es una lista plana de enteros y cada paso es un intercambio del
+    espacio vacío con una casilla vecina: no se crean arrays ni se busca el
+    0 en cada paso. Los estados intermedios no se guardan; se materializan
+    solo cuando se piden (state()) o al saltar a un paso (seek()), partiendo
+    de la posición actual o de la copia guardada más cercana, lo que resulte
+    más barato.
+    """
+    def __init__(self, initial_state, actions, checkpoint_interval=CHECKPOINT_INTERVAL):
+        """
+        Prepara la reproducción.
+        
+        Args:
+            initial_state: Estado inicial del tablero (matriz N×N)
+            actions: Acciones del espacio vacío ('up', 'down'...), códigos
+                compactos ("RDLU...") o un camino [(acción, estado), ...] de
+                PuzzleSolver
+            checkpoint_interval: Cada cuántos pasos se guarda una copia del tablero
+        """
+        initial_state = np.asarray(initial_state)
+        self.size = initial_state.shape[0]
+        self.board = initial_state.ravel().tolist()
+        self.blank = self.board.index(0)
+        
+        self.actions = [self._normalize_action(action) for action in actions]
+        self.position = 0
+        
+        # Casilla vecina del espacio vacío para cada posición y acción
+        self.neighbors = [dict(moves) for moves in neighbor_positions(self.size)]
+        
+        # Copias del tablero por paso (se rellenan a medida que se recorren)
+        self.checkpoint_interval = max(1, checkpoint_interval)
+        self.checkpoints = {0: tuple(self.board)}
+    
+    @staticmethod
+    def _normalize_action(action):
+        """Convierte un código compacto o un par (acción, estado) en la acción."""
+        if isinstance(action, tuple):
+            action = action[0]
+        return CODE_ACTIONS.get(action, action)
+    
+    def __len__(self):
+        """Número total de pasos de la solución."""
+        return len(self.actions)
+    
+    def at_end(self):
+        """True si se ha aplicado el último movimiento."""
+        return self.position >= len(self.actions)
+    
+    def _swap(self, action, step):
+        """Mueve el espacio vacío según la acción (sin actualizar la posición)."""
+        target = self.neighbors[self.blank].get(action)
+        if target is None:
+            raise ValueError(f"Movimiento ilegal '{action}' en el paso {step}")
+        board = self.board
+        board[self.blank] = board[target]
+        board[target] = 0
+        self.blank = target
+    
+    def step(self, count=1):
+        """
+        Avanza hasta count pasos (sin pasar del final).
+        
+        Args:
+            count: Número de movimientos a aplicar
+        
+        Returns:
+            int: Pasos aplicados realmente
+        
+        Raises:
+            ValueError: Si un movimiento es ilegal. El tablero y la posición
+                quedan en el último paso válido, así que seek() y back() siguen
+                siendo coherentes.
+        """
+        end = min(self.position + count, len(self.actions))
+        applied = end - self.position
+        interval = self.checkpoint_interval
+        for index in range(self.position, end):
+            try:
+                self._swap(self.actions[index], index + 1)
+            except ValueError:
+                # Los movimientos anteriores ya se aplicaron
+                self.position = index
+                raise
+            if (index + 1) % interval == 0:
+                self.checkpoints.setdefault(index + 1, tuple(self.board))
+        self.position = end
+        
+        # El estado final se guarda siempre: saltar al final no repite la solución
+        if end == len(self.actions):
+            self.checkpoints.setdefault(end, tuple(self.board))
+        return applied
+    
+    def back(self, count=1):
+        """
+        Retrocede hasta count pasos deshaciendo los movimientos.
+        
+        Args:
+            count: Número de movimientos a deshacer
+        
+        Returns:
+            int: Pasos deshechos realmente
+        """
+        start = max(self.position - count, 0)
+        undone = self.position - start
+        for index in range(self.position - 1, start - 1, -1):
+            self._swap(OPPOSITE_ACTIONS[self.actions[index]], index + 1)
+        self.position = start
+        return undone
+    
+    def seek(self, step):
+        """
+        Sitúa el tablero en un paso cualquiera.
+        
+        Se parte de la copia guardada más cercana por debajo del paso (o del
+        propio paso, si ya se visitó) o de la posición actual, según qué
+        requiera menos movimientos.
+        
+        Args:
+            step: Paso de destino (0 = estado inicial, len(self) = final)
+        
+        Returns:
+            int: Paso en el que queda el tablero
+        """
+        step = max(0, min(int(step), len(self.actions)))
+        if step == self.position:
+            return step
+        
+        # Copia guardada más cercana por debajo del destino
+        base = step - step % self.checkpoint_interval
+        if step in self.checkpoints:
+            base = step
+        while base not in self.checkpoints:
+            base -= self.checkpoint_interval
+        
+        if abs(step - self.position) > step - base:
+            self.board = list(self.checkpoints[base])
+            self.blank = self.board.index(0)
+            self.position = base
+        
+        if step > self.position:
+            self.step(step - self.position)
+        else:
+            self.back(self.position - step)
+        return step
+    
+    def state(self):
+        """
+        Materializa el estado actual como matriz NumPy.
+        
+        Returns:
+            Array NumPy de forma (N, N)
+        """
+        return np.array(self.board).reshape(self.size, self.size)
\ No newline at end of file
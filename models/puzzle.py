@@ -1,10 +1,33 @@
-import random
-import numpy as np
-from copy import deepcopy
+from models.encoding import pack_board, flatten_board, unpack_state, tile_shift, neighbor_positions, TILE_MASK
+from models.random_state import random_solvable_board, random_board_at_distance, is_solvable
+from models.solver import MOVE_CODES
+
+# Lado del tablero
+SIZE = 3
+
+# Desplazamiento en bits de cada casilla en el estado empaquetado
+SHIFTS = [tile_shift(position, SIZE) for position in range(SIZE * SIZE)]
+
+# Casilla a la que pasa el hueco con cada acción, desde cada posición
+TARGETS = [dict(moves) for moves in neighbor_positions(SIZE)]
+
+# Estado objetivo: números del 1-8 en orden y 0 representa el espacio vacío
+GOAL_BOARD = (1, 2, 3, 4, 5, 6, 7, 8, 0)
+
 
 class Puzzle:
     """
     Clase que representa el juego 8-puzzle.
+    
+    El estado se guarda empaquetado en un entero (models.encoding, 4 bits por
+    casilla) junto con la posición del hueco, de modo que mover, deshacer,
+    rehacer y comprobar el objetivo son operaciones con enteros, sin NumPy.
+    Los arrays (`state`, `goal_state`) solo se construyen cuando se piden, por
+    ejemplo para dibujar o para los solucionadores.
+    
+    Los movimientos se anotan en un registro (casilla a la que pasa el hueco en
+    cada uno) con un cursor: deshacer retrocede el cursor y rehacer lo avanza;
+    un movimiento nuevo tras deshacer descarta los movimientos deshechos.
     """
     def __init__(self, state=None):
         """
@@ -13,55 +36,72 @@ class Puzzle:
         Args:
             state: Estado inicial del tablero. Si es None, se crea el estado objetivo.
         """
-        # Estado objetivo: números del 1-8 en orden y 0 representa el espacio vacío
-        self.goal_state = np.array([[1, 2, 3], [4, 5, 6], [7, 8, 0]])
+        self.goal_code = pack_board(GOAL_BOARD)
         
-        if state is not None:
-            self.state = np.array(state)
-        else:
-            # Por defecto, iniciar con el estado objetivo
-            self.state = deepcopy(self.goal_state)
-        
-        # Encontrar la posición del espacio vacío (0)
-        self.empty_pos = self._find_empty_position()
-        
-        # Contador de movimientos
-        self.moves_count = 0
+        # Por defecto, iniciar con el estado objetivo
+        self.set_state(state if state is not None else GOAL_BOARD)
+    
+    @property
+    def board(self):
+        """Estado actual como tupla plana (sin NumPy)."""
+        code = self.code
+        return tuple((code >> shift) & TILE_MASK for shift in SHIFTS)
+    
+    @property
+    def state(self):
+        """Estado actual como array NumPy 3x3 (una copia nueva en cada acceso)."""
+        return unpack_state(self.code, SIZE)
+    
+    @state.setter
+    def state(self, new_state):
+        self.set_state(new_state)
+    
+    @property
+    def goal_state(self):
+        """Estado objetivo como array NumPy 3x3."""
+        return unpack_state(self.goal_code, SIZE)
+    
+    @property
+    def empty_pos(self):
+        """Posición (fila, columna) del espacio vacío."""
+        return divmod(self.blank, SIZE)
     
-    def _find_empty_position(self):
-        """Encuentra la posición del espacio vacío (0) en el tablero."""
-        pos = np.where(self.state == 0)
-        return (pos[0][0], pos[1][0])
+    @property
+    def moves_count(self):
+        """Movimientos aplicados desde el último estado establecido (los deshechos no cuentan)."""
+        return self._cursor
     
     def is_goal(self):
         """Verifica si el estado actual es el estado objetivo."""
-        return np.array_equal(self.state, self.goal_state)
+        return self.code == self.goal_code
     
     def get_possible_moves(self):
         """
         Devuelve una lista de movimientos posibles (up, down, left, right)
         basados en la posición actual del espacio vacío.
         """
-        row, col = self.empty_pos
-        moves = []
-        
-        # Comprueba si se puede mover hacia arriba
-        if row > 0:
-            moves.append('up')
-        
-        # Comprueba si se puede mover hacia abajo
-        if row < 2:
-            moves.append('down')
-        
-        # Comprueba si se puede mover hacia la izquierda
-        if col > 0:
-            moves.append('left')
-        
-        # Comprueba si se puede mover hacia la derecha
-        if col < 2:
-            moves.append('right')
-        
-        return moves
+        return list(TARGETS[self.blank])
+    
+    def _swap(self, position):
+        """Mueve la ficha de `position` al hueco y el hueco a `position`."""
+        shift = SHIFTS[position]
+        tile = (self.code >> shift) & TILE_MASK
+        self.code = self.code & ~(TILE_MASK << shift) | (tile << SHIFTS[self.blank])
+        self.blank = position
+    
+    def _apply(self, position):
+        """Aplica un movimiento nuevo y lo anota en el registro."""
+        if self._cursor < len(self._log):
+            if self._log[self._cursor] == position:
+                # Es el mismo movimiento que se deshizo: se conserva el resto
+                return self.redo()
+            # Un movimiento distinto descarta los movimientos deshechos
+            del self._log[self._cursor:]
+        
+        self._swap(position)
+        self._log.append(position)
+        self._cursor += 1
+        return True
     
     def move(self, direction):
         """
@@ -69,39 +109,14 @@ class Puzzle:
         
         Args:
             direction: Dirección del movimiento ('up', 'down', 'left', 'right')
-            
+        
         Returns:
             bool: True si el movimiento fue válido, False en caso contrario.
         """
-        row, col = self.empty_pos
-        
-        # Calcular la nueva posición según la dirección
-        if direction == 'up':
-            new_row, new_col = row - 1, col
-        elif direction == 'down':
-            new_row, new_col = row + 1, col
-        elif direction == 'left':
-            new_row, new_col = row, col - 1
-        elif direction == 'right':
-            new_row, new_col = row, col + 1
-        else:
-            return False  # Dirección inválida
-        
-        # Verificar si la nueva posición está dentro de los límites
-        if new_row < 0 or new_row > 2 or new_col < 0 or new_col > 2:
-            return False
-        
-        # Realizar el movimiento (intercambiar valores)
-        self.state[row, col] = self.state[new_row, new_col]
-        self.state[new_row, new_col] = 0
-        
-        # Actualizar la posición del espacio vacío
-        self.empty_pos = (new_row, new_col)
-        
-        # Incrementar el contador de movimientos
-        self.moves_count += 1
-        
-        return True
+        position = TARGETS[self.blank].get(direction)
+        if position is None:
+            return False  # Dirección inválida o fuera del tablero
+        return self._apply(position)
     
     def move_tile(self, tile_row, tile_col):
         """
@@ -110,101 +125,115 @@ class Puzzle:
         Args:
             tile_row: Fila de la ficha a mover
             tile_col: Columna de la ficha a mover
-            
+        
         Returns:
             bool: True si el movimiento fue válido, False en caso contrario.
         """
-        empty_row, empty_col = self.empty_pos
+        position = tile_row * SIZE + tile_col
+        if position not in TARGETS[self.blank].values():
+            return False
+        return self._apply(position)
+    
+    def can_undo(self):
+        """True si hay movimientos que deshacer."""
+        return self._cursor > 0
+    
+    def can_redo(self):
+        """True si hay movimientos deshechos que rehacer."""
+        return self._cursor < len(self._log)
+    
+    def undo(self):
+        """
+        Deshace el último movimiento.
         
-        # Verificar si la ficha es adyacente al espacio vacío
-        if (abs(tile_row - empty_row) == 1 and tile_col == empty_col) or \
-           (abs(tile_col - empty_col) == 1 and tile_row == empty_row):
-            
-            # Intercambiar la ficha con el espacio vacío
-            self.state[empty_row, empty_col] = self.state[tile_row, tile_col]
-            self.state[tile_row, tile_col] = 0
-            
-            # Actualizar la posición del espacio vacío
-            self.empty_pos = (tile_row, tile_col)
-            
-            # Incrementar el contador de movimientos
-            self.moves_count += 1
-            
-            return True
+        Returns:
+            bool: True si había un movimiento que deshacer
+        """
+        if not self._cursor:
+            return False
+        self._cursor -= 1
+        # El hueco vuelve a donde estaba antes del movimiento
+        self._swap(self._log[self._cursor - 1] if self._cursor else self._start_blank)
+        return True
+    
+    def redo(self):
+        """
+        Vuelve a aplicar el último movimiento deshecho.
+        
+        Returns:
+            bool: True si había un movimiento que rehacer
+        """
+        if self._cursor == len(self._log):
+            return False
+        self._swap(self._log[self._cursor])
+        self._cursor += 1
+        return True
+    
+    def history(self):
+        """
+        Movimientos aplicados desde el último estado establecido.
         
-        return False
+        Returns:
+            str: Movimientos del espacio vacío, por ejemplo "RDLU" (MOVE_CODES)
+        """
+        letters = {SIZE: MOVE_CODES['down'], -SIZE: MOVE_CODES['up'], 1: MOVE_CODES['right'], -1: MOVE_CODES['left']}
+        previous = self._start_blank
+        moves = []
+        for position in self._log[:self._cursor]:
+            moves.append(letters[position - previous])
+            previous = position
+        return ''.join(moves)
     
-    def shuffle(self, num_moves=100):
+    def shuffle(self, distance=None, rng=None):
         """
-        Aleatoriza el tablero realizando una serie de movimientos aleatorios válidos.
+        Aleatoriza el tablero con un estado resoluble elegido de forma uniforme
+        (models.random_state), en tiempo constante.
         
         Args:
-            num_moves: Número de movimientos aleatorios a realizar
+            distance: Si se indica, el estado está a exactamente esta distancia
+                óptima del objetivo
+            rng: Generador random.Random (por defecto, el del módulo random)
         """
-        # Reiniciar el contador de movimientos
-        self.moves_count = 0
+        if distance is None:
+            board = random_solvable_board(GOAL_BOARD, rng=rng)
+        else:
+            board = random_board_at_distance(distance, GOAL_BOARD, rng=rng)
         
-        for _ in range(num_moves):
-            # Obtener los movimientos posibles
-            possible_moves = self.get_possible_moves()
-            
-            # Seleccionar un movimiento aleatorio
-            move = random.choice(possible_moves)
-            
-            # Realizar el movimiento (sin incrementar el contador)
-            row, col = self.empty_pos
-            if move == 'up':
-                new_row, new_col = row - 1, col
-            elif move == 'down':
-                new_row, new_col = row + 1, col
-            elif move == 'left':
-                new_row, new_col = row, col - 1
-            else:  # move == 'right'
-                new_row, new_col = row, col + 1
-            
-            self.state[row, col] = self.state[new_row, new_col]
-            self.state[new_row, new_col] = 0
-            self.empty_pos = (new_row, new_col)
+        # set_state reinicia también el contador de movimientos
+        self.set_state(board)
     
     def reset(self):
         """Reinicia el tablero al estado objetivo."""
-        self.state = deepcopy(self.goal_state)
-        self.empty_pos = self._find_empty_position()
-        self.moves_count = 0
+        self.set_state(GOAL_BOARD)
     
     def set_state(self, new_state):
         """
-        Establece un nuevo estado para el tablero.
+        Establece un nuevo estado para el tablero y vacía el historial.
         
         Args:
-            new_state: Nuevo estado del tablero
+            new_state: Nuevo estado del tablero (array, lista de filas o
+                secuencia plana)
         """
-        self.state = np.array(new_state)
-        self.empty_pos = self._find_empty_position()
-        self.moves_count = 0
+        board = flatten_board(new_state)
+        self.code = pack_board(board)
+        self.blank = board.index(0)
+        
+        # Registro de movimientos: casilla a la que pasa el hueco en cada uno
+        self._start_blank = self.blank
+        self._log = []
+        self._cursor = 0
     
     def is_solvable(self):
         """
         Verifica si el estado actual tiene solución.
         Un 8-puzzle es resoluble si el número de inversiones es par.
         """
-        # Aplanar el estado actual en una lista
-        flat_state = self.state.flatten()
-        
-        # Contar inversiones (pares de números fuera de orden)
-        inversions = 0
-        for i in range(9):
-            for j in range(i + 1, 9):
-                # Ignorar el espacio vacío (0)
-                if flat_state[i] != 0 and flat_state[j] != 0 and flat_state[i] > flat_state[j]:
-                    inversions += 1
-        
-        # Un 8-puzzle tiene solución si el número de inversiones es par
-        return inversions % 2 == 0
+        return is_solvable(self.board, GOAL_BOARD, SIZE)
     
     def __str__(self):
         """Representación en cadena del estado actual del tablero."""
+        board = self.board
         s = ""
-        for row in self.state:
-            s += " ".join(str(tile) for tile in row) + "\n"
-        return s
\ No newline at end of file
+        for row in range(SIZE):
+            s += " ".join(str(tile) for tile in board[row * SIZE:(row + 1) * SIZE]) + "\n"
+        return s
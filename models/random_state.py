@@ -0,0 +1,191 @@
+"""
+Generación de tableros aleatorios resolubles en tiempo constante.
+
+En lugar de aplicar movimientos aleatorios desde el objetivo (lento y sesgado
+hacia estados cercanos), se baraja el tablero completo y, si la permutación
+resultante no tiene solución, se intercambian dos fichas. Intercambiar siempre
+las mismas dos fichas empareja cada tablero sin solución con uno resoluble
+distinto, así que todos los estados resolubles salen con la misma probabilidad.
+
+Con una distancia exacta, el estado se elige de forma uniforme entre los de esa
+capa de la tabla de distancias (models.distance_table). random_walk_board
+conserva el barajado clásico por movimientos aleatorios para quien lo pida
+explícitamente (por ejemplo, el parámetro moves de /api/shuffle).
+"""
+import random
+
+from models.distance_table import get_distance_table
+from models.encoding import unpack_state, neighbor_positions
+from utils.lazy import lazy_import
+
+# NumPy se carga en el primer uso, no al importar el módulo
+np = lazy_import('numpy')
+
+
+def default_goal(size=3):
+    """Objetivo estándar como tupla plana: 1..n-1 y el hueco al final."""
+    return tuple(range(1, size * size)) + (0,)
+
+
+def solvability_parity(board, size=3):
+    """
+    Paridad que conservan todos los movimientos: un tablero tiene solución si
+    coincide con la del objetivo.
+    
+    Es la paridad de las inversiones entre fichas (sin contar el 0); en tableros
+    de lado par se suma la fila del hueco, porque un movimiento vertical cambia
+    las inversiones en un número impar.
+    
+    Args:
+        board: Tablero plano (tupla o lista)
+        size: Lado del tablero
+    
+    Returns:
+        int: 0 o 1
+    """
+    tiles = [tile for tile in board if tile]
+    inversions = sum(1 for i, tile in enumerate(tiles) for other in tiles[i + 1:] if tile > other)
+    if size % 2 == 0:
+        inversions += list(board).index(0) // size
+    return inversions % 2
+
+
+def is_solvable(board, goal=None, size=3):
+    """
+    Indica si el objetivo es alcanzable desde el tablero.
+    
+    Args:
+        board: Tablero plano (tupla o lista)
+        goal: Estado objetivo plano (por defecto, default_goal(size))
+        size: Lado del tablero
+    
+    Returns:
+        bool: True si ambos tienen la misma solvability_parity
+    """
+    goal = goal if goal is not None else default_goal(size)
+    return solvability_parity(board, size) == solvability_parity(goal, size)
+
+
+def _parity_tiles(goal):
+    """Las dos fichas que se intercambian para corregir la paridad (las dos primeras del objetivo)."""
+    first, second = [tile for tile in goal if tile][:2]
+    return first, second
+
+
+def random_solvable_board(goal=None, size=3, rng=None):
+    """
+    Elige un tablero resoluble de forma uniforme.
+    
+    Args:
+        goal: Estado objetivo plano (por defecto, default_goal(size))
+        size: Lado del tablero
+        rng: Generador random.Random (por defecto, el del módulo random)
+    
+    Returns:
+        tuple: Tablero plano
+    """
+    goal = tuple(goal) if goal is not None else default_goal(size)
+    rng = rng if rng is not None else random
+    
+    board = list(goal)
+    rng.shuffle(board)
+    if solvability_parity(board, size) != solvability_parity(goal, size):
+        # Intercambiar dos fichas cambia la paridad sin mover el hueco
+        first, second = _parity_tiles(goal)
+        i, j = board.index(first), board.index(second)
+        board[i], board[j] = second, first
+    return tuple(board)
+
+
+def random_board_at_distance(distance, goal=None, rng=None):
+    """
+    Elige de forma uniforme un tablero a exactamente `distance` movimientos del
+    objetivo (solo 3x3).
+    
+    La primera llamada para un objetivo construye su tabla de distancias
+    (get_distance_table); después cada tablero cuesta un acceso a la capa.
+    
+    Args:
+        distance: Distancia óptima al objetivo
+        goal: Estado objetivo plano (por defecto, default_goal())
+        rng: Generador random.Random (por defecto, el del módulo random)
+    
+    Returns:
+        tuple: Tablero plano
+    """
+    goal = tuple(goal) if goal is not None else default_goal()
+    rng = rng if rng is not None else random
+    
+    table = get_distance_table(tuple(goal[row * 3:row * 3 + 3] for row in range(3)))
+    if not 0 <= distance <= table.max_distance:
+        raise ValueError(f"Distancia fuera de rango: {distance} (máximo {table.max_distance})")
+    layer = table.layers[distance]
+    code = layer[rng.randrange(len(layer))]
+    return tuple(int(tile) for tile in unpack_state(code).ravel())
+
+
+def random_walk_board(num_moves, goal=None, size=3, rng=None):
+    """
+    Genera un tablero resoluble con movimientos aleatorios desde el objetivo.
+    
+    No es uniforme: los estados cercanos al objetivo salen más a menudo. Se usa
+    cuando se quiere controlar el número de movimientos del barajado.
+    
+    Args:
+        num_moves: Número de movimientos aleatorios
+        goal: Estado objetivo plano (por defecto, default_goal(size))
+        size: Lado del tablero
+        rng: Generador random.Random (por defecto, el del módulo random)
+    
+    Returns:
+        tuple: Tablero plano
+    """
+    goal = tuple(goal) if goal is not None else default_goal(size)
+    rng = rng if rng is not None else random
+    
+    neighbors = neighbor_positions(size)
+    board = list(goal)
+    blank = board.index(0)
+    previous = None
+    for _ in range(num_moves):
+        # No deshacer el movimiento anterior para que el tablero se aleje del objetivo
+        target = rng.choice([position for _, position in neighbors[blank] if position != previous])
+        board[blank], board[target] = board[target], 0
+        previous, blank = blank, target
+    return tuple(board)
+
+
+def random_boards(count, goal=None, size=3, seed=None):
+    """
+    Genera muchos tableros resolubles uniformes de una vez, con NumPy.
+    
+    Args:
+        count: Número de tableros
+        goal: Estado objetivo plano (por defecto, default_goal(size))
+        size: Lado del tablero
+        seed: Semilla o numpy.random.Generator (None = aleatorio)
+    
+    Returns:
+        Array uint8 de forma (count, size * size)
+    """
+    goal = tuple(goal) if goal is not None else default_goal(size)
+    rng = np.random.default_rng(seed)
+    cells = size * size
+    
+    # Una permutación aleatoria por fila: orden de una fila de números aleatorios
+    boards = np.array(goal, dtype=np.uint8)[np.argsort(rng.random((count, cells)), axis=1)]
+    
+    # Inversiones de cada tablero, comparando a la vez todos los pares de casillas
+    first, second = np.triu_indices(cells, 1)
+    inversions = ((boards[:, first] > boards[:, second]) & (boards[:, second] != 0)).sum(axis=1)
+    if size % 2 == 0:
+        inversions += np.argmax(boards == 0, axis=1) // size
+    
+    # Corregir la paridad de los que no tienen solución
+    unsolvable = inversions % 2 != solvability_parity(goal, size)
+    wrong = boards[unsolvable]
+    tile_a, tile_b = _parity_tiles(goal)
+    is_a, is_b = wrong == tile_a, wrong == tile_b
+    wrong[is_a], wrong[is_b] = tile_b, tile_a
+    boards[unsolvable] = wrong
+    return boards
@@ -1,8 +1,88 @@
 import time
-import numpy as np
 from collections import deque
 import heapq
 from copy import deepcopy
+from functools import partial, wraps
+
+from models.observers import build_callbacks
+from utils.lazy import lazy_import
+from utils.telemetry import record_search
+
+# NumPy se carga en el primer uso, no al importar el módulo
+np = lazy_import('numpy')
+
+# Fases medidas cuando la instrumentación está activada
+TIMING_PHASES = ('expansion', 'heuristic', 'hashing', 'queue', 'path')
+
+# Algoritmos disponibles (nombres usados en la interfaz y en las métricas)
+ALGORITHMS = ("BFS", "DFS Limitada", "A* Manhattan")
+
+# Alias cortos de los algoritmos (línea de comandos y servicio HTTP)
+ALGORITHM_ALIASES = {
+    'bfs': "BFS",
+    'dfs': "DFS Limitada",
+    'astar': "A* Manhattan",
+}
+
+# Código de una letra para cada acción (movimiento del espacio vacío)
+MOVE_CODES = {'up': 'U', 'down': 'D', 'left': 'L', 'right': 'R'}
+
+
+def parse_algorithm(name):
+    """
+    Convierte un nombre o alias de algoritmo en su nombre canónico.
+    
+    Args:
+        name: Alias ('bfs', 'dfs', 'astar') o nombre completo
+    
+    Returns:
+        str: Nombre del algoritmo tal como aparece en ALGORITHMS
+    
+    Raises:
+        ValueError: Si el nombre no corresponde a ningún algoritmo
+    """
+    if name in ALGORITHMS:
+        return name
+    if isinstance(name, str) and name.lower() in ALGORITHM_ALIASES:
+        return ALGORITHM_ALIASES[name.lower()]
+    raise ValueError(f"Algoritmo desconocido: {name!r} (opciones: {', '.join(ALGORITHM_ALIASES)})")
+
+
+def path_to_moves(path):
+    """
+    Convierte un camino de la búsqueda en una cadena compacta de movimientos.
+    
+    Args:
+        path: Lista de tuplas (acción, estado) devuelta por los solucionadores
+        
+    Returns:
+        str: Movimientos del espacio vacío, por ejemplo "RDLU"
+    """
+    return ''.join(MOVE_CODES[action] for action, _ in path)
+
+
+class SearchTimeout(Exception):
+    """Se lanza internamente cuando una búsqueda supera su límite de tiempo."""
+
+
+def _handles_timeout(search):
+    """
+    Decorador para los métodos solve_*: convierte un SearchTimeout en un
+    resultado sin éxito marcado con 'timed_out' y, ante cualquier otra
+    excepción, cierra la búsqueda en los observadores antes de propagarla.
+    """
+    @wraps(search)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return search(self, *args, **kwargs)
+        except SearchTimeout:
+            return self._finish_search(False, [], self._start_ns, timed_out=True)
+        except BaseException:
+            self._abort_search()
+            raise
+    
+    return wrapper
+
 
 class PuzzleNode:
     """
@@ -126,21 +206,35 @@ class PuzzleSolver:
     """
     Clase que implementa diferentes algoritmos de búsqueda para resolver el 8-puzzle.
     """
-    def __init__(self, initial_state, goal_state):
+    def __init__(self, initial_state, goal_state, instrument=False, observers=None, time_limit=None):
         """
         Inicializa el solucionador con los estados inicial y objetivo.
         
         Args:
             initial_state: Estado inicial del tablero
             goal_state: Estado objetivo del tablero
+            instrument: Si es True, acumula el tiempo de cada fase de la búsqueda
+                (expansión, heurística, hashing, cola y reconstrucción del camino)
+                y lo devuelve en 'timing_breakdown'
+            observers: Lista de SearchObserver que reciben los eventos de la búsqueda
+            time_limit: Tiempo máximo por búsqueda en segundos. Si se supera, el
+                resultado no tiene éxito y 'timed_out' es True. None = sin límite.
         """
         self.initial_state = np.array(initial_state)
         self.goal_state = np.array(goal_state)
+        self.instrument = instrument
+        self.observers = list(observers) if observers else []
+        self.time_limit = time_limit
         
         # Métricas de rendimiento
         self.nodes_expanded = 0
         self.execution_time = 0
         self.path_length = 0
+        self._phase_times = None
+        self._callbacks = {}
+        self._start_ns = 0
+        self._algorithm = None
+        self._searching = False
     
     def _is_goal(self, state):
         """
@@ -170,6 +264,218 @@ class PuzzleSolver:
         
         return distance
     
+    def _expand(self, node):
+        """
+        Genera todos los nodos hijos de un nodo.
+        
+        Args:
+            node: Nodo a expandir
+            
+        Returns:
+            Lista de nodos hijos en el orden de get_possible_actions()
+        """
+        return [node.get_child_node(action) for action in node.get_possible_actions()]
+    
+    def _timed(self, phase, func):
+        """
+        Envuelve una operación de la búsqueda para acumular su tiempo en una fase.
+        
+        Si la instrumentación está desactivada devuelve la función original,
+        de modo que los bucles de búsqueda no pagan ningún coste adicional.
+        
+        Args:
+            phase: Nombre de la fase (ver TIMING_PHASES)
+            func: Operación a medir
+            
+        Returns:
+            La función original o una versión instrumentada de la misma
+        """
+        if self._phase_times is None:
+            return func
+        
+        phase_times = self._phase_times
+        clock = time.perf_counter_ns
+        
+        def timed(*args):
+            start = clock()
+            result = func(*args)
+            phase_times[phase] += clock() - start
+            return result
+        
+        return timed
+    
+    def _deadline(self, pop):
+        """
+        Envuelve la extracción de la frontera para comprobar el límite de tiempo.
+        
+        Sin límite de tiempo devuelve la función original.
+        """
+        if self.time_limit is None:
+            return pop
+        
+        deadline = self._start_ns + int(self.time_limit * 1e9)
+        clock = time.perf_counter_ns
+        
+        def checked():
+            if clock() > deadline:
+                raise SearchTimeout()
+            return pop()
+        
+        return checked
+    
+    def add_observer(self, observer):
+        """
+        Añade un observador a las próximas búsquedas.
+        
+        Args:
+            observer: Instancia de SearchObserver
+        """
+        self.observers.append(observer)
+    
+    def _observe_expand(self, expand):
+        """
+        Envuelve la expansión para notificar on_expand y on_generate.
+        
+        Sin observadores interesados devuelve la función original.
+        """
+        on_expand = self._callbacks.get('on_expand')
+        on_generate = self._callbacks.get('on_generate')
+        if on_expand is None and on_generate is None:
+            return expand
+        
+        def observed(node):
+            if on_expand is not None:
+                on_expand(node)
+            children = expand(node)
+            if on_generate is not None:
+                for child in children:
+                    on_generate(child)
+            return children
+        
+        return observed
+    
+    def _observe_duplicates(self, is_visited):
+        """
+        Envuelve la detección de duplicados para notificar on_duplicate.
+        
+        Sin observadores interesados devuelve la función original.
+        """
+        on_duplicate = self._callbacks.get('on_duplicate')
+        if on_duplicate is None:
+            return is_visited
+        
+        def observed(node):
+            if is_visited(node):
+                on_duplicate(node)
+                return True
+            return False
+        
+        return observed
+    
+    def _start_search(self, algorithm):
+        """
+        Reinicia las métricas antes de una búsqueda.
+        
+        Args:
+            algorithm: Nombre del algoritmo que se va a ejecutar
+            
+        Returns:
+            int: Marca de tiempo de inicio en nanosegundos
+        """
+        self.nodes_expanded = 0
+        self.path_length = 0
+        self._algorithm = algorithm
+        self._phase_times = dict.fromkeys(TIMING_PHASES, 0) if self.instrument else None
+        self._callbacks = build_callbacks(self.observers) if self.observers else {}
+        
+        # Desde aquí los observadores deben recibir on_search_end pase lo que pase
+        self._searching = True
+        if 'on_search_start' in self._callbacks:
+            self._callbacks['on_search_start'](self, algorithm)
+        
+        self._start_ns = time.perf_counter_ns()
+        return self._start_ns
+    
+    def _finish_search(self, success, path, start_ns, timed_out=False):
+        """
+        Cierra una búsqueda y construye el diccionario de resultados.
+        
+        Args:
+            success: True si se encontró la solución
+            path: Camino encontrado (lista de tuplas (acción, estado))
+            start_ns: Marca de tiempo de inicio devuelta por _start_search()
+            timed_out: True si la búsqueda se detuvo por el límite de tiempo
+            
+        Returns:
+            dict: Diccionario con los resultados y métricas de la búsqueda
+        """
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        self.execution_time = elapsed_ns / 1e9
+        self.path_length = len(path)
+        
+        # Desglose por fase en segundos (solo con instrumentación)
+        timing_breakdown = None
+        if self._phase_times is not None:
+            timing_breakdown = {phase: ns / 1e9 for phase, ns in self._phase_times.items()}
+            timing_breakdown['other'] = max(elapsed_ns - sum(self._phase_times.values()), 0) / 1e9
+        
+        result = {
+            'success': success,
+            'path': path,
+            'nodes_expanded': self.nodes_expanded,
+            'path_length': self.path_length,
+            'execution_time': self.execution_time,
+            'timed_out': timed_out,
+            'timing_breakdown': timing_breakdown
+        }
+        
+        self._searching = False
+        try:
+            # Métricas del proceso (utils.telemetry)
+            record_search(self._algorithm, result)
+            
+            # Notificar a los observadores
+            if success and 'on_solution' in self._callbacks:
+                self._callbacks['on_solution'](path)
+        finally:
+            if 'on_search_end' in self._callbacks:
+                self._callbacks['on_search_end'](result)
+        
+        return result
+    
+    def _abort_search(self):
+        """
+        Cierra una búsqueda interrumpida por una excepción: los observadores
+        reciben on_search_end(None), de modo que ninguno queda activo (por
+        ejemplo, CProfileObserver desactiva el perfilador).
+        """
+        if not self._searching:
+            return  # La búsqueda ya se cerró en _finish_search()
+        self._searching = False
+        if 'on_search_end' in self._callbacks:
+            self._callbacks['on_search_end'](None)
+    
+    def solve(self, algorithm, depth_limit=60):
+        """
+        Resuelve el puzzle con el algoritmo indicado por su nombre.
+        
+        Args:
+            algorithm: Uno de ALGORITHMS
+            depth_limit: Límite de profundidad para "DFS Limitada"
+            
+        Returns:
+            dict: Diccionario con los resultados y métricas de la búsqueda
+        """
+        if algorithm == "BFS":
+            return self.solve_bfs()
+        elif algorithm == "DFS Limitada":
+            return self.solve_dfs_limited(depth_limit=depth_limit)
+        elif algorithm == "A* Manhattan":
+            return self.solve_astar()
+        
+        raise ValueError(f"Algoritmo desconocido: {algorithm}")
+    
+    @_handles_timeout
     def solve_bfs(self):
         """
         Resuelve el puzzle usando Búsqueda en Anchura (BFS).
@@ -177,69 +483,50 @@ class PuzzleSolver:
         Returns:
             dict: Diccionario con los resultados y métricas de la búsqueda
         """
-        start_time = time.time()
+        start_ns = self._start_search('BFS')
         
         # Inicializar el nodo raíz
         root = PuzzleNode(state=self.initial_state)
         
         # Verificar si el estado inicial ya es el objetivo
         if self._is_goal(root.state):
-            self.execution_time = time.time() - start_time
-            self.nodes_expanded = 0
-            self.path_length = 0
-            return {
-                'success': True,
-                'path': [],
-                'nodes_expanded': 0,
-                'path_length': 0,
-                'execution_time': self.execution_time
-            }
+            return self._finish_search(True, [], start_ns)
         
         # Inicializar la cola y el conjunto de visitados
         queue = deque([root])
         visited = set()
         visited.add(root)
         
-        self.nodes_expanded = 0
+        # Operaciones de la búsqueda (medidas por fase y observadas solo si se pide)
+        expand = self._observe_expand(self._timed('expansion', self._expand))
+        is_goal = self._timed('expansion', self._is_goal)
+        is_visited = self._observe_duplicates(self._timed('hashing', visited.__contains__))
+        mark_visited = self._timed('hashing', visited.add)
+        push = self._timed('queue', queue.append)
+        pop = self._deadline(self._timed('queue', queue.popleft))
+        get_path = self._timed('path', PuzzleNode.get_path)
         
         while queue:
             # Obtener el siguiente nodo de la cola
-            node = queue.popleft()
+            node = pop()
             self.nodes_expanded += 1
             
             # Expandir el nodo actual
-            for action in node.get_possible_actions():
-                child = node.get_child_node(action)
-                
+            for child in expand(node):
                 # Verificar si el estado ya ha sido visitado
-                if child not in visited:
+                if not is_visited(child):
                     # Verificar si el nuevo estado es el objetivo
-                    if self._is_goal(child.state):
-                        path = child.get_path()
-                        self.path_length = len(path)
-                        self.execution_time = time.time() - start_time
-                        return {
-                            'success': True,
-                            'path': path,
-                            'nodes_expanded': self.nodes_expanded,
-                            'path_length': self.path_length,
-                            'execution_time': self.execution_time
-                        }
+                    if is_goal(child.state):
+                        return self._finish_search(True, get_path(child), start_ns)
                     
                     # Añadir el nodo a la cola y al conjunto de visitados
-                    queue.append(child)
-                    visited.add(child)
+                    push(child)
+                    mark_visited(child)
         
         # Si la cola se vacía sin encontrar la solución
-        self.execution_time = time.time() - start_time
-        return {
-            'success': False,
-            'path': [],
-            'nodes_expanded': self.nodes_expanded,
-            'path_length': 0,
-            'execution_time': self.execution_time
-        }
+        return self._finish_search(False, [], start_ns)
     
+    @_handles_timeout
     def solve_dfs_limited(self, depth_limit=60):
         """
         Resuelve el puzzle usando Búsqueda en Profundidad Limitada (DFS limitada).
@@ -250,34 +537,32 @@ class PuzzleSolver:
         Returns:
             dict: Diccionario con los resultados y métricas de la búsqueda
         """
-        start_time = time.time()
+        start_ns = self._start_search('DFS Limitada')
         
         # Inicializar el nodo raíz
         root = PuzzleNode(state=self.initial_state)
         
         # Verificar si el estado inicial ya es el objetivo
         if self._is_goal(root.state):
-            self.execution_time = time.time() - start_time
-            self.nodes_expanded = 0
-            self.path_length = 0
-            return {
-                'success': True,
-                'path': [],
-                'nodes_expanded': 0,
-                'path_length': 0,
-                'execution_time': self.execution_time
-            }
+            return self._finish_search(True, [], start_ns)
         
         # Inicializar la pila y el conjunto de visitados
         stack = [root]
         visited = set()
         visited.add(root)
         
-        self.nodes_expanded = 0
+        # Operaciones de la búsqueda (medidas por fase y observadas solo si se pide)
+        expand = self._observe_expand(self._timed('expansion', self._expand))
+        is_goal = self._timed('expansion', self._is_goal)
+        is_visited = self._observe_duplicates(self._timed('hashing', visited.__contains__))
+        mark_visited = self._timed('hashing', visited.add)
+        push = self._timed('queue', stack.append)
+        pop = self._deadline(self._timed('queue', stack.pop))
+        get_path = self._timed('path', PuzzleNode.get_path)
         
         while stack:
             # Obtener el siguiente nodo de la pila
-            node = stack.pop()
+            node = pop()
             self.nodes_expanded += 1
             
             # No expandir nodos más allá del límite de profundidad
@@ -285,38 +570,21 @@ class PuzzleSolver:
                 continue
             
             # Expandir el nodo actual (en orden inverso para preservar el orden de exploración)
-            for action in reversed(node.get_possible_actions()):
-                child = node.get_child_node(action)
-                
+            for child in reversed(expand(node)):
                 # Verificar si el estado ya ha sido visitado
-                if child not in visited:
+                if not is_visited(child):
                     # Verificar si el nuevo estado es el objetivo
-                    if self._is_goal(child.state):
-                        path = child.get_path()
-                        self.path_length = len(path)
-                        self.execution_time = time.time() - start_time
-                        return {
-                            'success': True,
-                            'path': path,
-                            'nodes_expanded': self.nodes_expanded,
-                            'path_length': self.path_length,
-                            'execution_time': self.execution_time
-                        }
+                    if is_goal(child.state):
+                        return self._finish_search(True, get_path(child), start_ns)
                     
                     # Añadir el nodo a la pila y al conjunto de visitados
-                    stack.append(child)
-                    visited.add(child)
+                    push(child)
+                    mark_visited(child)
         
         # Si la pila se vacía sin encontrar la solución
-        self.execution_time = time.time() - start_time
-        return {
-            'success': False,
-            'path': [],
-            'nodes_expanded': self.nodes_expanded,
-            'path_length': 0,
-            'execution_time': self.execution_time
-        }
+        return self._finish_search(False, [], start_ns)
     
+    @_handles_timeout
     def solve_astar(self):
         """
         Resuelve el puzzle usando el algoritmo A* con heurística de Manhattan.
@@ -324,28 +592,22 @@ class PuzzleSolver:
         Returns:
             dict: Diccionario con los resultados y métricas de la búsqueda
         """
-        start_time = time.time()
+        start_ns = self._start_search('A* Manhattan')
         
         # Inicializar el nodo raíz
         root = PuzzleNode(state=self.initial_state)
         
         # Verificar si el estado inicial ya es el objetivo
         if self._is_goal(root.state):
-            self.execution_time = time.time() - start_time
-            self.nodes_expanded = 0
-            self.path_length = 0
-            return {
-                'success': True,
-                'path': [],
-                'nodes_expanded': 0,
-                'path_length': 0,
-                'execution_time': self.execution_time
-            }
+            return self._finish_search(True, [], start_ns)
+        
+        # Operaciones de la búsqueda (medidas por fase y observadas solo si se pide)
+        heuristic = self._timed('heuristic', self._get_manhattan_distance)
         
         # Inicializar la cola de prioridad y el conjunto de visitados
         # El costo es f(n) = g(n) + h(n), donde g(n) es el costo hasta ahora (profundidad)
         # y h(n) es la heurística (distancia de Manhattan)
-        h_root = self._get_manhattan_distance(root.state)
+        h_root = heuristic(root.state)
         f_root = root.depth + h_root
         
         # Cola de prioridad como lista de tuplas (f(n), nodo)
@@ -353,46 +615,34 @@ class PuzzleSolver:
         visited = set()
         visited.add(root)
         
-        self.nodes_expanded = 0
+        expand = self._observe_expand(self._timed('expansion', self._expand))
+        is_goal = self._timed('expansion', self._is_goal)
+        is_visited = self._observe_duplicates(self._timed('hashing', visited.__contains__))
+        mark_visited = self._timed('hashing', visited.add)
+        push = self._timed('queue', partial(heapq.heappush, priority_queue))
+        pop = self._deadline(self._timed('queue', partial(heapq.heappop, priority_queue)))
+        get_path = self._timed('path', PuzzleNode.get_path)
         
         while priority_queue:
             # Obtener el nodo con menor f(n) de la cola de prioridad
-            _, node = heapq.heappop(priority_queue)
+            _, node = pop()
             self.nodes_expanded += 1
             
             # Expandir el nodo actual
-            for action in node.get_possible_actions():
-                child = node.get_child_node(action)
-                
+            for child in expand(node):
                 # Verificar si el estado ya ha sido visitado
-                if child not in visited:
+                if not is_visited(child):
                     # Verificar si el nuevo estado es el objetivo
-                    if self._is_goal(child.state):
-                        path = child.get_path()
-                        self.path_length = len(path)
-                        self.execution_time = time.time() - start_time
-                        return {
-                            'success': True,
-                            'path': path,
-                            'nodes_expanded': self.nodes_expanded,
-                            'path_length': self.path_length,
-                            'execution_time': self.execution_time
-                        }
+                    if is_goal(child.state):
+                        return self._finish_search(True, get_path(child), start_ns)
                     
                     # Calcular f(n) = g(n) + h(n) para el nodo hijo
-                    h_child = self._get_manhattan_distance(child.state)
+                    h_child = heuristic(child.state)
                     f_child = child.depth + h_child
                     
                     # Añadir el nodo a la cola de prioridad y al conjunto de visitados
-                    heapq.heappush(priority_queue, (f_child, child))
-                    visited.add(child)
+                    push((f_child, child))
+                    mark_visited(child)
         
         # Si la cola se vacía sin encontrar la solución
-        self.execution_time = time.time() - start_time
-        return {
-            'success': False,
-            'path': [],
-            'nodes_expanded': self.nodes_expanded,
-            'path_length': 0,
-            'execution_time': self.execution_time
-        }
\ No newline at end of file
+        return self._finish_search(False, [], start_ns)
@@ -0,0 +1,211 @@
+import heapq
+import itertools
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future
+
+from service.engine import TABLE_ENGINE, WEIGHTED_ENGINE
+from utils.telemetry import REGISTRY
+
+# Prioridad de cada motor en la cola (menor = antes): los baratos no esperan detrás de los caros
+ENGINE_PRIORITY = {
+    TABLE_ENGINE: 0,
+    WEIGHTED_ENGINE: 1,
+    "A* Manhattan": 1,
+    "DFS Limitada": 2,
+    "BFS": 3,
+}
+
+# Algoritmos que se degradan a un motor barato cuando hay carga
+EXPENSIVE_ALGORITHMS = ("BFS", "DFS Limitada")
+
+# Métricas de la cola (utils.telemetry)
+REJECTED = REGISTRY.counter('puzzle_requests_rejected_total', "Búsquedas rechazadas con la cola llena")
+DEGRADED = REGISTRY.counter(
+    'puzzle_requests_degraded_total', "Búsquedas degradadas a un motor barato", ('algorithm', 'engine')
+)
+QUEUE_WAIT = REGISTRY.histogram(
+    'puzzle_queue_wait_seconds', "Tiempo de espera en la cola de admisión", ('engine',)
+)
+
+
+class QueueFull(Exception):
+    """La cola de admisión está llena: la petición se rechaza (load shedding)."""
+
+
+class AdmissionQueue:
+    """
+    Cola de prioridad acotada delante del ProcessPoolExecutor.
+    
+    submit() no bloquea: encola la tarea y devuelve un Future propio. Las
+    tareas pasan al ejecutor por orden de prioridad del motor (y de llegada),
+    respetando el número de procesos y un límite de ejecuciones simultáneas
+    por motor, de modo que unas pocas búsquedas BFS no pueden ocupar todos los
+    procesos. Si la cola está llena la tarea se rechaza con QueueFull.
+    """
+    def __init__(self, executor, capacity, limits=None, max_queue=64, degrade_depth=None):
+        """
+        Args:
+            executor: ProcessPoolExecutor que ejecuta las tareas
+            capacity: Número máximo de tareas en ejecución a la vez (procesos)
+            limits: dict motor -> ejecuciones simultáneas (por defecto, la mitad
+                de los procesos para BFS y DFS Limitada)
+            max_queue: Tareas en espera a partir de las que se rechazan nuevas
+            degrade_depth: Tareas en espera a partir de las que se degradan las
+                peticiones costosas (por defecto, capacity)
+        """
+        self.executor = executor
+        self.capacity = capacity
+        self.max_queue = max_queue
+        self.degrade_depth = degrade_depth if degrade_depth is not None else capacity
+        
+        expensive_limit = max(1, capacity // 2)
+        self.limits = {algo: expensive_limit for algo in EXPENSIVE_ALGORITHMS}
+        self.limits.update(limits or {})
+        
+        # RLock: add_done_callback llama a la función en el acto si el Future ya terminó
+        self._lock = threading.RLock()
+        self._heap = []
+        self._order = itertools.count()
+        self._running = Counter()
+        self._total_running = 0
+        
+        # Contadores
+        self.submitted = 0
+        self.rejected = 0
+        self.degraded = 0
+    
+    def depth(self):
+        """Número de tareas en espera."""
+        with self._lock:
+            return len(self._heap)
+    
+    def running(self):
+        """Número de tareas en ejecución."""
+        with self._lock:
+            return self._total_running
+    
+    def choose_engine(self, algorithm, table_available=True):
+        """
+        Decide qué motor atiende una petición según la carga.
+        
+        BFS y DFS Limitada se degradan si hay degrade_depth o más tareas en
+        espera o si ya ocupan todas sus ejecuciones simultáneas. Se usa la
+        tabla de distancias si está disponible para el objetivo y, si no,
+        A* ponderado.
+        
+        Args:
+            algorithm: Algoritmo pedido
+            table_available: True si hay tabla de distancias para el objetivo
+        
+        Returns:
+            Tupla (motor, motivo de la degradación o None)
+        """
+        if algorithm not in EXPENSIVE_ALGORITHMS:
+            return algorithm, None
+        
+        with self._lock:
+            depth = len(self._heap)
+            busy = self._running[algorithm] >= self.limits[algorithm]
+        if depth >= self.degrade_depth:
+            reason = f"{depth} peticiones en cola"
+        elif busy:
+            reason = f"límite de {self.limits[algorithm]} ejecuciones simultáneas de {algorithm} alcanzado"
+        else:
+            return algorithm, None
+        
+        engine = TABLE_ENGINE if table_available else WEIGHTED_ENGINE
+        with self._lock:
+            self.degraded += 1
+        DEGRADED.inc(algorithm, engine)
+        return engine, reason
+    
+    def submit(self, engine, func, *args):
+        """
+        Encola func(*args) para ejecutarla con el motor indicado.
+        
+        Args:
+            engine: Motor (determina la prioridad y el límite de ejecuciones)
+            func: Función a ejecutar en el proceso de trabajo
+        
+        Returns:
+            Future con el resultado (se puede cancelar mientras espera)
+        """
+        future = Future()
+        with self._lock:
+            if len(self._heap) >= self.max_queue:
+                # Las tareas canceladas mientras esperaban no cuentan
+                self._heap = [item for item in self._heap if not item[2].cancelled()]
+                heapq.heapify(self._heap)
+            if len(self._heap) >= self.max_queue:
+                self.rejected += 1
+                REJECTED.inc()
+                raise QueueFull(f"Servicio saturado: {len(self._heap)} peticiones en cola")
+            
+            self.submitted += 1
+            priority = ENGINE_PRIORITY.get(engine, 1)
+            heapq.heappush(self._heap, (priority, next(self._order), future, engine, func, args, time.perf_counter()))
+            self._dispatch()
+        return future
+    
+    def _dispatch(self):
+        """Pasa al ejecutor las tareas en espera que caben (se llama con el cerrojo tomado)."""
+        skipped = []
+        while self._heap and self._total_running < self.capacity:
+            item = heapq.heappop(self._heap)
+            _, _, future, engine, func, args, queued_at = item
+            if self._running[engine] >= self.limits.get(engine, self.capacity):
+                # Motor en su límite: esperar sin bloquear a los de menor prioridad
+                skipped.append(item)
+                continue
+            if not future.set_running_or_notify_cancel():
+                continue  # Cancelada mientras esperaba
+            
+            QUEUE_WAIT.observe(time.perf_counter() - queued_at, engine)
+            self._running[engine] += 1
+            self._total_running += 1
+            try:
+                inner = self.executor.submit(func, *args)
+            except Exception as e:
+                self._running[engine] -= 1
+                self._total_running -= 1
+                future.set_exception(e)
+                continue
+            inner.add_done_callback(lambda done, engine=engine, future=future: self._finished(engine, future, done))
+        
+        for item in skipped:
+            heapq.heappush(self._heap, item)
+    
+    def _finished(self, engine, future, inner):
+        """Libera la ejecución, lanza las siguientes y entrega el resultado."""
+        with self._lock:
+            self._running[engine] -= 1
+            self._total_running -= 1
+            self._dispatch()
+        
+        error = inner.exception()
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(inner.result())
+    
+    def stats(self):
+        """
+        Estado de la cola.
+        
+        Returns:
+            dict con queue_depth, max_queue, running (por motor), capacity,
+            limits, submitted, rejected y degraded
+        """
+        with self._lock:
+            return {
+                'queue_depth': len(self._heap),
+                'max_queue': self.max_queue,
+                'running': {engine: count for engine, count in self._running.items() if count},
+                'capacity': self.capacity,
+                'limits': dict(self.limits),
+                'submitted': self.submitted,
+                'rejected': self.rejected,
+                'degraded': self.degraded
+            }
\ No newline at end of file
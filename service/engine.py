@@ -0,0 +1,295 @@
+"""
+Operaciones del servicio de resolución.
+
+Las funciones de este módulo se ejecutan en los procesos de trabajo del
+servicio (service.server), así que reciben y devuelven solo tipos simples:
+tableros como tuplas planas y caminos como cadenas de movimientos ("RDLU..."),
+nunca arrays NumPy ni listas de estados.
+"""
+import heapq
+import random
+import time
+
+from models.distance_table import DEFAULT_GOAL, get_distance_table
+from models.encoding import format_state, neighbor_positions
+from models.playback import Playback
+from models.random_state import (
+    random_solvable_board, random_board_at_distance, random_walk_board, is_solvable
+)
+from models.solver import PuzzleSolver, ALGORITHMS, MOVE_CODES, path_to_moves
+
+# Lado del tablero
+SIZE = 3
+
+# Estado objetivo por defecto como tupla plana
+GOAL_BOARD = tuple(tile for row in DEFAULT_GOAL for tile in row)
+
+# Límite de profundidad por defecto para "DFS Limitada" (el mismo que la interfaz gráfica)
+DEFAULT_DEPTH_LIMIT = 60
+
+# Motores baratos a los que se degradan las peticiones costosas cuando hay carga:
+# la tabla de distancias precalculada (óptima) y A* ponderado (rápido, no óptimo)
+TABLE_ENGINE = "Tabla de distancias"
+WEIGHTED_ENGINE = "A* ponderado"
+ENGINES = ALGORITHMS + (TABLE_ENGINE, WEIGHTED_ENGINE)
+
+# Peso de la heurística en A* ponderado (f = g + peso * h)
+WEIGHTED_ASTAR_WEIGHT = 2.0
+
+# Cada cuántas expansiones comprueba A* ponderado el límite de tiempo
+DEADLINE_CHECK_INTERVAL = 1024
+
+
+def parse_board(value, size=SIZE):
+    """
+    Convierte un tablero recibido en JSON en una tupla plana.
+    
+    Acepta '1,2,3,4,5,6,7,8,0' (o separado por espacios), una lista plana o
+    una lista de filas.
+    
+    Args:
+        value: Tablero en cualquiera de los formatos anteriores
+        size: Lado del tablero
+    
+    Returns:
+        tuple: Valores de las casillas por filas
+    """
+    try:
+        if isinstance(value, str):
+            numbers = [int(num) for num in value.replace(',', ' ').split()]
+        elif isinstance(value, list) and value and isinstance(value[0], list):
+            numbers = [int(num) for row in value for num in row]
+        elif isinstance(value, list):
+            numbers = [int(num) for num in value]
+        else:
+            raise ValueError
+    except (TypeError, ValueError):
+        raise ValueError(f"Tablero inválido: {value!r}")
+    
+    if sorted(numbers) != list(range(size * size)):
+        raise ValueError(f"El tablero debe contener los números del 0 al {size * size - 1} sin repetir")
+    return tuple(numbers)
+
+
+def to_matrix(board, size=SIZE):
+    """Convierte una tupla plana en una lista de filas."""
+    return [list(board[row * size:(row + 1) * size]) for row in range(size)]
+
+
+def warm_worker():
+    """
+    Inicializador de los procesos de trabajo: construye la tabla de distancias
+    del objetivo por defecto para que la primera petición degradada no la pague.
+    """
+    get_distance_table(DEFAULT_GOAL)
+
+
+def solve_board(board, goal, algorithm, depth_limit=DEFAULT_DEPTH_LIMIT, time_limit=None):
+    """
+    Resuelve un tablero con uno de los motores de ENGINES.
+    
+    Args:
+        board: Tablero inicial (tupla plana)
+        goal: Estado objetivo (tupla plana)
+        algorithm: Uno de ENGINES
+        depth_limit: Límite de profundidad para "DFS Limitada"
+        time_limit: Tiempo máximo de la búsqueda en segundos (None = sin límite)
+    
+    Returns:
+        dict con engine (motor que resolvió), success, timed_out, moves,
+        path_length, nodes_expanded y execution_time
+    """
+    if algorithm == TABLE_ENGINE:
+        return solve_with_table(board, goal)
+    if algorithm == WEIGHTED_ENGINE:
+        return solve_weighted_astar(board, goal, time_limit=time_limit)
+    
+    solver = PuzzleSolver(to_matrix(board), to_matrix(goal), time_limit=time_limit)
+    result = solver.solve(algorithm, depth_limit=depth_limit)
+    return {
+        'engine': algorithm,
+        'success': result['success'],
+        'timed_out': result.get('timed_out', False),
+        'moves': path_to_moves(result['path']),
+        'path_length': result['path_length'],
+        'nodes_expanded': result['nodes_expanded'],
+        'execution_time': result['execution_time']
+    }
+
+
+def solve_with_table(board, goal):
+    """
+    Resuelve un tablero con la tabla de distancias (camino óptimo sin búsqueda).
+    
+    La tabla del objetivo se construye la primera vez en cada proceso (ver
+    warm_worker); después cada solución cuesta un paso por movimiento.
+    
+    Returns:
+        dict con el mismo formato que solve_board(); nodes_expanded es el
+        número de estados recorridos
+    """
+    start = time.perf_counter()
+    actions = get_distance_table(to_matrix(goal)).solution(to_matrix(board))
+    success = actions is not None
+    actions = actions or []
+    return {
+        'engine': TABLE_ENGINE,
+        'success': success,
+        'timed_out': False,
+        'moves': ''.join(MOVE_CODES[action] for action in actions),
+        'path_length': len(actions),
+        'nodes_expanded': len(actions),
+        'execution_time': time.perf_counter() - start
+    }
+
+
+def solve_weighted_astar(board, goal, weight=WEIGHTED_ASTAR_WEIGHT, time_limit=None):
+    """
+    Resuelve un tablero con A* ponderado (f = g + peso * Manhattan).
+    
+    Con peso mayor que 1 expande muchos menos nodos que A* a cambio de que el
+    camino pueda no ser óptimo. Trabaja con tuplas planas y calcula la
+    heurística de forma incremental.
+    
+    Returns:
+        dict con el mismo formato que solve_board()
+    """
+    start = time.perf_counter()
+    deadline = start + time_limit if time_limit else None
+    neighbors = neighbor_positions(SIZE)
+    
+    # Distancia Manhattan de cada ficha en cada posición a su posición objetivo
+    goal_rows = {tile: divmod(position, SIZE) for position, tile in enumerate(goal)}
+    cost = {
+        tile: [abs(row - goal_row) + abs(col - goal_col)
+               for row, col in (divmod(position, SIZE) for position in range(SIZE * SIZE))]
+        for tile, (goal_row, goal_col) in goal_rows.items() if tile
+    }
+    heuristic = sum(cost[tile][position] for position, tile in enumerate(board) if tile)
+    
+    best_cost = {board: 0}
+    parents = {board: None}
+    frontier = [(weight * heuristic, 0, board, board.index(0), 0, heuristic)]
+    counter = 1
+    expanded = 0
+    found = None
+    timed_out = False
+    
+    while frontier:
+        _, _, state, blank, depth, heuristic = heapq.heappop(frontier)
+        if state == goal:
+            found = state
+            break
+        if depth > best_cost[state]:
+            continue  # Entrada obsoleta: ya se llegó a este estado por un camino más corto
+        
+        expanded += 1
+        if deadline and expanded % DEADLINE_CHECK_INTERVAL == 0 and time.perf_counter() > deadline:
+            timed_out = True
+            break
+        
+        for action, position in neighbors[blank]:
+            tile = state[position]
+            child = list(state)
+            child[blank], child[position] = tile, 0
+            child = tuple(child)
+            if depth + 1 < best_cost.get(child, depth + 2):
+                best_cost[child] = depth + 1
+                parents[child] = (state, action)
+                child_heuristic = heuristic + cost[tile][blank] - cost[tile][position]
+                heapq.heappush(frontier, (depth + 1 + weight * child_heuristic, counter, child,
+                                          position, depth + 1, child_heuristic))
+                counter += 1
+    
+    # Reconstruir el camino desde el objetivo
+    moves = []
+    while found is not None and parents[found] is not None:
+        found, action = parents[found]
+        moves.append(MOVE_CODES[action])
+    moves.reverse()
+    
+    success = not timed_out and (bool(moves) or board == goal)
+    return {
+        'engine': WEIGHTED_ENGINE,
+        'success': success,
+        'timed_out': timed_out,
+        'moves': ''.join(moves) if success else '',
+        'path_length': len(moves) if success else 0,
+        'nodes_expanded': expanded,
+        'execution_time': time.perf_counter() - start
+    }
+
+
+def validate_board(board, goal, moves=None):
+    """
+    Comprueba si un tablero tiene solución y, opcionalmente, una secuencia de
+    movimientos.
+    
+    Args:
+        board: Tablero inicial (tupla plana)
+        goal: Estado objetivo (tupla plana)
+        moves: Cadena de movimientos compacta ("RDLU...") o None
+    
+    Returns:
+        dict con state, solvable, is_goal y, si se pasan movimientos,
+        moves_valid, failed_step (paso del primer movimiento ilegal o None),
+        final_state (estado tras el último movimiento válido), reaches_goal
+        y error
+    """
+    report = {
+        'state': format_state(board),
+        'solvable': is_solvable(board, goal),
+        'is_goal': board == goal
+    }
+    if moves is None:
+        return report
+    
+    playback = Playback(to_matrix(board), moves)
+    try:
+        playback.step(len(playback))
+        report['moves_valid'] = True
+        report['failed_step'] = None
+        report['error'] = None
+    except ValueError as e:
+        # La reproducción se detiene antes del movimiento ilegal
+        report['moves_valid'] = False
+        report['failed_step'] = playback.position + 1
+        report['error'] = str(e)
+    report['final_state'] = format_state(playback.board)
+    report['reaches_goal'] = report['moves_valid'] and tuple(playback.board) == goal
+    return report
+
+
+def shuffle_board(goal=GOAL_BOARD, num_moves=30, seed=None):
+    """
+    Genera un tablero resoluble con movimientos aleatorios desde el objetivo
+    (models.random_state.random_walk_board).
+    
+    Args:
+        goal: Estado objetivo (tupla plana)
+        num_moves: Número de movimientos aleatorios
+        seed: Semilla (None = aleatorio)
+    
+    Returns:
+        tuple: Tablero generado
+    """
+    return random_walk_board(num_moves, goal, SIZE, random.Random(seed))
+
+
+def uniform_board(goal=GOAL_BOARD, distance=None, seed=None):
+    """
+    Genera un tablero resoluble elegido de forma uniforme (models.random_state).
+    
+    Args:
+        goal: Estado objetivo (tupla plana)
+        distance: Si se indica, el tablero está a exactamente esta distancia
+            óptima del objetivo
+        seed: Semilla (None = aleatorio)
+    
+    Returns:
+        tuple: Tablero generado
+    """
+    rng = random.Random(seed)
+    if distance is None:
+        return random_solvable_board(goal, rng=rng)
+    return random_board_at_distance(distance, goal, rng=rng)
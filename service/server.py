@@ -0,0 +1,596 @@
+"""
+Servicio HTTP/JSON de resolución del 8-puzzle (solo biblioteca estándar).
+
+Ejemplo:
+    python -m service.server --host 0.0.0.0 --port 8000 --workers 4
+
+Endpoints:
+    GET  /               Cliente web (service/static): modos manual y automático
+    GET  /health         Estado del servicio
+    GET  /metrics        Métricas en formato de texto de Prometheus (utils.telemetry)
+    POST /api/solve      {"state": "1,2,3,4,5,6,7,8,0", "algorithm": "astar"}
+    POST /api/compare    {"state": ..., "algorithms": ["bfs", "astar"]}
+    POST /api/validate   {"state": ..., "moves": "RDLU"}
+    POST /api/shuffle    {"moves": 30, "seed": 1} (también GET /api/shuffle?moves=30);
+                         {"uniform": true} o {"distance": 20} para un tablero uniforme
+
+Todas las peticiones aceptan además "goal" (estado objetivo). Las búsquedas se
+ejecutan en un ProcessPoolExecutor, de modo que un único contenedor atiende a
+muchos usuarios a la vez sin una sesión gráfica por usuario; la validación y
+la generación de tableros son baratas y se hacen en el propio hilo de la
+petición.
+
+Las búsquedas idénticas que coinciden en el tiempo (mismo tablero, objetivo y
+algoritmo) comparten una sola ejecución (service.singleflight); /health
+informa de la proporción de peticiones agrupadas.
+
+Las búsquedas pasan por una cola de prioridad acotada (service.admission) con
+un límite de ejecuciones simultáneas por algoritmo. Con la cola llena se
+responde 503; con carga, BFS y DFS Limitada se resuelven con la tabla de
+distancias o A* ponderado, y la respuesta lo indica en 'engine', 'degraded' y
+'degraded_reason' (se puede impedir con "degrade": false).
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import CancelledError, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+from models.encoding import format_state
+from models.random_state import is_solvable
+from models.solver import ALGORITHMS, parse_algorithm
+from service.admission import AdmissionQueue, QueueFull
+from service.engine import (
+    GOAL_BOARD, DEFAULT_DEPTH_LIMIT, parse_board,
+    solve_board, validate_board, shuffle_board, uniform_board, warm_worker
+)
+from service.singleflight import SingleFlight
+from utils.lazy import preload
+from utils.telemetry import REGISTRY, SEARCH_BUCKETS, record_search
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+
+# Tiempo máximo por búsqueda (segundos) por defecto y máximo aceptado en una petición
+DEFAULT_TIME_LIMIT = 10.0
+MAX_TIME_LIMIT = 60.0
+
+# Métricas de las peticiones HTTP (solo rutas conocidas, para acotar las series)
+HTTP_REQUESTS = REGISTRY.counter(
+    'puzzle_http_requests_total', "Peticiones HTTP atendidas por ruta y código", ('route', 'status')
+)
+HTTP_SECONDS = REGISTRY.histogram(
+    'puzzle_http_request_duration_seconds', "Duración de las peticiones HTTP", ('route',), SEARCH_BUCKETS
+)
+
+# Búsquedas en espera a partir de las que se rechazan peticiones nuevas
+DEFAULT_MAX_QUEUE = 64
+
+# Segundos que se sugiere esperar (cabecera Retry-After) cuando el servicio está saturado
+RETRY_AFTER_SECONDS = 1
+
+# Margen sobre el límite de la búsqueda para esperar la respuesta del proceso de trabajo
+RESULT_GRACE = 5.0
+
+# Archivos del cliente web y tipo de contenido según la extensión
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+CONTENT_TYPES = {
+    '.html': 'text/html; charset=utf-8',
+    '.js': 'application/javascript; charset=utf-8',
+    '.css': 'text/css; charset=utf-8',
+}
+
+# Tamaño máximo del cuerpo de una petición y de un aleatorizado
+MAX_BODY_BYTES = 64 * 1024
+MAX_SHUFFLE_MOVES = 10000
+
+
+class ServiceError(Exception):
+    """Error de una petición con el código HTTP que debe devolverse."""
+    def __init__(self, status, message, retry_after=None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class SolveService:
+    """
+    Lógica del servicio, independiente de HTTP: valida las peticiones, reparte
+    las búsquedas entre los procesos de trabajo y arma las respuestas.
+    """
+    def __init__(self, workers=None, default_time_limit=DEFAULT_TIME_LIMIT,
+                 max_queue=DEFAULT_MAX_QUEUE, degrade_depth=None):
+        """
+        Args:
+            workers: Número de procesos de trabajo (None = número de CPU)
+            default_time_limit: Tiempo máximo por búsqueda si la petición no lo indica
+            max_queue: Búsquedas en espera a partir de las que se rechazan peticiones
+            degrade_depth: Búsquedas en espera a partir de las que se degradan
+                BFS y DFS Limitada (por defecto, el número de procesos)
+        """
+        # NumPy se carga antes de atender peticiones concurrentes (ver utils.lazy.preload)
+        preload('numpy')
+        
+        self.workers = workers or os.cpu_count() or 1
+        self.default_time_limit = default_time_limit
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=warm_worker)
+        
+        # Cola de prioridad con límites por algoritmo delante de los procesos
+        self.admission = AdmissionQueue(
+            self.executor, self.workers, max_queue=max_queue, degrade_depth=degrade_depth
+        )
+        
+        # Búsquedas en curso compartidas entre peticiones idénticas
+        self.flights = SingleFlight()
+        
+        # Medidores calculados al consultar /metrics
+        REGISTRY.gauge('puzzle_queue_depth', "Búsquedas en espera", function=self.admission.depth)
+        REGISTRY.gauge('puzzle_workers', "Procesos de trabajo", function=lambda: self.workers)
+        REGISTRY.gauge('puzzle_workers_busy', "Procesos de trabajo ocupados", function=self.admission.running)
+        REGISTRY.gauge(
+            'puzzle_worker_utilization', "Fracción de procesos de trabajo ocupados",
+            function=lambda: self.admission.running() / self.workers
+        )
+    
+    def close(self):
+        """Detiene los procesos de trabajo."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _parse_boards(self, payload):
+        """Lee 'state' y 'goal' de la petición y comprueba que haya solución."""
+        if 'state' not in payload:
+            raise ValueError("Falta el campo 'state'")
+        board = parse_board(payload['state'])
+        goal = parse_board(payload['goal']) if payload.get('goal') is not None else GOAL_BOARD
+        if not is_solvable(board, goal):
+            raise ValueError("El estado no tiene solución para el objetivo indicado")
+        return board, goal
+    
+    def _time_limit(self, payload):
+        """Límite de tiempo de la petición, acotado a MAX_TIME_LIMIT."""
+        value = payload.get('timeout', self.default_time_limit)
+        try:
+            if isinstance(value, bool):
+                raise TypeError
+            value = float(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"'timeout' inválido: {value!r}")
+        if not math.isfinite(value):
+            raise ValueError("'timeout' debe ser un número finito")
+        if value <= 0:
+            raise ValueError("'timeout' debe ser positivo")
+        return min(value, MAX_TIME_LIMIT)
+    
+    def _depth_limit(self, payload):
+        """Límite de profundidad para "DFS Limitada"."""
+        try:
+            value = int(payload.get('depth_limit', DEFAULT_DEPTH_LIMIT))
+        except (TypeError, ValueError, OverflowError):
+            raise ValueError("'depth_limit' debe ser un entero")
+        if value < 0:
+            raise ValueError("'depth_limit' no puede ser negativo")
+        return value
+    
+    def _submit(self, engine, func, *args):
+        """
+        Encola func(*args) en la cola de admisión.
+        
+        Returns:
+            Future (el resultado se recoge con _result)
+        """
+        try:
+            return self.admission.submit(engine, func, *args)
+        except QueueFull as e:
+            raise ServiceError(503, str(e), retry_after=RETRY_AFTER_SECONDS)
+    
+    def _start_search(self, board, goal, engine, depth_limit, time_limit):
+        """
+        Inicia una búsqueda o se une a una idéntica que ya esté en curso.
+        
+        La clave es (tablero, objetivo, motor) más el límite de profundidad
+        en "DFS Limitada", el único parámetro que cambia la solución. El límite
+        de tiempo no forma parte de la clave: quien se une a una búsqueda en
+        curso recibe el resultado obtenido con el límite de quien la inició.
+        
+        Returns:
+            Tupla (clave, Future) para _result()
+        """
+        key = (board, goal, engine, depth_limit if engine == "DFS Limitada" else None)
+        
+        def start():
+            future = self._submit(engine, solve_board, board, goal, engine, depth_limit, time_limit)
+            # Una sola vez por ejecución, no por petición agrupada
+            future.add_done_callback(self._record_search)
+            return future
+        
+        return key, self.flights.join(key, start)
+    
+    def _record_search(self, future):
+        """Registra en las métricas del proceso una búsqueda hecha en un proceso de trabajo."""
+        if not future.cancelled() and future.exception() is None:
+            result = future.result()
+            record_search(result['engine'], result)
+    
+    def _result(self, search, time_limit):
+        """
+        Espera el resultado de una búsqueda con margen sobre su límite de tiempo.
+        
+        Args:
+            search: Tupla (clave, Future) devuelta por _start_search()
+            time_limit: Límite de tiempo de la búsqueda en segundos
+        """
+        _, future = search
+        try:
+            return future.result(timeout=time_limit + RESULT_GRACE)
+        except FutureTimeoutError:
+            raise ServiceError(504, "La búsqueda no terminó a tiempo")
+        except BrokenProcessPool:
+            raise ServiceError(503, "Los procesos de trabajo no están disponibles")
+        except CancelledError:
+            raise ServiceError(503, "La búsqueda se canceló; vuelve a intentarlo",
+                               retry_after=RETRY_AFTER_SECONDS)
+        finally:
+            self._release(search)
+    
+    def _release(self, search):
+        """
+        Deja de esperar una búsqueda; si nadie más la espera y aún no empezó,
+        SingleFlight.leave() la retira de la cola.
+        
+        Args:
+            search: Tupla (clave, Future) devuelta por _start_search()
+        """
+        self.flights.leave(*search)
+    
+    def solve(self, payload):
+        """
+        Resuelve un tablero con un algoritmo.
+        
+        Con carga, BFS y DFS Limitada se resuelven con un motor barato (ver
+        AdmissionQueue.choose_engine) salvo que la petición incluya
+        "degrade": false.
+        
+        Args:
+            payload: dict con state, algorithm (por defecto A*), goal, timeout,
+                depth_limit y degrade opcionales
+        
+        Returns:
+            dict con state, goal, algorithm (pedido), el resultado de
+            service.engine.solve_board() (con 'engine', el motor que resolvió),
+            degraded y degraded_reason
+        """
+        board, goal = self._parse_boards(payload)
+        algorithm = parse_algorithm(payload.get('algorithm', "A* Manhattan"))
+        time_limit = self._time_limit(payload)
+        
+        engine, reason = algorithm, None
+        if payload.get('degrade', True):
+            # Los procesos solo tienen precalculada la tabla del objetivo por defecto
+            engine, reason = self.admission.choose_engine(algorithm, table_available=goal == GOAL_BOARD)
+        
+        search = self._start_search(board, goal, engine, self._depth_limit(payload), time_limit)
+        result = self._result(search, time_limit)
+        return {
+            'state': format_state(board),
+            'goal': format_state(goal),
+            'algorithm': algorithm,
+            **result,
+            'degraded': reason is not None,
+            'degraded_reason': reason
+        }
+    
+    def compare(self, payload):
+        """
+        Resuelve un tablero con varios algoritmos en paralelo.
+        
+        Args:
+            payload: dict con state, algorithms (por defecto todos) y los
+                campos opcionales de solve()
+        
+        Returns:
+            dict con state, goal y 'results' (uno por algoritmo, en el orden de
+            ALGORITHMS). Aquí no se degrada: comparar es el objetivo de la petición.
+        """
+        board, goal = self._parse_boards(payload)
+        names = payload.get('algorithms') or list(ALGORITHMS)
+        if not isinstance(names, list):
+            raise ValueError("'algorithms' debe ser una lista")
+        algorithms = [algo for algo in ALGORITHMS if algo in {parse_algorithm(name) for name in names}]
+        time_limit = self._time_limit(payload)
+        depth_limit = self._depth_limit(payload)
+        
+        searches = []
+        results = []
+        collected = 0
+        try:
+            for algo in algorithms:
+                searches.append(self._start_search(board, goal, algo, depth_limit, time_limit))
+            for algo, search in zip(algorithms, searches):
+                # _result() suelta la búsqueda aunque falle
+                collected += 1
+                results.append({'algorithm': algo, **self._result(search, time_limit)})
+        finally:
+            # Ante un error (QueueFull, tiempo agotado...) soltar las búsquedas
+            # iniciadas que no llegaron a recogerse, para poder cancelarlas
+            for search in searches[collected:]:
+                self._release(search)
+        return {
+            'state': format_state(board),
+            'goal': format_state(goal),
+            'results': results
+        }
+    
+    def validate(self, payload):
+        """
+        Valida un tablero y, opcionalmente, una secuencia de movimientos.
+        
+        A diferencia de solve(), un tablero sin solución no es un error: se
+        informa en 'solvable'.
+        
+        Args:
+            payload: dict con state, goal y moves opcionales
+        
+        Returns:
+            dict de service.engine.validate_board()
+        """
+        if 'state' not in payload:
+            raise ValueError("Falta el campo 'state'")
+        board = parse_board(payload['state'])
+        goal = parse_board(payload['goal']) if payload.get('goal') is not None else GOAL_BOARD
+        moves = payload.get('moves')
+        if moves is not None and not isinstance(moves, str):
+            raise ValueError("'moves' debe ser una cadena como \"RDLU\"")
+        return validate_board(board, goal, moves)
+    
+    def shuffle(self, payload):
+        """
+        Genera un tablero aleatorio resoluble.
+        
+        Args:
+            payload: dict con moves (movimientos aleatorios, por defecto 30),
+                seed y goal opcionales. Con uniform (true) el tablero se elige
+                de forma uniforme entre todos los resolubles, y con distance
+                entre los que están a esa distancia óptima (solo con el
+                objetivo por defecto, cuya tabla de distancias ya existe).
+        
+        Returns:
+            dict con state y goal
+        """
+        goal = parse_board(payload['goal']) if payload.get('goal') is not None else GOAL_BOARD
+        try:
+            num_moves = int(payload.get('moves', 30))
+            seed = int(payload['seed']) if payload.get('seed') is not None else None
+            distance = int(payload['distance']) if payload.get('distance') is not None else None
+        except (TypeError, ValueError):
+            raise ValueError("'moves', 'seed' y 'distance' deben ser enteros")
+        # En GET los parámetros llegan como texto
+        uniform = payload.get('uniform') in (True, 'true', '1')
+        
+        if distance is not None:
+            if goal != GOAL_BOARD:
+                raise ValueError("'distance' solo se admite con el objetivo por defecto")
+            board = uniform_board(goal, distance, seed)
+        elif uniform:
+            board = uniform_board(goal, seed=seed)
+        else:
+            if not 0 <= num_moves <= MAX_SHUFFLE_MOVES:
+                raise ValueError(f"'moves' debe estar entre 0 y {MAX_SHUFFLE_MOVES}")
+            board = shuffle_board(goal, num_moves, seed)
+        return {'state': format_state(board), 'goal': format_state(goal)}
+    
+    def health(self):
+        """Estado básico del servicio y agrupación de búsquedas idénticas."""
+        return {
+            'status': 'ok',
+            'workers': self.workers,
+            'algorithms': list(ALGORITHMS),
+            'singleflight': self.flights.stats(),
+            'admission': self.admission.stats()
+        }
+
+
+class ServiceHandler(BaseHTTPRequestHandler):
+    """Traduce las peticiones HTTP a llamadas de SolveService."""
+    server_version = "8PuzzleService/1.0"
+    
+    # Rutas POST -> método de SolveService
+    POST_ROUTES = {
+        '/api/solve': 'solve',
+        '/api/compare': 'compare',
+        '/api/validate': 'validate',
+        '/api/shuffle': 'shuffle',
+    }
+    
+    def do_GET(self):
+        """Atiende el cliente web, /health, /metrics y GET /api/shuffle (parámetros en la URL)."""
+        url = urlsplit(self.path)
+        if url.path == '/':
+            self._send_static('index.html')
+        elif url.path.startswith('/static/'):
+            self._send_static(url.path[len('/static/'):])
+        elif url.path == '/health':
+            self._dispatch(url.path, lambda: self.server.service.health())
+        elif url.path == '/metrics':
+            self._send_metrics()
+        elif url.path == '/api/shuffle':
+            params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            self._dispatch(url.path, lambda: self.server.service.shuffle(params))
+        else:
+            self._send_json(404, {'error': f"Ruta desconocida: {url.path}"})
+    
+    def do_POST(self):
+        """Atiende las rutas de POST_ROUTES con un cuerpo JSON."""
+        path = urlsplit(self.path).path
+        method = self.POST_ROUTES.get(path)
+        if method is None:
+            self._send_json(404, {'error': f"Ruta desconocida: {path}"})
+            return
+        self._dispatch(path, lambda: getattr(self.server.service, method)(self._read_json()))
+    
+    def _read_json(self):
+        """Lee y decodifica el cuerpo JSON de la petición."""
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > MAX_BODY_BYTES:
+            raise ServiceError(413, "Petición demasiado grande")
+        body = self.rfile.read(length) if length else b'{}'
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            raise ValueError("El cuerpo de la petición no es JSON válido")
+        if not isinstance(payload, dict):
+            raise ValueError("El cuerpo de la petición debe ser un objeto JSON")
+        return payload
+    
+    def _dispatch(self, route, handler):
+        """
+        Ejecuta el manejador y convierte las excepciones en respuestas de error.
+        
+        Args:
+            route: Ruta atendida (etiqueta de las métricas HTTP)
+            handler: Función sin argumentos que devuelve el cuerpo de la respuesta
+        """
+        start = time.perf_counter()
+        status = 200
+        try:
+            self._send_json(200, handler())
+        except ServiceError as e:
+            status = e.status
+            headers = {'Retry-After': str(e.retry_after)} if e.retry_after else None
+            self._send_json(e.status, {'error': str(e)}, headers)
+        except ValueError as e:
+            status = 400
+            self._send_json(400, {'error': str(e)})
+        except Exception:
+            # Un fallo inesperado no debe dejar al cliente sin respuesta
+            status = 500
+            sys.stderr.write(f"Error interno en {route}:\n{traceback.format_exc()}")
+            try:
+                self._send_json(500, {'error': "Error interno del servidor"})
+            except OSError:
+                pass  # El cliente ya cerró la conexión
+        finally:
+            HTTP_REQUESTS.inc(route, status)
+            HTTP_SECONDS.observe(time.perf_counter() - start, route)
+    
+    def _send_metrics(self):
+        """Envía las métricas del proceso en formato de texto de Prometheus."""
+        body = REGISTRY.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def _send_json(self, status, data, headers=None):
+        """Envía una respuesta JSON con cabeceras adicionales opcionales."""
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def _send_static(self, name):
+        """Envía un archivo de STATIC_DIR (solo archivos de primer nivel)."""
+        path = os.path.normpath(os.path.join(STATIC_DIR, name))
+        content_type = CONTENT_TYPES.get(os.path.splitext(path)[1])
+        if os.path.dirname(path) != STATIC_DIR or content_type is None or not os.path.isfile(path):
+            self._send_json(404, {'error': f"Archivo no encontrado: {name}"})
+            return
+        
+        with open(path, 'rb') as f:
+            body = f.read()
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'max-age=300')
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        """Registra las peticiones solo en modo detallado."""
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def make_server(host=DEFAULT_HOST, port=DEFAULT_PORT, service=None, verbose=False):
+    """
+    Crea el servidor HTTP (sin arrancarlo).
+    
+    Args:
+        host: Dirección de escucha
+        port: Puerto (0 = uno libre cualquiera)
+        service: SolveService a usar (por defecto, uno nuevo)
+        verbose: Si es True, registra cada petición en stderr
+    
+    Returns:
+        ThreadingHTTPServer con el atributo 'service'
+    """
+    server = ThreadingHTTPServer((host, port), ServiceHandler)
+    server.daemon_threads = True
+    server.service = service or SolveService()
+    server.verbose = verbose
+    return server
+
+
+def build_parser():
+    """Crea el parser de argumentos de la línea de comandos."""
+    parser = argparse.ArgumentParser(
+        prog="python -m service.server",
+        description="Servicio HTTP/JSON de resolución del 8-puzzle."
+    )
+    parser.add_argument('--host', default=DEFAULT_HOST, help="Dirección de escucha")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help="Puerto de escucha")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Procesos de trabajo para las búsquedas (por defecto, número de CPU)")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIME_LIMIT,
+                        help="Tiempo máximo por búsqueda en segundos si la petición no lo indica")
+    parser.add_argument('--max-queue', type=int, default=DEFAULT_MAX_QUEUE,
+                        help="Búsquedas en espera a partir de las que se rechazan peticiones (503)")
+    parser.add_argument('--degrade-depth', type=int, default=None,
+                        help="Búsquedas en espera a partir de las que BFS y DFS Limitada se degradan "
+                             "(por defecto, el número de procesos)")
+    parser.add_argument('--verbose', action='store_true', help="Registra cada petición")
+    return parser
+
+
+def main(argv=None):
+    """
+    Punto de entrada de la línea de comandos.
+    
+    Args:
+        argv: Lista de argumentos (por defecto, sys.argv[1:])
+    
+    Returns:
+        int: Código de salida
+    """
+    args = build_parser().parse_args(argv)
+    service = SolveService(
+        workers=args.workers,
+        default_time_limit=args.timeout,
+        max_queue=args.max_queue,
+        degrade_depth=args.degrade_depth
+    )
+    server = make_server(args.host, args.port, service, verbose=args.verbose)
+    print(f"Servicio escuchando en http://{args.host}:{server.server_address[1]} "
+          f"({service.workers} procesos de trabajo)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
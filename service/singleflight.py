@@ -0,0 +1,103 @@
+import threading
+
+from utils.telemetry import record_cache
+
+
+class SingleFlight:
+    """
+    Agrupa peticiones idénticas en curso en una sola ejecución.
+    
+    La primera petición con una clave (el líder) lanza la ejecución; las que
+    llegan con la misma clave mientras no ha terminado reciben el mismo Future
+    en lugar de lanzar otra. Cuando termina, la clave se olvida: no es una
+    caché, una petición posterior vuelve a ejecutarse.
+    """
+    def __init__(self):
+        # RLock: add_done_callback llama a la función en el acto si el Future ya terminó
+        self._lock = threading.RLock()
+        
+        # Clave -> [Future, peticiones esperando]
+        self._flights = {}
+        
+        # Contadores para medir el ahorro
+        self.requests = 0
+        self.executions = 0
+        self.coalesced = 0
+    
+    def join(self, key, start):
+        """
+        Se une a la ejecución en curso de una clave o la inicia.
+        
+        Cada llamada debe ir seguida de leave() cuando se deje de esperar.
+        
+        Args:
+            key: Clave hashable que identifica el cálculo
+            start: Función sin argumentos que inicia el cálculo y devuelve un Future
+        
+        Returns:
+            Future compartido por todas las peticiones con la misma clave
+        """
+        with self._lock:
+            self.requests += 1
+            flight = self._flights.get(key)
+            if flight is None:
+                future = start()
+                flight = [future, 0]
+                self._flights[key] = flight
+                self.executions += 1
+                future.add_done_callback(lambda done: self._forget(key, done))
+                record_cache('singleflight', False)
+            else:
+                self.coalesced += 1
+                record_cache('singleflight', True)
+            flight[1] += 1
+            return flight[0]
+    
+    def leave(self, key, future):
+        """
+        Indica que una petición dejó de esperar el resultado.
+        
+        Si era la última petición y el cálculo aún no empezó, se cancela y se
+        olvida la clave sin soltar el cerrojo, de modo que ninguna petición
+        nueva puede unirse a un Future que está a punto de cancelarse.
+        
+        Args:
+            key: Clave usada en join()
+            future: Future devuelto por join()
+        
+        Returns:
+            bool: True si el cálculo se canceló
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None or flight[0] is not future:
+                return False
+            flight[1] -= 1
+            if flight[1] > 0 or not future.cancel():
+                return False  # Otros esperan, o ya está en marcha o terminado
+            self._flights.pop(key, None)
+            return True
+    
+    def _forget(self, key, future):
+        """Elimina la clave al terminar su cálculo."""
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None and flight[0] is future:
+                del self._flights[key]
+    
+    def stats(self):
+        """
+        Resumen de la agrupación.
+        
+        Returns:
+            dict con requests, executions, coalesced, in_flight y
+            coalescing_ratio (fracción de peticiones servidas sin ejecutar)
+        """
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'executions': self.executions,
+                'coalesced': self.coalesced,
+                'in_flight': len(self._flights),
+                'coalescing_ratio': self.coalesced / self.requests if self.requests else 0.0
+            }
\ No newline at end of file
@@ -0,0 +1,486 @@
+// Cliente del 8-puzzle en el navegador: dibuja el tablero localmente y usa el
+// servicio JSON (service/server.py) solo para aleatorizar, validar y resolver.
+// Reproduce los modos manual (ui/manual_mode.py) y automático (ui/auto_mode.py).
+'use strict';
+
+// Lado del tablero y estado objetivo
+const SIZE = 3;
+const GOAL = [1, 2, 3, 4, 5, 6, 7, 8, 0];
+
+// Desplazamiento del espacio vacío para cada código de movimiento y su inverso
+const DELTAS = { U: -SIZE, D: SIZE, L: -1, R: 1 };
+const INVERSE = { U: 'D', D: 'U', L: 'R', R: 'L' };
+
+// Movimientos aleatorios al aleatorizar en cada modo (los mismos que en Tkinter)
+const SHUFFLE_MOVES = { manual: 100, auto: 30 };
+
+const $ = (id) => document.getElementById(id);
+
+
+// Tablero: una celda por casilla; al dibujar solo se tocan las que cambiaron
+class BoardView {
+  constructor(element, onClick) {
+    this.element = element;
+    this.element.style.gridTemplateColumns = `repeat(${SIZE}, auto)`;
+    this.cells = [];
+    this.values = [];
+    for (let pos = 0; pos < SIZE * SIZE; pos++) {
+      const cell = document.createElement('div');
+      cell.className = 'tile';
+      cell.addEventListener('click', () => onClick(pos));
+      this.element.appendChild(cell);
+      this.cells.push(cell);
+      this.values.push(null);
+    }
+  }
+
+  render(board) {
+    for (let pos = 0; pos < board.length; pos++) {
+      const value = board[pos];
+      if (this.values[pos] === value) continue;
+      this.cells[pos].textContent = value === 0 ? '' : String(value);
+      this.cells[pos].classList.toggle('empty', value === 0);
+      this.values[pos] = value;
+    }
+  }
+
+  setClickable(clickable) {
+    this.element.classList.toggle('clickable', clickable);
+  }
+}
+
+
+// Posiciones vecinas del espacio vacío, o -1 si el movimiento sale del tablero
+function neighbor(blank, code) {
+  const row = Math.floor(blank / SIZE);
+  const col = blank % SIZE;
+  if (code === 'U' && row === 0) return -1;
+  if (code === 'D' && row === SIZE - 1) return -1;
+  if (code === 'L' && col === 0) return -1;
+  if (code === 'R' && col === SIZE - 1) return -1;
+  return blank + DELTAS[code];
+}
+
+
+// Reproducción de una cadena de movimientos sobre una copia del tablero
+// (mismo esquema que models/playback.py: un intercambio por paso)
+class Playback {
+  constructor(board, moves) {
+    this.initial = board.slice();
+    this.board = board.slice();
+    this.blank = board.indexOf(0);
+    this.moves = moves;
+    this.position = 0;
+  }
+
+  get length() {
+    return this.moves.length;
+  }
+
+  atEnd() {
+    return this.position >= this.moves.length;
+  }
+
+  swap(code) {
+    const target = neighbor(this.blank, code);
+    if (target < 0) throw new Error(`Movimiento ilegal '${code}'`);
+    this.board[this.blank] = this.board[target];
+    this.board[target] = 0;
+    this.blank = target;
+  }
+
+  step(count) {
+    const end = Math.min(this.position + count, this.moves.length);
+    for (let i = this.position; i < end; i++) this.swap(this.moves[i]);
+    this.position = end;
+  }
+
+  back(count) {
+    const start = Math.max(this.position - count, 0);
+    for (let i = this.position - 1; i >= start; i--) this.swap(INVERSE[this.moves[i]]);
+    this.position = start;
+  }
+
+  seek(step) {
+    step = Math.max(0, Math.min(step, this.moves.length));
+    // Partir del inicio si está más cerca que la posición actual
+    if (step < Math.abs(step - this.position)) {
+      this.board = this.initial.slice();
+      this.blank = this.board.indexOf(0);
+      this.position = 0;
+    }
+    if (step > this.position) this.step(step - this.position);
+    else this.back(this.position - step);
+  }
+}
+
+
+// Llamada al servicio JSON; lanza un Error con el mensaje del servidor
+async function api(path, payload) {
+  const response = await fetch(path, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify(payload || {})
+  });
+  const data = await response.json();
+  if (!response.ok) throw new Error(data.error || `Error ${response.status}`);
+  return data;
+}
+
+const parseBoard = (text) => text.split(',').map(Number);
+const formatBoard = (board) => board.join(',');
+const isGoal = (board) => board.every((value, i) => value === GOAL[i]);
+
+
+// Estado de la aplicación (el tablero se comparte entre los dos modos, como en main.py)
+const app = {
+  mode: 'manual',
+  board: GOAL.slice(),
+  movesCount: 0,
+  results: {},
+  recommended: null,
+  playback: null,
+  animating: false,
+  frameRequest: null,
+  stepBudget: 0,
+  lastFrameTime: 0
+};
+
+const view = new BoardView($('board'), handleTileClick);
+
+
+function setMessage(text, color) {
+  $('message').textContent = text;
+  $('message').style.color = color || 'black';
+}
+
+function setStatus(text) {
+  $('status').textContent = `Estado: ${text}`;
+}
+
+function updateBoard() {
+  view.render(app.board);
+  $('moves-label').textContent = `Movimientos: ${app.movesCount}`;
+}
+
+function setBoard(board) {
+  app.board = board.slice();
+  app.movesCount = 0;
+  clearResults();
+  updateBoard();
+}
+
+function setButtonsDisabled(disabled, except) {
+  for (const button of document.querySelectorAll('.controls button, nav button')) {
+    if (button !== except) button.disabled = disabled;
+  }
+}
+
+
+// ---------------- Modo manual ----------------
+
+function handleTileClick(pos) {
+  if (app.mode !== 'manual') return;
+  const blank = app.board.indexOf(0);
+  const sameRow = Math.floor(pos / SIZE) === Math.floor(blank / SIZE);
+  const sameCol = pos % SIZE === blank % SIZE;
+  // Solo se mueven las fichas adyacentes al espacio vacío
+  if (!((sameRow && Math.abs(pos - blank) === 1) || (sameCol && Math.abs(pos - blank) === SIZE))) return;
+
+  app.board[blank] = app.board[pos];
+  app.board[pos] = 0;
+  app.movesCount++;
+  updateBoard();
+
+  if (isGoal(app.board)) {
+    setMessage('¡Puzzle resuelto!', 'green');
+    setTimeout(() => alert('¡Has resuelto el puzzle!'), 0);
+  }
+}
+
+async function shuffleBoard() {
+  stopAnimation();
+  try {
+    const data = await api('/api/shuffle', { moves: SHUFFLE_MOVES[app.mode] });
+    setBoard(parseBoard(data.state));
+    setMessage('Tablero aleatorizado');
+    setStatus('Listo');
+  } catch (error) {
+    setMessage(error.message, 'red');
+  }
+}
+
+async function setCustomState() {
+  stopAnimation();
+  const text = prompt('Ingrese los números del 0 al 8 (0 es el espacio vacío)', '1,2,3,4,5,6,7,8,0');
+  if (text === null) return;
+  try {
+    const data = await api('/api/validate', { state: text });
+    if (!data.solvable) {
+      alert('El estado ingresado no tiene solución.');
+      return;
+    }
+    setBoard(parseBoard(data.state));
+    setMessage('Estado configurado manualmente');
+    setStatus('Listo');
+  } catch (error) {
+    alert(error.message);
+  }
+}
+
+
+// ---------------- Modo automático ----------------
+
+function clearResults() {
+  stopAnimation();
+  app.results = {};
+  app.recommended = null;
+  loadSolution('');
+  $('results-body').innerHTML = '';
+  $('recommendation').textContent = 'Ejecute algoritmos para obtener una recomendación';
+  $('recommendation').style.color = 'black';
+}
+
+function loadSolution(moves) {
+  app.playback = moves ? new Playback(app.board, moves) : null;
+  $('seek').max = moves.length;
+  $('seek').value = 0;
+}
+
+async function solve() {
+  stopAnimation();
+  syncBoard();
+  const algorithm = $('algorithm').value;
+  setButtonsDisabled(true);
+  setMessage('Resolviendo...', 'blue');
+  setStatus('Calculando solución');
+  try {
+    const result = await api('/api/solve', { state: formatBoard(app.board), algorithm });
+    // Con el servidor cargado la solución puede venir de otro motor: no cuenta para la comparación
+    if (!result.degraded) app.results[algorithm] = result;
+    if (result.success) {
+      loadSolution(result.moves);
+      const engine = result.degraded ? `${result.engine} (${result.degraded_reason})` : algorithm;
+      setMessage(`Solución encontrada con ${engine}. Longitud: ${result.path_length}`, 'green');
+      setStatus(`Solución lista (Pasos: ${result.path_length})`);
+    } else {
+      loadSolution('');
+      setMessage(`No se encontró solución con ${algorithm}` + (result.timed_out ? ' (tiempo agotado)' : ''), 'red');
+      setStatus('Sin solución');
+    }
+    if (Object.keys(app.results).length > 1) recommendAlgorithm();
+    updateResultsTable();
+  } catch (error) {
+    setMessage(`Error en la resolución: ${error.message}`, 'red');
+  } finally {
+    setButtonsDisabled(false);
+  }
+}
+
+async function compareAll() {
+  stopAnimation();
+  syncBoard();
+  setButtonsDisabled(true);
+  setMessage('Comparando algoritmos...', 'blue');
+  setStatus('Ejecutando comparación');
+  try {
+    const data = await api('/api/compare', { state: formatBoard(app.board) });
+    app.results = {};
+    for (const result of data.results) app.results[result.algorithm] = result;
+
+    // Conservar la solución actual o usar la primera encontrada
+    const solved = data.results.find((result) => result.success);
+    if (!app.playback && solved) loadSolution(solved.moves);
+
+    recommendAlgorithm();
+    updateResultsTable();
+    if (app.playback) {
+      setMessage("Comparación completada. Use 'Mostrar Solución' para ver el resultado.", 'green');
+      setStatus(`Solución lista (Pasos: ${app.playback.length})`);
+    } else {
+      setMessage('Ningún algoritmo encontró solución.', 'red');
+      setStatus('Sin solución');
+    }
+  } catch (error) {
+    setMessage(`Error en la comparación: ${error.message}`, 'red');
+  } finally {
+    setButtonsDisabled(false);
+  }
+}
+
+// Misma puntuación que AutoModeUI.recommend_algorithm: 50% longitud, 30% tiempo, 20% nodos
+function recommendAlgorithm() {
+  const successful = Object.values(app.results).filter((result) => result.success);
+  if (!successful.length) {
+    $('recommendation').textContent = 'No se pudo encontrar una solución con ningún algoritmo.';
+    $('recommendation').style.color = 'red';
+    return;
+  }
+  const max = (key) => Math.max(...successful.map((result) => result[key]));
+  const maxPath = max('path_length');
+  const maxTime = max('execution_time');
+  const maxNodes = max('nodes_expanded');
+  const norm = (value, top) => (top > 0 ? value / top : 0);
+
+  let best = null;
+  let bestScore = Infinity;
+  for (const result of successful) {
+    const score = 0.5 * norm(result.path_length, maxPath) +
+      0.3 * norm(result.execution_time, maxTime) +
+      0.2 * norm(result.nodes_expanded, maxNodes);
+    if (score < bestScore) {
+      best = result.algorithm;
+      bestScore = score;
+    }
+  }
+  app.recommended = best;
+  $('recommendation').textContent = `Recomendado: ${best}. Mejor equilibrio entre tiempo de ejecución, ` +
+    'memoria utilizada y calidad de la solución.';
+  $('recommendation').style.color = 'green';
+}
+
+function updateResultsTable() {
+  const body = $('results-body');
+  body.innerHTML = '';
+  for (const [algorithm, result] of Object.entries(app.results)) {
+    const row = body.insertRow();
+    const values = result.success
+      ? [algorithm, result.execution_time.toFixed(6), result.nodes_expanded, result.path_length]
+      : [algorithm, 'N/A', 'N/A', 'Sin solución'];
+    for (const value of values) row.insertCell().textContent = value;
+    if (algorithm === app.recommended) row.className = 'recommended';
+  }
+}
+
+
+// ---------------- Animación ----------------
+
+function stepsPerSecond() {
+  return Math.pow(10, Number($('speed').value));
+}
+
+function updateSpeedLabel() {
+  const rate = stepsPerSecond();
+  $('speed-label').textContent = `${rate < 10 ? rate.toFixed(1) : rate.toFixed(0)} pasos/s`;
+}
+
+// Copia al tablero compartido la posición mostrada por la reproducción
+function syncBoard() {
+  if (app.playback) app.board = app.playback.board.slice();
+}
+
+function showPlayback() {
+  view.render(app.playback.board);
+  $('seek').value = app.playback.position;
+}
+
+function toggleAnimation() {
+  if (!app.playback) {
+    alert('No hay solución para mostrar');
+    return;
+  }
+  if (app.animating) {
+    stopAnimation();
+    setStatus(`Pausa (${app.playback.position}/${app.playback.length})`);
+    return;
+  }
+  // Si la solución ya se mostró entera, volver a empezar
+  if (app.playback.atEnd()) {
+    app.playback.seek(0);
+    showPlayback();
+  }
+  app.animating = true;
+  $('animate').textContent = 'Detener';
+  setButtonsDisabled(true, $('animate'));
+  // El primer paso se muestra de inmediato
+  app.stepBudget = 1;
+  app.lastFrameTime = performance.now();
+  app.frameRequest = requestAnimationFrame(animateFrame);
+}
+
+// En cada fotograma se aplican los pasos que tocan según la velocidad y se dibuja solo el resultado
+function animateFrame(now) {
+  app.stepBudget += Math.max(0, now - app.lastFrameTime) / 1000 * stepsPerSecond();
+  app.lastFrameTime = now;
+  const steps = Math.floor(app.stepBudget);
+  if (steps > 0) {
+    app.stepBudget -= steps;
+    app.playback.step(steps);
+    showPlayback();
+    setStatus(`Animando solución (${app.playback.position}/${app.playback.length})`);
+  }
+  if (app.playback.atEnd()) {
+    stopAnimation();
+    setMessage('Solución completada', 'green');
+    setStatus('Completado');
+    return;
+  }
+  app.frameRequest = requestAnimationFrame(animateFrame);
+}
+
+function stopAnimation() {
+  if (app.frameRequest !== null) cancelAnimationFrame(app.frameRequest);
+  app.frameRequest = null;
+  if (app.animating) {
+    app.animating = false;
+    $('animate').textContent = 'Mostrar Solución';
+    setButtonsDisabled(false);
+  }
+}
+
+function seek(step) {
+  if (!app.playback) return;
+  app.playback.seek(step);
+  showPlayback();
+  setStatus(`Paso ${app.playback.position}/${app.playback.length}`);
+}
+
+
+// ---------------- Cambio de modo ----------------
+
+function switchMode(mode) {
+  stopAnimation();
+  syncBoard();
+  app.mode = mode;
+  clearResults();
+  for (const tab of document.querySelectorAll('.tab')) tab.classList.toggle('active', tab.dataset.mode === mode);
+  $('manual-controls').classList.toggle('hidden', mode !== 'manual');
+  $('auto-controls').classList.toggle('hidden', mode !== 'auto');
+  $('results').classList.toggle('hidden', mode !== 'auto');
+  $('moves-label').classList.toggle('hidden', mode !== 'manual');
+  view.setClickable(mode === 'manual');
+  setMessage('');
+  setStatus('Listo');
+  updateBoard();
+}
+
+
+// ---------------- Eventos ----------------
+
+$('tab-manual').addEventListener('click', () => switchMode('manual'));
+$('tab-auto').addEventListener('click', () => switchMode('auto'));
+
+$('reset').addEventListener('click', () => {
+  setBoard(GOAL);
+  setMessage('Juego reiniciado');
+});
+$('shuffle').addEventListener('click', shuffleBoard);
+$('verify').addEventListener('click', () => {
+  const solved = isGoal(app.board);
+  alert(solved ? '¡El puzzle está resuelto!' : 'El puzzle aún no está resuelto');
+  setMessage(solved ? '¡Puzzle resuelto!' : 'Aún no está resuelto', solved ? 'green' : 'red');
+});
+$('custom').addEventListener('click', setCustomState);
+
+$('auto-shuffle').addEventListener('click', shuffleBoard);
+$('auto-custom').addEventListener('click', setCustomState);
+$('solve').addEventListener('click', solve);
+$('compare').addEventListener('click', compareAll);
+$('animate').addEventListener('click', toggleAnimation);
+$('speed').addEventListener('input', updateSpeedLabel);
+$('seek').addEventListener('input', () => seek(Number($('seek').value)));
+$('seek-start').addEventListener('click', () => seek(0));
+$('seek-end').addEventListener('click', () => seek(app.playback ? app.playback.length : 0));
+
+updateSpeedLabel();
+switchMode('manual');
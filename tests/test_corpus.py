@@ -0,0 +1,94 @@
+"""
+Pruebas del formato binario de corpus (utils.corpus).
+"""
+import os
+import tempfile
+import unittest
+
+from models.random_state import random_boards
+from utils.corpus import CorpusWriter, CorpusFile, write_corpus
+from utils.verify import verify_batch
+
+
+class CorpusRoundTripTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'corpus.8pz')
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def round_trip(self, boards, solutions=None, size=3, **kwargs):
+        """Escribe un corpus y lo vuelve a leer."""
+        self.assertEqual(write_corpus(self.path, boards, solutions, size=size, **kwargs), len(boards))
+        corpus = CorpusFile(self.path)
+        self.addCleanup(corpus.close)
+        return corpus
+    
+    def test_3x3_with_solutions(self):
+        boards = [(1, 2, 3, 4, 5, 6, 7, 0, 8), (1, 2, 3, 4, 5, 6, 0, 7, 8), (1, 2, 3, 4, 5, 6, 7, 8, 0)]
+        solutions = ["R", "RR", ""]
+        corpus = self.round_trip(boards, solutions, seed=7)
+        
+        self.assertEqual(len(corpus), 3)
+        self.assertEqual(corpus.size, 3)
+        self.assertEqual(corpus.seed, 7)
+        self.assertEqual(corpus.goal, (1, 2, 3, 4, 5, 6, 7, 8, 0))
+        self.assertEqual([corpus.board(i) for i in range(3)], boards)
+        self.assertEqual([corpus.moves(i) for i in range(3)], solutions)
+        self.assertEqual([tuple(row) for row in corpus.boards().tolist()], boards)
+        self.assertEqual(corpus[-1].tolist(), [[1, 2, 3], [4, 5, 6], [7, 8, 0]])
+        
+        # Las soluciones empaquetadas se verifican sin pasar por texto
+        report = verify_batch(corpus.boards(), corpus.move_codes())
+        self.assertTrue(report['valid'].all())
+    
+    def test_3x3_without_solutions(self):
+        boards = [tuple(row) for row in random_boards(50, seed=1).tolist()]
+        corpus = self.round_trip(boards)
+        self.assertFalse(corpus.has_solutions)
+        self.assertIsNone(corpus.seed)
+        self.assertEqual([corpus.board(i) for i in range(len(corpus))], boards)
+        with self.assertRaises(ValueError):
+            corpus.moves(0)
+    
+    def test_4x4_with_solutions(self):
+        goal = tuple(range(1, 16)) + (0,)
+        one_left = goal[:14] + (0, 15)
+        # Movimientos que no caben en un byte completo (5 movimientos = 10 bits)
+        boards = [one_left, goal, one_left]
+        solutions = ["R", None, "RLRLR"]
+        corpus = self.round_trip(boards, solutions, size=4, goal=goal)
+        
+        self.assertEqual(corpus.size, 4)
+        self.assertEqual(corpus.goal, goal)
+        self.assertEqual([corpus.board(i) for i in range(3)], boards)
+        self.assertEqual([corpus.moves(i) for i in range(3)], solutions)
+        self.assertEqual(corpus[0].shape, (4, 4))
+        
+        codes, lengths = corpus.move_codes()
+        self.assertEqual(lengths.tolist(), [1, -1, 5])
+        report = verify_batch(corpus.boards(), (codes, lengths), goal=goal)
+        self.assertEqual(report['checked'].tolist(), [True, False, True])
+        self.assertTrue(report['reached_goal'][[0, 2]].all())
+    
+    def test_invalid_moves_leave_writer_consistent(self):
+        with CorpusWriter(self.path, with_solutions=True) as writer:
+            writer.add((1, 2, 3, 4, 5, 6, 7, 0, 8), "R")
+            with self.assertRaises(ValueError):
+                writer.add((1, 2, 3, 4, 5, 6, 0, 7, 8), "RX")
+            writer.add((1, 2, 3, 4, 5, 6, 0, 7, 8), "RR")
+        
+        with CorpusFile(self.path) as corpus:
+            self.assertEqual(len(corpus), 2)
+            self.assertEqual([corpus.moves(0), corpus.moves(1)], ["R", "RR"])
+    
+    def test_rejects_other_files(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'8PZCgarbage')
+        with self.assertRaises(ValueError):
+            CorpusFile(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
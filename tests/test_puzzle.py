@@ -0,0 +1,96 @@
+"""
+Pruebas del historial de movimientos de Puzzle (deshacer y rehacer).
+"""
+import random
+import unittest
+
+from models.puzzle import Puzzle, GOAL_BOARD
+
+START = (1, 2, 3, 4, 5, 6, 0, 7, 8)
+
+
+class PuzzleHistoryTest(unittest.TestCase):
+    def test_undo_redo(self):
+        puzzle = Puzzle(START)
+        self.assertFalse(puzzle.can_undo())
+        self.assertTrue(puzzle.move('right'))
+        self.assertTrue(puzzle.move('right'))
+        self.assertTrue(puzzle.is_goal())
+        self.assertEqual(puzzle.history(), "RR")
+        
+        self.assertTrue(puzzle.undo())
+        self.assertEqual(puzzle.board, (1, 2, 3, 4, 5, 6, 7, 0, 8))
+        self.assertEqual(puzzle.moves_count, 1)
+        self.assertTrue(puzzle.can_redo())
+        
+        self.assertTrue(puzzle.undo())
+        self.assertEqual(puzzle.board, START)
+        self.assertFalse(puzzle.undo())
+        
+        self.assertTrue(puzzle.redo())
+        self.assertTrue(puzzle.redo())
+        self.assertFalse(puzzle.redo())
+        self.assertTrue(puzzle.is_goal())
+        self.assertEqual(puzzle.history(), "RR")
+    
+    def test_new_move_discards_redo(self):
+        puzzle = Puzzle(START)
+        puzzle.move('right')
+        puzzle.move('right')
+        puzzle.undo()
+        self.assertTrue(puzzle.move('up'))
+        self.assertFalse(puzzle.can_redo())
+        self.assertEqual(puzzle.history(), "RU")
+        self.assertEqual(puzzle.board, (1, 2, 3, 4, 0, 6, 7, 5, 8))
+    
+    def test_repeating_undone_move_keeps_redo(self):
+        puzzle = Puzzle(START)
+        puzzle.move('right')
+        puzzle.move('right')
+        puzzle.undo()
+        puzzle.undo()
+        self.assertTrue(puzzle.move('right'))
+        self.assertTrue(puzzle.can_redo())
+        self.assertTrue(puzzle.redo())
+        self.assertTrue(puzzle.is_goal())
+    
+    def test_illegal_moves_are_not_logged(self):
+        puzzle = Puzzle(START)
+        self.assertFalse(puzzle.move('left'))
+        self.assertFalse(puzzle.move('down'))
+        self.assertFalse(puzzle.move_tile(0, 0))
+        self.assertFalse(puzzle.can_undo())
+        self.assertTrue(puzzle.move_tile(2, 1))
+        self.assertEqual(puzzle.history(), "R")
+    
+    def test_set_state_clears_history(self):
+        puzzle = Puzzle(START)
+        puzzle.move('right')
+        puzzle.set_state(GOAL_BOARD)
+        self.assertFalse(puzzle.can_undo())
+        self.assertEqual(puzzle.moves_count, 0)
+        self.assertEqual(puzzle.history(), "")
+    
+    def test_random_walk_undoes_to_start(self):
+        rng = random.Random(0)
+        puzzle = Puzzle(START)
+        boards = [puzzle.board]
+        for _ in range(200):
+            if puzzle.move(rng.choice(puzzle.get_possible_moves())):
+                boards.append(puzzle.board)
+        
+        # Deshacer recorre los mismos tableros en orden inverso
+        for expected in reversed(boards[:-1]):
+            self.assertTrue(puzzle.undo())
+            self.assertEqual(puzzle.board, expected)
+        self.assertEqual(puzzle.state.tolist(), [[1, 2, 3], [4, 5, 6], [0, 7, 8]])
+        
+        # Y rehacer vuelve al final
+        while puzzle.redo():
+            pass
+        self.assertEqual(puzzle.board, boards[-1])
+        self.assertEqual(puzzle.moves_count, len(boards) - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+"""
+Pruebas del verificador vectorizado de soluciones (utils.verify).
+"""
+import unittest
+
+import numpy as np
+
+from utils.verify import verify_batch, count_failures, describe_failure, NO_ILLEGAL_STEP
+
+# Estados iniciales 3x3 (objetivo por defecto: 1..8 y el hueco al final)
+ONE_MOVE = (1, 2, 3, 4, 5, 6, 7, 0, 8)   # Solución óptima: "R"
+TWO_MOVES = (1, 2, 3, 4, 5, 6, 0, 7, 8)  # Solución óptima: "RR"
+
+
+class VerifyBatchTest(unittest.TestCase):
+    def verify(self, cases, oracle=None):
+        """Verifica una lista de pares (estado, movimientos)."""
+        starts = np.array([start for start, _ in cases])
+        return verify_batch(starts, [moves for _, moves in cases], oracle=oracle)
+    
+    def test_valid_solutions(self):
+        report = self.verify([(ONE_MOVE, "R"), (TWO_MOVES, "RR")], oracle=[1, 2])
+        self.assertTrue(report['valid'].all())
+        self.assertTrue(report['reached_goal'].all())
+        self.assertEqual(report['lengths'].tolist(), [1, 2])
+        self.assertEqual(count_failures(report)['valid'], 2)
+    
+    def test_illegal_move(self):
+        # El hueco en la última fila no puede bajar
+        report = self.verify([(TWO_MOVES, "RRD")])
+        self.assertFalse(report['valid'][0])
+        self.assertEqual(int(report['illegal_step'][0]), 3)
+        self.assertEqual(describe_failure(report, 0), "movimiento ilegal 'D' en el paso 3")
+    
+    def test_unknown_letter(self):
+        report = self.verify([(ONE_MOVE, "X")])
+        self.assertEqual(int(report['illegal_step'][0]), 1)
+        self.assertEqual(describe_failure(report, 0), "movimiento ilegal '?' en el paso 1")
+    
+    def test_wrong_final_state(self):
+        report = self.verify([(TWO_MOVES, "R")])
+        self.assertEqual(int(report['illegal_step'][0]), NO_ILLEGAL_STEP)
+        self.assertFalse(report['reached_goal'][0])
+        self.assertEqual(describe_failure(report, 0), "el camino no termina en el estado objetivo")
+        self.assertEqual(count_failures(report)['wrong_final'], 1)
+    
+    def test_non_optimal(self):
+        # Llega al objetivo, pero con dos movimientos de más
+        report = self.verify([(ONE_MOVE, "RLR")], oracle=[1])
+        self.assertTrue(report['reached_goal'][0])
+        self.assertTrue(report['non_optimal'][0])
+        self.assertFalse(report['valid'][0])
+        self.assertEqual(describe_failure(report, 0), "camino de 3 movimientos; el óptimo es de 1")
+    
+    def test_unknown_optimum_is_not_checked(self):
+        report = self.verify([(ONE_MOVE, "RLR")], oracle=[-1])
+        self.assertTrue(report['valid'][0])
+    
+    def test_missing_solution_is_not_checked(self):
+        report = self.verify([(ONE_MOVE, None), (ONE_MOVE, "R")])
+        self.assertEqual(report['checked'].tolist(), [False, True])
+        self.assertIsNone(describe_failure(report, 0))
+    
+    def test_mixed_batch(self):
+        cases = [(ONE_MOVE, "R"), (TWO_MOVES, "RRD"), (TWO_MOVES, "R"), (ONE_MOVE, "RLR"), (TWO_MOVES, "RR")]
+        report = self.verify(cases, oracle=[1, 2, 2, 1, 2])
+        self.assertEqual(report['valid'].tolist(), [True, False, False, False, True])
+        self.assertEqual(count_failures(report), {
+            'checked': 5, 'valid': 2, 'illegal': 1, 'wrong_final': 1, 'non_optimal': 1
+        })
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,22 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 import numpy as np
+import math
 import time
 import threading
 from models.puzzle import Puzzle
 from models.solver import PuzzleSolver
+from models.playback import Playback
 from ui.manual_mode import CustomStateDialog
+from ui.board_canvas import BoardCanvas
+from utils.telemetry import FrameTimer, UI_ACTIONS
+
+# Intervalo mínimo entre fotogramas de la animación (unos 60 por segundo)
+FRAME_INTERVAL_MS = 16
+
+# Velocidades de la animación en pasos por segundo (el control usa escala logarítmica)
+MIN_STEPS_PER_SECOND = 0.5
+MAX_STEPS_PER_SECOND = 1000
 
 class AutoModeUI:
     """
@@ -51,9 +62,16 @@ class AutoModeUI:
         
         # Estado de la solución
         self.solution_path = []
-        self.current_step = 0
+        self.playback = None  # Reproductor de la solución sobre un tablero en caché
+        self.puzzle_stale = False  # True si el puzzle no refleja aún el paso mostrado
         self.animating = False
-        self.animation_speed = tk.DoubleVar(value=0.5)  # segundos entre pasos
+        self.animation_id = None  # Llamada root.after del siguiente fotograma
+        self.step_budget = 0.0  # Pasos pendientes según el tiempo transcurrido
+        self.last_frame_time = 0.0
+        
+        # Velocidad como log10 de pasos por segundo (2 pasos/s = 0.5 s por paso)
+        self.animation_speed = tk.DoubleVar(value=math.log10(2))
+        self.seek_var = tk.DoubleVar(value=0)
         
         # Crear interfaz
         self.create_widgets()
@@ -82,20 +100,9 @@ class AutoModeUI:
         self.board_frame = tk.Frame(self.left_frame)
         self.board_frame.pack(pady=10)
         
-        # Crear botones del tablero
-        self.tile_buttons = [[None for _ in range(self.grid_size)] for _ in range(self.grid_size)]
-        
-        for row in range(self.grid_size):
-            for col in range(self.grid_size):
-                btn = tk.Button(
-                    self.board_frame, 
-                    width=3, 
-                    height=1, 
-                    font=('Arial', 24),
-                    state=tk.DISABLED  # No se pueden hacer clic en modo automático
-                )
-                btn.grid(row=row, column=col, padx=2, pady=2)
-                self.tile_buttons[row][col] = btn
+        # Tablero de solo lectura dibujado en un canvas (no se puede hacer clic en modo automático)
+        self.board = BoardCanvas(self.board_frame, grid_size=self.grid_size, tile_size=self.tile_size)
+        self.board.pack()
         
         # Frame para información y controles
         self.info_frame = tk.Frame(self.left_frame)
@@ -151,18 +158,40 @@ class AutoModeUI:
         
         self.speed_scale = ttk.Scale(
             self.speed_frame,
-            from_=0.1,
-            to=2.0,
+            from_=math.log10(MIN_STEPS_PER_SECOND),
+            to=math.log10(MAX_STEPS_PER_SECOND),
             orient=tk.HORIZONTAL,
             variable=self.animation_speed,
             length=200
         )
         self.speed_scale.pack(side=tk.LEFT, padx=5, pady=5)
         
-        self.speed_label = tk.Label(self.speed_frame, text="0.5 seg")
+        self.speed_label = tk.Label(self.speed_frame, width=12)
         self.speed_label.pack(side=tk.LEFT, padx=5)
         
         self.speed_scale.configure(command=self.update_speed_label)
+        self.update_speed_label(self.animation_speed.get())
+        
+        # Reproducción: barra para saltar a cualquier paso y botones de inicio y final
+        self.playback_frame = tk.LabelFrame(self.left_frame, text="Reproducción", padx=10, pady=5)
+        self.playback_frame.pack(pady=5, fill="x")
+        
+        self.start_button = tk.Button(self.playback_frame, text="|<", width=3, command=self.jump_to_start)
+        self.start_button.pack(side=tk.LEFT, padx=5)
+        
+        self.seek_scale = ttk.Scale(
+            self.playback_frame,
+            from_=0,
+            to=0,
+            orient=tk.HORIZONTAL,
+            variable=self.seek_var,
+            command=self.seek_solution,
+            length=180
+        )
+        self.seek_scale.pack(side=tk.LEFT, padx=5, pady=5)
+        
+        self.end_button = tk.Button(self.playback_frame, text=">|", width=3, command=self.jump_to_end)
+        self.end_button.pack(side=tk.LEFT, padx=5)
         
         # Panel derecho - Resultados
         self.results_frame = tk.LabelFrame(self.right_frame, text="Resultados", padx=10, pady=10)
@@ -203,52 +232,90 @@ class AutoModeUI:
     
     def update_board(self):
         """Actualiza el tablero con el estado actual del puzzle."""
-        for row in range(self.grid_size):
-            for col in range(self.grid_size):
-                value = self.puzzle.state[row, col]
-                
-                if value == 0:
-                    # Espacio vacío
-                    self.tile_buttons[row][col].config(text="", bg="white")
-                else:
-                    # Ficha con número
-                    self.tile_buttons[row][col].config(text=str(value), bg="lightblue")
+        self.board.render(self.puzzle.board)
     
     def update_speed_label(self, value):
         """Actualiza la etiqueta de velocidad."""
-        self.speed_label.config(text=f"{float(value):.1f} seg")
+        rate = 10 ** float(value)
+        self.speed_label.config(text=f"{rate:.1f} pasos/s" if rate < 10 else f"{rate:.0f} pasos/s")
+    
+    @property
+    def current_step(self):
+        """Paso de la solución que muestra el tablero."""
+        return self.playback.position if self.playback else 0
+    
+    def _load_solution(self, path):
+        """
+        Prepara la reproducción de una solución desde el estado actual del puzzle.
+        
+        Args:
+            path: Camino [(acción, estado), ...] de PuzzleSolver (vacío = sin solución)
+        """
+        self.solution_path = path
+        self.playback = Playback(self.puzzle.state, path) if path else None
+        self.puzzle_stale = False
+        self.seek_scale.configure(to=len(path))
+        self.seek_var.set(0)
+    
+    def _sync_puzzle(self):
+        """Copia al puzzle el paso mostrado por la reproducción, si cambió."""
+        if self.puzzle_stale:
+            self.puzzle.set_state(self.playback.state())
+            self.puzzle_stale = False
+    
+    def _show_step(self, draw):
+        """
+        Muestra la posición actual de la reproducción.
+        
+        El puzzle no se actualiza en cada paso: se sincroniza con
+        _sync_puzzle() cuando otra acción lo necesita.
+        
+        Args:
+            draw: self.board.render (dibujar ya) o self.board.schedule
+                (agrupar con otros cambios del mismo ciclo de eventos)
+        """
+        draw(self.playback.board)
+        self.seek_var.set(self.playback.position)
+        self.puzzle_stale = True
+    
+    def seek_solution(self, value):
+        """
+        Salta al paso indicado por la barra de reproducción.
+        
+        Args:
+            value: Paso de destino (la barra lo entrega como texto)
+        """
+        if self.playback is None:
+            return
+        step = int(round(float(value)))
+        if step != self.playback.position:
+            UI_ACTIONS.inc('auto', 'seek')
+            self.playback.seek(step)
+            
+            # Los eventos de arrastre de un mismo ciclo se dibujan en un solo fotograma
+            self._show_step(self.board.schedule)
+            self.status_label.config(text=f"Estado: Paso {self.current_step}/{len(self.playback)}")
+    
+    def jump_to_start(self):
+        """Vuelve al estado inicial de la solución."""
+        if self.playback is not None:
+            self.seek_solution(0)
+    
+    def jump_to_end(self):
+        """Salta al final de la solución con un único redibujado."""
+        if self.playback is not None:
+            self.seek_solution(len(self.playback))
     
     def shuffle_game(self):
         """Aleatoriza el tablero."""
         if self.animating:
             self.toggle_animation()  # Detener animación si está en curso
+        self._sync_puzzle()
         
-        self.puzzle.shuffle(num_moves=30)
-        
-        # Verificar que el estado generado tiene solución
-        if not self.puzzle.is_solvable():
-            # Si no tiene solución, mover una ficha para cambiar la paridad
-            state = self.puzzle.state.copy()
-            # Intercambiar las dos primeras fichas que no sean 0
-            idx1, idx2 = None, None
-            for i in range(3):
-                for j in range(3):
-                    if state[i, j] != 0:
-                        if idx1 is None:
-                            idx1 = (i, j)
-                        elif idx2 is None:
-                            idx2 = (i, j)
-                            break
-                if idx2 is not None:
-                    break
-            
-            # Intercambiar las fichas
-            state[idx1], state[idx2] = state[idx2], state[idx1]
-            self.puzzle.set_state(state)
+        # El estado generado siempre tiene solución
+        self.puzzle.shuffle()
         
         self.update_board()
-        self.solution_path = []
-        self.current_step = 0
         self.message_label.config(text="Tablero aleatorizado", fg="black")
         self.status_label.config(text="Estado: Listo")
         
@@ -259,6 +326,7 @@ class AutoModeUI:
         """Resuelve el puzzle con el algoritmo seleccionado."""
         if self.animating:
             self.toggle_animation()  # Detener animación si está en curso
+        self._sync_puzzle()
         
         # Deshabilitar botones durante la resolución
         self.set_buttons_state(tk.DISABLED)
@@ -268,6 +336,7 @@ class AutoModeUI:
         
         # Ejecutar algoritmo en un hilo separado para no bloquear la interfaz
         algorithm = self.selected_algorithm.get()
+        UI_ACTIONS.inc('auto', 'solve')
         threading.Thread(target=self._solve_in_thread, args=(algorithm,), daemon=True).start()
     
     def _solve_in_thread(self, algorithm):
@@ -290,7 +359,7 @@ class AutoModeUI:
             
             # Actualizar la interfaz
             self.root.after(0, self._update_after_solve, result, algorithm)
-            
+        
         except Exception as e:
             # Manejar errores
             self.root.after(0, lambda: self._show_error(f"Error en la resolución: {str(e)}"))
@@ -299,15 +368,14 @@ class AutoModeUI:
         """Actualiza la interfaz después de resolver."""
         # Actualizar la solución
         if result['success']:
-            self.solution_path = result['path']
-            self.current_step = 0
+            self._load_solution(result['path'])
             self.message_label.config(
                 text=f"Solución encontrada con {algorithm}. Longitud: {result['path_length']}",
                 fg="green"
             )
             self.status_label.config(text=f"Estado: Solución lista (Pasos: {len(self.solution_path)})")
         else:
-            self.solution_path = []
+            self._load_solution([])
             self.message_label.config(
                 text=f"No se encontró solución con {algorithm}",
                 fg="red"
@@ -339,38 +407,67 @@ class AutoModeUI:
         self.animating = not self.animating
         
         if self.animating:
+            # Si la solución ya se mostró entera, volver a empezar
+            if self.playback.at_end():
+                self.playback.seek(0)
+                self._show_step(self.board.render)
+            
             self.animate_button.config(text="Detener")
-            self.status_label.config(text=f"Estado: Animando solución ({self.current_step+1}/{len(self.solution_path)})")
+            self.status_label.config(text=f"Estado: Animando solución ({self.current_step}/{len(self.solution_path)})")
             self.set_buttons_state(tk.DISABLED, exclude=[self.animate_button])
+            
+            # El primer paso se muestra de inmediato
+            self.step_budget = 1.0
+            self.last_frame_time = time.perf_counter()
             self.animate_solution()
         else:
+            if self.animation_id is not None:
+                self.root.after_cancel(self.animation_id)
+                self.animation_id = None
             self.animate_button.config(text="Mostrar Solución")
             self.status_label.config(text=f"Estado: Pausa ({self.current_step}/{len(self.solution_path)})")
             self.set_buttons_state(tk.NORMAL)
+            self._sync_puzzle()
     
     def animate_solution(self):
-        """Anima la solución paso a paso."""
-        if not self.animating or self.current_step >= len(self.solution_path):
-            if self.current_step >= len(self.solution_path):
-                self.message_label.config(text="Solución completada", fg="green")
-                self.status_label.config(text="Estado: Completado")
-                self.animating = False
-                self.animate_button.config(text="Mostrar Solución")
-                self.set_buttons_state(tk.NORMAL)
-            return
+        """
+        Anima la solución fotograma a fotograma.
         
-        # Actualizar el estado del puzzle
-        _, state = self.solution_path[self.current_step]
-        self.puzzle.set_state(state)
-        self.update_board()
+        En cada fotograma se aplican de una vez los pasos que corresponden al
+        tiempo transcurrido según la velocidad elegida y se dibuja solo el
+        resultado: por encima de un paso por fotograma los intermedios no se
+        dibujan, y por debajo se espera justo hasta el siguiente paso.
+        """
+        self.animation_id = None
+        if not self.animating:
+            return
         
-        # Actualizar contador
-        self.current_step += 1
-        self.status_label.config(text=f"Estado: Animando solución ({self.current_step}/{len(self.solution_path)})")
+        # Pasos que tocan según el tiempo transcurrido (la fracción se acumula)
+        rate = 10 ** self.animation_speed.get()
+        now = time.perf_counter()
+        self.step_budget += (now - self.last_frame_time) * rate
+        self.last_frame_time = now
+        
+        steps = int(self.step_budget)
+        if steps:
+            self.step_budget -= steps
+            with FrameTimer('auto'):
+                self.playback.step(steps)
+                self._show_step(self.board.render)
+            self.status_label.config(text=f"Estado: Animando solución ({self.current_step}/{len(self.solution_path)})")
+        
+        if self.playback.at_end():
+            self.message_label.config(text="Solución completada", fg="green")
+            self.status_label.config(text="Estado: Completado")
+            self.animating = False
+            self.animate_button.config(text="Mostrar Solución")
+            self.set_buttons_state(tk.NORMAL)
+            self._sync_puzzle()
+            return
         
-        # Programar el siguiente paso
-        delay = int(self.animation_speed.get() * 1000)  # Convertir a milisegundos
-        self.root.after(delay, self.animate_solution)
+        # Programar el siguiente fotograma (no antes del intervalo mínimo)
+        delay = max(FRAME_INTERVAL_MS, int((1 - self.step_budget) / rate * 1000))
+        self.animation_id = self.root.after(delay, self.animate_solution)
     
     def set_buttons_state(self, state, exclude=None):
         """Establece el estado de los botones."""
@@ -391,6 +488,7 @@ class AutoModeUI:
         """Permite al usuario configurar manualmente el estado inicial."""
         if self.animating:
             self.toggle_animation()  # Detener animación si está en curso
+        self._sync_puzzle()
         
         # Crear diálogo para introducir estado personalizado
         dialog = CustomStateDialog(self.root)
@@ -410,14 +508,12 @@ class AutoModeUI:
                 # Establecer el nuevo estado
                 self.puzzle.set_state(state)
                 self.update_board()
-                self.solution_path = []
-                self.current_step = 0
                 self.message_label.config(text="Estado configurado manualmente", fg="black")
                 self.status_label.config(text="Estado: Listo")
                 
                 # Limpiar resultados
                 self.clear_results()
-                
+            
             except Exception as e:
                 messagebox.showerror("Error", f"Error al configurar el estado: {e}")
     
@@ -425,6 +521,7 @@ class AutoModeUI:
         """Ejecuta todos los algoritmos para comparar su rendimiento."""
         if self.animating:
             self.toggle_animation()  # Detener animación si está en curso
+        self._sync_puzzle()
         
         # Deshabilitar botones durante la comparación
         self.set_buttons_state(tk.DISABLED)
@@ -433,6 +530,7 @@ class AutoModeUI:
         self.root.update()
         
         # Ejecutar comparación en un hilo separado
+        UI_ACTIONS.inc('auto', 'compare')
         threading.Thread(target=self._compare_in_thread, daemon=True).start()
     
     def _compare_in_thread(self):
@@ -467,11 +565,10 @@ class AutoModeUI:
                 if result['success'] and not self.solution_path:
                     self.results = result
                     self.solution_path = result['path']
-                    self.current_step = 0
             
             # Actualizar la interfaz
             self.root.after(0, self._update_after_compare)
-            
+        
         except Exception as e:
             # Manejar errores
             self.root.after(0, lambda: self._show_error(f"Error en la comparación: {str(e)}"))
@@ -487,6 +584,10 @@ class AutoModeUI:
         # Restaurar el estado del tablero si hay una solución
         if self.solution_path:
             self.puzzle.set_state(self.puzzle.state)  # Mantener el estado actual
+            
+            # Preparar la reproducción si la solución es nueva
+            if self.playback is None:
+                self._load_solution(self.solution_path)
             self.message_label.config(text="Comparación completada. Use 'Mostrar Solución' para ver el resultado.", fg="green")
             self.status_label.config(text=f"Estado: Solución lista (Pasos: {len(self.solution_path)})")
         else:
@@ -580,8 +681,7 @@ class AutoModeUI:
         self.results = {}
         self.all_results = {}
         self.recommended_algorithm = None
-        self.solution_path = []
-        self.current_step = 0
+        self._load_solution([])
         
         # Limpiar tabla
         for item in self.results_tree.get_children():
@@ -597,6 +697,7 @@ class AutoModeUI:
         """Cambia al modo manual."""
         if self.animating:
             self.toggle_animation()  # Detener animación si está en curso
+        self._sync_puzzle()
         
         if self.return_to_menu_callback:
             # Guardar el estado actual del puzzle
@@ -0,0 +1,202 @@
+import tkinter as tk
+
+from models.encoding import flatten_board
+
+# Colores de las casillas (los mismos que usaban los botones del tablero)
+TILE_COLOR = "lightblue"
+EMPTY_COLOR = "white"
+BORDER_COLOR = "#9ab"
+HINT_COLOR = "#ffd27f"
+
+
+class BoardCanvas:
+    """
+    Tablero N×N dibujado en un único tk.Canvas.
+    
+    Cada casilla es un rectángulo y un texto del canvas. El renderizador
+    guarda los valores mostrados y, al recibir un estado nuevo, solo
+    reconfigura las casillas que cambiaron (dos por movimiento). Los estados
+    enviados con schedule() dentro de un mismo ciclo de eventos se agrupan en
+    un solo redibujado, de modo que varios pasos cuestan un único fotograma.
+    """
+    def __init__(self, parent, grid_size=3, tile_size=80, gap=4, font=('Arial', 24), on_click=None):
+        """
+        Crea el canvas y las casillas.
+        
+        Args:
+            parent: Widget contenedor
+            grid_size: Número de filas y columnas del tablero
+            tile_size: Tamaño de cada casilla en píxeles
+            gap: Separación entre casillas en píxeles
+            font: Fuente de los números
+            on_click: Función on_click(row, col) llamada al pulsar una casilla
+                (None para un tablero de solo lectura)
+        """
+        self.tile_size = tile_size
+        self.gap = gap
+        self.font = font
+        self.on_click = on_click
+        
+        self.canvas = tk.Canvas(
+            parent, highlightthickness=0, borderwidth=0,
+            cursor="hand2" if on_click else ""
+        )
+        self.canvas.bind('<Button-1>', self._handle_click)
+        
+        # Estado pendiente de dibujar (schedule) y llamada after_idle programada
+        self.pending = None
+        self.flush_id = None
+        
+        # Contadores de trabajo de dibujo (fotogramas y casillas reconfiguradas)
+        self.frames = 0
+        self.cells_updated = 0
+        
+        self.resize(grid_size)
+    
+    def pack(self, **kwargs):
+        """Coloca el canvas con pack()."""
+        self.canvas.pack(**kwargs)
+    
+    def grid(self, **kwargs):
+        """Coloca el canvas con grid()."""
+        self.canvas.grid(**kwargs)
+    
+    def resize(self, grid_size):
+        """
+        Crea las casillas para un tablero de grid_size × grid_size.
+        
+        Args:
+            grid_size: Número de filas y columnas
+        """
+        self.cancel()
+        self.canvas.delete('all')
+        self.grid_size = grid_size
+        
+        pitch = self.tile_size + self.gap
+        side = grid_size * pitch + self.gap
+        self.canvas.config(width=side, height=side)
+        
+        # Un rectángulo y un texto por casilla, indexados por posición (fila * N + columna)
+        self.rects = []
+        self.texts = []
+        for pos in range(grid_size * grid_size):
+            row, col = divmod(pos, grid_size)
+            x0 = self.gap + col * pitch
+            y0 = self.gap + row * pitch
+            self.rects.append(self.canvas.create_rectangle(
+                x0, y0, x0 + self.tile_size, y0 + self.tile_size,
+                fill=EMPTY_COLOR, outline=BORDER_COLOR
+            ))
+            self.texts.append(self.canvas.create_text(
+                x0 + self.tile_size / 2, y0 + self.tile_size / 2,
+                text="", font=self.font
+            ))
+        
+        # Valores mostrados actualmente (None = casilla aún sin dibujar)
+        self.values = [None] * (grid_size * grid_size)
+        
+        # Casillas resaltadas (pistas del modo manual)
+        self.highlighted = set()
+    
+    def render(self, state):
+        """
+        Dibuja un estado reconfigurando solo las casillas que cambiaron.
+        
+        Args:
+            state: Estado del tablero (matriz, lista de filas o secuencia plana)
+        
+        Returns:
+            int: Número de casillas reconfiguradas
+        """
+        values = flatten_board(state)
+        if len(values) != len(self.values):
+            # Cambió el tamaño del tablero: recrear las casillas
+            size = int(round(len(values) ** 0.5))
+            if size * size != len(values):
+                raise ValueError(f"El estado tiene {len(values)} casillas y no es un tablero cuadrado")
+            self.resize(size)
+        
+        changed = 0
+        shown = self.values
+        for pos, value in enumerate(values):
+            if shown[pos] != value:
+                self._draw_cell(pos, value)
+                changed += 1
+        
+        self.frames += 1
+        self.cells_updated += changed
+        return changed
+    
+    def schedule(self, state):
+        """
+        Programa el dibujo de un estado para el próximo ciclo libre.
+        
+        Si se llama varias veces antes de que se dibuje, solo se dibuja el
+        último estado: los pasos intermedios se agrupan en un único fotograma.
+        
+        Args:
+            state: Estado del tablero
+        """
+        self.pending = state
+        if self.flush_id is None:
+            self.flush_id = self.canvas.after_idle(self.flush)
+    
+    def flush(self):
+        """Dibuja el estado pendiente, si lo hay."""
+        self.flush_id = None
+        state, self.pending = self.pending, None
+        if state is not None:
+            self.render(state)
+    
+    def cancel(self):
+        """Descarta el estado pendiente sin dibujarlo."""
+        if self.flush_id is not None:
+            self.canvas.after_cancel(self.flush_id)
+            self.flush_id = None
+        self.pending = None
+    
+    def highlight(self, positions=()):
+        """
+        Resalta unas casillas y quita el resaltado de las demás.
+        
+        Al redibujar una casilla resaltada porque cambió su valor, pierde el
+        resaltado.
+        
+        Args:
+            positions: Posiciones (fila, columna) a resaltar
+        """
+        wanted = {row * self.grid_size + col for row, col in positions}
+        for pos in self.highlighted - wanted:
+            self.canvas.itemconfigure(self.rects[pos], fill=EMPTY_COLOR if self.values[pos] == 0 else TILE_COLOR)
+        for pos in wanted - self.highlighted:
+            self.canvas.itemconfigure(self.rects[pos], fill=HINT_COLOR)
+        self.highlighted = wanted
+    
+    def _draw_cell(self, pos, value):
+        """Reconfigura una casilla y actualiza el valor guardado."""
+        self.highlighted.discard(pos)
+        if value == 0:
+            # Espacio vacío
+            self.canvas.itemconfigure(self.rects[pos], fill=EMPTY_COLOR)
+            self.canvas.itemconfigure(self.texts[pos], text="")
+        else:
+            # Ficha con número
+            self.canvas.itemconfigure(self.rects[pos], fill=TILE_COLOR)
+            self.canvas.itemconfigure(self.texts[pos], text=str(value))
+        self.values[pos] = value
+    
+    def _handle_click(self, event):
+        """Traduce la posición del clic a (fila, columna) y avisa a on_click."""
+        if self.on_click is None:
+            return
+        
+        pitch = self.tile_size + self.gap
+        col = (event.x - self.gap) // pitch
+        row = (event.y - self.gap) // pitch
+        
+        # Ignorar clics fuera del tablero o en la separación entre casillas
+        if not (0 <= row < self.grid_size and 0 <= col < self.grid_size):
+            return
+        if (event.x - self.gap) % pitch >= self.tile_size or (event.y - self.gap) % pitch >= self.tile_size:
+            return
+        self.on_click(row, col)
\ No newline at end of file
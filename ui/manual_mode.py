@@ -2,6 +2,9 @@ import tkinter as tk
 from tkinter import messagebox, simpledialog
 import numpy as np
 from models.puzzle import Puzzle
+from models.hints import HintEngine
+from ui.board_canvas import BoardCanvas
+from utils.telemetry import FrameTimer, UI_ACTIONS
 
 class ManualModeUI:
     """
@@ -45,20 +48,14 @@ class ManualModeUI:
         self.board_frame = tk.Frame(self.main_frame)
         self.board_frame.pack(pady=10)
         
-        # Crear botones del tablero (se actualizarán más tarde)
-        self.tile_buttons = [[None for _ in range(self.grid_size)] for _ in range(self.grid_size)]
-        
-        for row in range(self.grid_size):
-            for col in range(self.grid_size):
-                btn = tk.Button(
-                    self.board_frame, 
-                    width=3, 
-                    height=1, 
-                    font=('Arial', 24),
-                    command=lambda r=row, c=col: self.handle_tile_click(r, c)
-                )
-                btn.grid(row=row, column=col, padx=2, pady=2)
-                self.tile_buttons[row][col] = btn
+        # Tablero dibujado en un canvas (solo se redibujan las casillas que cambian)
+        self.board = BoardCanvas(
+            self.board_frame,
+            grid_size=self.grid_size,
+            tile_size=self.tile_size,
+            on_click=self.handle_tile_click
+        )
+        self.board.pack()
         
         # Frame para información
         self.info_frame = tk.Frame(self.main_frame)
@@ -68,6 +65,10 @@ class ManualModeUI:
         self.moves_label = tk.Label(self.info_frame, text="Movimientos: 0", font=('Arial', 12))
         self.moves_label.pack(side=tk.LEFT, padx=10)
         
+        # Distancia óptima al objetivo (la calcula el motor de pistas)
+        self.distance_label = tk.Label(self.info_frame, text="Distancia: ...", font=('Arial', 12))
+        self.distance_label.pack(side=tk.LEFT, padx=10)
+        
         # Mensaje informativo
         self.message_label = tk.Label(self.info_frame, text="", font=('Arial', 12))
         self.message_label.pack(side=tk.LEFT, padx=10)
@@ -89,32 +90,57 @@ class ManualModeUI:
         self.custom_button = tk.Button(self.control_frame, text="Personalizar", command=self.set_custom_state)
         self.custom_button.pack(side=tk.LEFT, padx=5)
         
+        self.hint_button = tk.Button(self.control_frame, text="Pista", command=self.show_hint)
+        self.hint_button.pack(side=tk.LEFT, padx=5)
+        
+        # Historial de movimientos (también con Ctrl+Z y Ctrl+Y)
+        self.undo_button = tk.Button(self.control_frame, text="Deshacer", command=self.undo_move)
+        self.undo_button.pack(side=tk.LEFT, padx=5)
+        
+        self.redo_button = tk.Button(self.control_frame, text="Rehacer", command=self.redo_move)
+        self.redo_button.pack(side=tk.LEFT, padx=5)
+        
+        self.root.bind('<Control-z>', lambda event: self.undo_move())
+        self.root.bind('<Control-y>', lambda event: self.redo_move())
+        
         # Botón para cambiar al modo automático
         self.auto_button = tk.Button(self.main_frame, text="Modo Automático", command=self.switch_to_auto_mode)
         self.auto_button.pack(pady=10)
         
+        # Motor de pistas: calcula en segundo plano los movimientos óptimos de
+        # cada tablero mostrado; la respuesta vuelve al hilo de Tk con after()
+        self.hint_pending = False
+        self.closed = False
+        self.hints = HintEngine(on_ready=self._on_hint_ready)
+        
+        # Detener el motor también si la interfaz se destruye sin pasar por
+        # close() (por ejemplo, al cerrar la ventana principal de la aplicación)
+        self.main_frame.bind('<Destroy>', self._on_destroy)
+        
         # Actualizar el tablero
         self.update_board()
         
         # Si es ventana principal, configurar cierre
         if self.is_main_window:
-            self.root.protocol("WM_DELETE_WINDOW", self.root.quit)
+            self.root.protocol("WM_DELETE_WINDOW", self._on_window_close)
     
     def update_board(self):
         """Actualiza el tablero con el estado actual del puzzle."""
-        for row in range(self.grid_size):
-            for col in range(self.grid_size):
-                value = self.puzzle.state[row, col]
-                
-                if value == 0:
-                    # Espacio vacío
-                    self.tile_buttons[row][col].config(text="", bg="white")
-                else:
-                    # Ficha con número
-                    self.tile_buttons[row][col].config(text=str(value), bg="lightblue")
-        
-        # Actualizar contador de movimientos
+        # La tupla plana basta para dibujar: no hace falta construir un array
+        self.board.render(self.puzzle.board)
+        
+        # Actualizar contador de movimientos y botones del historial
         self.moves_label.config(text=f"Movimientos: {self.puzzle.moves_count}")
+        self.undo_button.config(state=tk.NORMAL if self.puzzle.can_undo() else tk.DISABLED)
+        self.redo_button.config(state=tk.NORMAL if self.puzzle.can_redo() else tk.DISABLED)
+        
+        # La pista mostrada corresponde al tablero anterior
+        self.board.highlight()
+        self.hint_pending = False
+        
+        # Pedir la pista del nuevo tablero (si ya está calculada llega al momento)
+        self.distance_label.config(text="Distancia: ...")
+        self.hints.request(self.puzzle.board)
     
     def handle_tile_click(self, row, col):
         """
@@ -124,31 +150,100 @@ class ManualModeUI:
             row: Fila de la casilla
             col: Columna de la casilla
         """
-        # Intentar mover la ficha
-        if self.puzzle.move_tile(row, col):
-            # Actualizar el tablero
-            self.update_board()
-            
-            # Verificar si se ha resuelto el puzzle
-            if self.puzzle.is_goal():
-                messagebox.showinfo("¡Felicidades!", "¡Has resuelto el puzzle!")
-                self.message_label.config(text="¡Puzzle resuelto!", fg="green")
+        UI_ACTIONS.inc('manual', 'click')
+        
+        # Intentar mover la ficha (el movimiento y el redibujado forman un fotograma)
+        with FrameTimer('manual'):
+            moved = self.puzzle.move_tile(row, col)
+            if moved:
+                self.update_board()
+        
+        # Verificar si se ha resuelto el puzzle
+        if moved and self.puzzle.is_goal():
+            messagebox.showinfo("¡Felicidades!", "¡Has resuelto el puzzle!")
+            self.message_label.config(text="¡Puzzle resuelto!", fg="green")
+    
+    def show_hint(self):
+        """Resalta las fichas que acercan al objetivo por un camino óptimo."""
+        UI_ACTIONS.inc('manual', 'hint')
+        hint = self.hints.get(self.puzzle.board)
+        if hint is None:
+            # Aún se está calculando: se mostrará en cuanto llegue
+            self.hint_pending = True
+            self.message_label.config(text="Calculando pista...", fg="blue")
+            return
+        self._show_hint(hint)
+    
+    def _show_hint(self, hint):
+        """Muestra una pista ya calculada."""
+        self.hint_pending = False
+        if self.puzzle.is_goal():
+            self.message_label.config(text="¡Puzzle resuelto!", fg="green")
+        elif hint['distance'] is None:
+            self.message_label.config(text="Este tablero no tiene solución", fg="red")
+        else:
+            board = self.puzzle.board
+            tiles = ", ".join(str(board[row * self.grid_size + col]) for row, col in hint['tiles'])
+            self.board.highlight(hint['tiles'])
+            self.message_label.config(text=f"Pista: mueve la ficha {tiles}", fg="blue")
+    
+    def _on_hint_ready(self, board, hint):
+        """
+        Recibe la pista desde el hilo del motor y la pasa al hilo de Tk.
+        
+        Tras close() no se hace nada: la ventana puede estar ya destruida.
+        """
+        if self.closed:
+            return
+        try:
+            self.root.after(0, self._hint_ready, board, hint)
+        except (tk.TclError, RuntimeError):
+            pass  # La ventana se destruyó mientras se calculaba la pista
+    
+    def _hint_ready(self, board, hint):
+        """Recibe en el hilo de Tk la pista de un tablero."""
+        # Descartar pistas de tableros que ya no se muestran
+        if self.closed or board != self.puzzle.board:
+            return
+        if hint['distance'] is None:
+            self.distance_label.config(text="Distancia: sin solución")
+        else:
+            self.distance_label.config(text=f"Distancia: {hint['distance']}")
+        if self.hint_pending:
+            self._show_hint(hint)
+    
+    def undo_move(self):
+        """Deshace el último movimiento."""
+        UI_ACTIONS.inc('manual', 'undo')
+        with FrameTimer('manual'):
+            if self.puzzle.undo():
+                self.update_board()
+                self.message_label.config(text="", fg="black")
+    
+    def redo_move(self):
+        """Rehace el último movimiento deshecho."""
+        UI_ACTIONS.inc('manual', 'redo')
+        with FrameTimer('manual'):
+            moved = self.puzzle.redo()
+            if moved:
+                self.update_board()
+        
+        # Rehacer puede llevar al objetivo
+        if moved and self.puzzle.is_goal():
+            self.message_label.config(text="¡Puzzle resuelto!", fg="green")
     
     def reset_game(self):
         """Reinicia el juego al estado objetivo."""
+        UI_ACTIONS.inc('manual', 'reset')
         self.puzzle.reset()
         self.update_board()
         self.message_label.config(text="Juego reiniciado", fg="black")
     
     def shuffle_game(self):
         """Aleatoriza el tablero."""
-        self.puzzle.shuffle(num_moves=100)
-        
-        # Verificar si el estado generado tiene solución
-        if not self.puzzle.is_solvable():
-            # Si no tiene solución, generar otro
-            self.shuffle_game()
-            return
+        UI_ACTIONS.inc('manual', 'shuffle')
+        # El estado generado siempre tiene solución
+        self.puzzle.shuffle()
         
         self.update_board()
         self.message_label.config(text="Tablero aleatorizado", fg="black")
@@ -169,6 +264,7 @@ class ManualModeUI:
             current_puzzle = self.puzzle
             
             # Limpiar la interfaz actual
+            self.close()
             self.main_frame.destroy()
             
             # Llamar al callback para cambiar de modo
@@ -203,6 +299,28 @@ class ManualModeUI:
             except Exception as e:
                 messagebox.showerror("Error", f"Error al configurar el estado: {e}")
     
+    def close(self):
+        """Detiene el motor de pistas y quita los atajos de teclado de la ventana."""
+        if self.closed:
+            return
+        self.closed = True
+        self.hints.stop()
+        try:
+            self.root.unbind('<Control-z>')
+            self.root.unbind('<Control-y>')
+        except tk.TclError:
+            pass  # La ventana ya se destruyó
+    
+    def _on_destroy(self, event):
+        """Cierra la interfaz cuando se destruye su marco principal."""
+        if event.widget is self.main_frame:
+            self.close()
+    
+    def _on_window_close(self):
+        """Cierre de la ventana cuando el modo manual es la ventana principal."""
+        self.close()
+        self.root.quit()
+    
     def run(self):
         """Inicia el bucle principal de la interfaz si es ventana principal."""
         if self.is_main_window:
@@ -274,7 +392,7 @@ class CustomStateDialog:
             # Guardar el resultado
             self.result = numbers
             self.dialog.destroy()
-            
+        
         except Exception as e:
             messagebox.showerror("Error", f"Error al procesar la entrada: {e}")
     
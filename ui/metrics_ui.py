@@ -0,0 +1,648 @@
+import os
+import queue
+import subprocess
+import threading
+import time
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+from utils.metrics import AlgorithmMetrics
+
+# Intervalo de lectura de la cola de resultados (milisegundos)
+POLL_INTERVAL_MS = 50
+
+# Tiempo mínimo entre dos actualizaciones de los gráficos en vivo (segundos)
+PLOT_INTERVAL = 0.25
+
+
+class LiveBarChart:
+    """
+    Gráfico de barras que se actualiza durante el benchmark.
+    
+    Los ejes se dibujan una vez y se guardan como fondo; en cada actualización
+    solo se vuelven a pintar las barras y sus etiquetas (blitting). Los ejes se
+    redibujan únicamente cuando un valor se sale de la escala.
+    """
+    def __init__(self, figure, canvas):
+        """
+        Args:
+            figure: Figura de matplotlib
+            canvas: FigureCanvasTkAgg de la figura
+        """
+        self.figure = figure
+        self.canvas = canvas
+        self.ax = None
+        self.bars = []
+        self.labels = []
+        self.value_format = '{:.1f}'
+        self.background = None
+        
+        # Guardar el fondo cada vez que la figura se dibuja completa
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+    
+    def reset(self, names, title, ylabel, color, value_format):
+        """
+        Prepara un gráfico vacío con una barra por algoritmo.
+        
+        Args:
+            names: Nombres de los algoritmos
+            title: Título del gráfico
+            ylabel: Etiqueta del eje vertical
+            color: Color de las barras
+            value_format: Formato de las etiquetas, por ejemplo '{:.6f}'
+        """
+        self.figure.clear()
+        self.ax = self.figure.add_subplot(111)
+        self.bars = list(self.ax.bar(names, [0] * len(names), color=color, animated=True))
+        self.labels = [
+            self.ax.text(bar.get_x() + bar.get_width() / 2., 0, '', ha='center', va='bottom',
+                         fontsize=9, animated=True)
+            for bar in self.bars
+        ]
+        self.value_format = value_format
+        
+        self.ax.set_xlabel('Algoritmo')
+        self.ax.set_ylabel(ylabel)
+        self.ax.set_title(f'{title} (en curso)')
+        self.ax.set_ylim(0, 1)
+        self.figure.tight_layout()
+        self.canvas.draw()
+    
+    def detach(self):
+        """Deja de gestionar la figura (antes de dibujar el gráfico final)."""
+        self.ax = None
+        self.bars = []
+        self.labels = []
+        self.background = None
+    
+    def _on_draw(self, event):
+        """Guarda el fondo sin las barras y vuelve a pintarlas encima."""
+        if self.ax is None:
+            return
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_bars()
+    
+    def _draw_bars(self):
+        """Pinta las barras y etiquetas animadas."""
+        for artist in self.bars + self.labels:
+            self.figure.draw_artist(artist)
+    
+    def update(self, values):
+        """
+        Actualiza la altura de las barras.
+        
+        Args:
+            values: Un valor por algoritmo, en el mismo orden que en reset()
+        """
+        if self.ax is None:
+            return
+        
+        for bar, label, value in zip(self.bars, self.labels, values):
+            bar.set_height(value)
+            label.set_y(value)
+            label.set_text(self.value_format.format(value) if value else '')
+        
+        top = max(values, default=0)
+        if top > self.ax.get_ylim()[1]:
+            # Cambia la escala: redibujar los ejes (draw_event guarda el nuevo fondo)
+            self.ax.set_ylim(0, top * 1.3)
+            self.canvas.draw()
+            return
+        
+        if self.background is None:
+            return
+        self.canvas.restore_region(self.background)
+        self._draw_bars()
+        self.canvas.blit(self.figure.bbox)
+
+
+class MetricsUI:
+    """
+    Interfaz gráfica para ejecutar y visualizar métricas de comparación de algoritmos.
+    """
+    def __init__(self, root=None):
+        """
+        Inicializa la interfaz gráfica para métricas.
+        
+        Args:
+            root: Ventana principal de Tkinter. Si es None, se crea una nueva.
+        """
+        # Inicializar sistema de métricas
+        self.metrics = AlgorithmMetrics()
+        
+        # Crear ventana principal si no se proporciona
+        self.is_main_window = False
+        if root is None:
+            self.root = tk.Tk()
+            self.root.title("Métricas de Algoritmos 8-Puzzle")
+            self.root.geometry("800x600")
+            self.is_main_window = True
+        else:
+            self.root = root
+        
+        # Variables de estado
+        self.algorithms = ["BFS", "DFS Limitada", "A* Manhattan"]
+        self.selected_algorithms = []
+        for algo in self.algorithms:
+            self.selected_algorithms.append(tk.BooleanVar(value=True))
+        
+        self.num_test_cases = tk.IntVar(value=5)
+        self.min_difficulty = tk.IntVar(value=5)
+        self.max_difficulty = tk.IntVar(value=15)
+        
+        # Procesos del benchmark (uno libre para la interfaz)
+        self.num_workers = tk.IntVar(value=max(1, (os.cpu_count() or 2) - 1))
+        
+        # Tipo de gráfico de distribución ('box' o 'violin')
+        self.distribution_kind = tk.StringVar(value='box')
+        
+        # Comunicación con el hilo del benchmark
+        self.results_queue = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.worker = None
+        
+        # Promedios en vivo: algoritmo -> [éxitos, suma de tiempos, suma de nodos, suma de longitudes]
+        self.live_stats = {}
+        self.last_plot_update = 0.0
+        
+        # Crear interfaz
+        self.create_widgets()
+        
+        # Si es ventana principal, configurar cierre
+        if self.is_main_window:
+            self.root.protocol("WM_DELETE_WINDOW", self.close)
+    
+    def create_widgets(self):
+        """Crea y dispone los widgets de la interfaz."""
+        # Frame principal
+        self.main_frame = tk.Frame(self.root)
+        self.main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        # Panel izquierdo - Configuración
+        self.left_frame = tk.Frame(self.main_frame)
+        self.left_frame.pack(side=tk.LEFT, fill=tk.BOTH, padx=10, expand=True)
+        
+        # Panel derecho - Resultados y gráficos
+        self.right_frame = tk.Frame(self.main_frame)
+        self.right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, padx=10, expand=True)
+        
+        # Sección de configuración
+        self.config_frame = tk.LabelFrame(self.left_frame, text="Configuración", padx=10, pady=10)
+        self.config_frame.pack(fill=tk.X, pady=10)
+        
+        # Selección de algoritmos
+        algo_label = tk.Label(self.config_frame, text="Algoritmos a comparar:")
+        algo_label.pack(anchor=tk.W, pady=(5, 0))
+        
+        for i, algo in enumerate(self.algorithms):
+            cb = tk.Checkbutton(self.config_frame, text=algo, variable=self.selected_algorithms[i])
+            cb.pack(anchor=tk.W, padx=20)
+        
+        # Número de casos de prueba
+        tk.Label(self.config_frame, text="Número de casos de prueba:").pack(anchor=tk.W, pady=(10, 0))
+        ttk.Spinbox(self.config_frame, from_=1, to=20, textvariable=self.num_test_cases, width=5).pack(anchor=tk.W, padx=20)
+        
+        # Dificultad mínima
+        tk.Label(self.config_frame, text="Dificultad mínima (movimientos):").pack(anchor=tk.W, pady=(10, 0))
+        ttk.Spinbox(self.config_frame, from_=3, to=30, textvariable=self.min_difficulty, width=5).pack(anchor=tk.W, padx=20)
+        
+        # Dificultad máxima
+        tk.Label(self.config_frame, text="Dificultad máxima (movimientos):").pack(anchor=tk.W, pady=(10, 0))
+        ttk.Spinbox(self.config_frame, from_=5, to=50, textvariable=self.max_difficulty, width=5).pack(anchor=tk.W, padx=20)
+        
+        # Procesos en paralelo
+        tk.Label(self.config_frame, text="Procesos en paralelo:").pack(anchor=tk.W, pady=(10, 0))
+        ttk.Spinbox(self.config_frame, from_=1, to=os.cpu_count() or 1, textvariable=self.num_workers, width=5).pack(anchor=tk.W, padx=20)
+        
+        # Botones de acción
+        self.action_frame = tk.Frame(self.left_frame)
+        self.action_frame.pack(fill=tk.X, pady=10)
+        
+        # Botón de ejecutar benchmark
+        self.run_button = tk.Button(
+            self.action_frame,
+            text="Ejecutar Benchmark",
+            command=self.run_benchmark
+        )
+        self.run_button.pack(fill=tk.X, pady=5)
+        
+        # Progreso y cancelación del benchmark en curso
+        self.progress_bar = ttk.Progressbar(self.action_frame, mode='determinate')
+        self.progress_bar.pack(fill=tk.X, pady=5)
+        
+        self.cancel_button = tk.Button(
+            self.action_frame,
+            text="Cancelar",
+            command=self.cancel_benchmark,
+            state=tk.DISABLED
+        )
+        self.cancel_button.pack(fill=tk.X, pady=5)
+        
+        # Botón de generar informe
+        self.report_button = tk.Button(
+            self.action_frame,
+            text="Generar Informe",
+            command=self.generate_report,
+            state=tk.DISABLED
+        )
+        self.report_button.pack(fill=tk.X, pady=5)
+        
+        # Botón de guardar gráficos
+        self.save_button = tk.Button(
+            self.action_frame,
+            text="Guardar Gráficos",
+            command=self.save_plots,
+            state=tk.DISABLED
+        )
+        self.save_button.pack(fill=tk.X, pady=5)
+        
+        # Panel de registro
+        self.log_frame = tk.LabelFrame(self.left_frame, text="Registro", padx=10, pady=10)
+        self.log_frame.pack(fill=tk.BOTH, expand=True, pady=10)
+        
+        # Área de texto para el registro
+        self.log_text = tk.Text(self.log_frame, height=10, width=30)
+        self.log_text.pack(fill=tk.BOTH, expand=True)
+        
+        # Crear figuras para los gráficos
+        self.fig1 = Figure(figsize=(4, 3))
+        self.fig2 = Figure(figsize=(4, 3))
+        self.fig3 = Figure(figsize=(4, 3))
+        self.fig4 = Figure(figsize=(4, 3))
+        self.fig5 = Figure(figsize=(4, 3))
+        self.fig6 = Figure(figsize=(4, 3))
+        
+        # Crear contenedores para los gráficos
+        self.results_notebook = ttk.Notebook(self.right_frame)
+        self.results_notebook.pack(fill=tk.BOTH, expand=True)
+        
+        # Página para tiempo de ejecución
+        self.time_frame = tk.Frame(self.results_notebook)
+        self.results_notebook.add(self.time_frame, text="Tiempo de Ejecución")
+        
+        self.canvas1 = FigureCanvasTkAgg(self.fig1, master=self.time_frame)
+        self.canvas1.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        
+        # Página para nodos expandidos
+        self.nodes_frame = tk.Frame(self.results_notebook)
+        self.results_notebook.add(self.nodes_frame, text="Nodos Expandidos")
+        
+        self.canvas2 = FigureCanvasTkAgg(self.fig2, master=self.nodes_frame)
+        self.canvas2.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        
+        # Página para longitud del camino
+        self.path_frame = tk.Frame(self.results_notebook)
+        self.results_notebook.add(self.path_frame, text="Longitud del Camino")
+        
+        self.canvas3 = FigureCanvasTkAgg(self.fig3, master=self.path_frame)
+        self.canvas3.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        
+        # Página para la distribución de tiempos (caja o violín)
+        self.distribution_frame = tk.Frame(self.results_notebook)
+        self.results_notebook.add(self.distribution_frame, text="Distribución")
+        
+        kind_frame = tk.Frame(self.distribution_frame)
+        kind_frame.pack(anchor=tk.W)
+        for text, kind in (("Caja", 'box'), ("Violín", 'violin')):
+            tk.Radiobutton(
+                kind_frame, text=text, value=kind, variable=self.distribution_kind,
+                command=self.update_distribution_plot
+            ).pack(side=tk.LEFT)
+        
+        self.canvas4 = FigureCanvasTkAgg(self.fig4, master=self.distribution_frame)
+        self.canvas4.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        
+        # Página para el escalado según la distancia óptima
+        self.scaling_frame = tk.Frame(self.results_notebook)
+        self.results_notebook.add(self.scaling_frame, text="Escalado")
+        
+        self.canvas5 = FigureCanvasTkAgg(self.fig5, master=self.scaling_frame)
+        self.canvas5.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        
+        # Página para nodos expandidos por segundo
+        self.throughput_frame = tk.Frame(self.results_notebook)
+        self.results_notebook.add(self.throughput_frame, text="Nodos/s")
+        
+        self.canvas6 = FigureCanvasTkAgg(self.fig6, master=self.throughput_frame)
+        self.canvas6.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        
+        # Gráficos de barras que se actualizan durante el benchmark
+        self.time_chart = LiveBarChart(self.fig1, self.canvas1)
+        self.nodes_chart = LiveBarChart(self.fig2, self.canvas2)
+        self.length_chart = LiveBarChart(self.fig3, self.canvas3)
+    
+    def log(self, message):
+        """Añade un mensaje al registro (solo desde el hilo de la interfaz)."""
+        self.log_text.insert(tk.END, message + "\n")
+        self.log_text.see(tk.END)
+    
+    def run_benchmark(self):
+        """
+        Inicia el benchmark con la configuración actual.
+        
+        Los casos se resuelven en un hilo aparte (con un ProcessPoolExecutor si
+        hay más de un proceso); los resultados llegan por una cola que la
+        interfaz lee periódicamente, así la ventana no se bloquea.
+        """
+        # Obtener algoritmos seleccionados
+        selected = []
+        for i, var in enumerate(self.selected_algorithms):
+            if var.get():
+                selected.append(self.algorithms[i])
+        
+        if not selected:
+            messagebox.showwarning("Advertencia", "Seleccione al menos un algoritmo para comparar.")
+            return
+        
+        # Validar dificultad
+        min_diff = self.min_difficulty.get()
+        max_diff = self.max_difficulty.get()
+        
+        if min_diff >= max_diff:
+            messagebox.showwarning("Advertencia", "La dificultad mínima debe ser menor que la máxima.")
+            return
+        
+        # Desactivar botones durante el benchmark
+        self.run_button.config(state=tk.DISABLED)
+        self.report_button.config(state=tk.DISABLED)
+        self.save_button.config(state=tk.DISABLED)
+        self.cancel_button.config(state=tk.NORMAL)
+        
+        # Limpiar registro
+        self.log_text.delete(1.0, tk.END)
+        
+        # Generar casos de prueba
+        self.log("Generando casos de prueba...")
+        test_cases = self.metrics.generate_test_cases(
+            num_cases=self.num_test_cases.get(),
+            min_difficulty=min_diff,
+            max_difficulty=max_diff
+        )
+        workers = max(1, self.num_workers.get())
+        self.log(f"Ejecutando benchmark con {len(test_cases)} casos y algoritmos: {', '.join(selected)} "
+                 f"({workers} procesos)")
+        
+        # Reiniciar progreso, promedios en vivo y gráficos
+        self.live_stats = {algo: [0, 0.0, 0, 0] for algo in selected}
+        self.progress_bar.config(maximum=len(test_cases) * len(selected), value=0)
+        self.time_chart.reset(selected, 'Comparación de tiempos de ejecución',
+                              'Tiempo promedio (segundos)', 'skyblue', '{:.6f}')
+        self.nodes_chart.reset(selected, 'Comparación de nodos expandidos',
+                               'Nodos expandidos (promedio)', 'lightgreen', '{:.0f}')
+        self.length_chart.reset(selected, 'Comparación de longitudes de camino',
+                                'Longitud del camino (promedio)', 'salmon', '{:.1f}')
+        self.last_plot_update = 0.0
+        
+        # Lanzar el benchmark en segundo plano
+        self.cancel_event.clear()
+        self.worker = threading.Thread(
+            target=self._benchmark_worker,
+            args=(test_cases, selected, workers),
+            daemon=True
+        )
+        self.worker.start()
+        self.root.after(POLL_INTERVAL_MS, self.poll_results)
+    
+    def _benchmark_worker(self, test_cases, algorithms, workers):
+        """
+        Ejecuta el benchmark fuera del hilo de la interfaz.
+        
+        No toca ningún widget: todo lo comunica por self.results_queue.
+        """
+        def progress(done, total, case, algo, result):
+            # Solo los valores necesarios para los promedios en vivo
+            self.results_queue.put(('result', (done, algo, result['success'], result['execution_time'],
+                                               result['nodes_expanded'], result['path_length'])))
+        
+        try:
+            self.metrics.run_benchmark(
+                test_cases,
+                algorithms=algorithms,
+                workers=workers,
+                verbose=False,
+                progress=progress,
+                should_stop=self.cancel_event.is_set
+            )
+            self.results_queue.put(('cancelled' if self.cancel_event.is_set() else 'done', None))
+        except Exception as e:
+            self.results_queue.put(('error', str(e)))
+    
+    def cancel_benchmark(self):
+        """Pide al benchmark en curso que se detenga."""
+        self.cancel_event.set()
+        self.cancel_button.config(state=tk.DISABLED)
+        self.log("Cancelando...")
+    
+    def poll_results(self):
+        """Lee los resultados pendientes de la cola y actualiza la interfaz."""
+        finished = None
+        try:
+            while finished is None:
+                kind, payload = self.results_queue.get_nowait()
+                if kind == 'result':
+                    done, algo, success, exec_time, nodes, length = payload
+                    self.progress_bar.config(value=done)
+                    if success:
+                        stats = self.live_stats[algo]
+                        stats[0] += 1
+                        stats[1] += exec_time
+                        stats[2] += nodes
+                        stats[3] += length
+                else:
+                    finished = (kind, payload)
+        except queue.Empty:
+            pass
+        
+        # Redibujar como mucho cada PLOT_INTERVAL segundos
+        now = time.perf_counter()
+        if finished is None and now - self.last_plot_update >= PLOT_INTERVAL:
+            self.last_plot_update = now
+            self.update_live_plots()
+        
+        if finished is None:
+            self.root.after(POLL_INTERVAL_MS, self.poll_results)
+        else:
+            self.finish_benchmark(*finished)
+    
+    def update_live_plots(self):
+        """Actualiza las barras de promedios con los resultados recibidos."""
+        averages = [
+            [total / stats[0] if stats[0] else 0 for total in stats[1:]]
+            for stats in self.live_stats.values()
+        ]
+        self.time_chart.update([row[0] for row in averages])
+        self.nodes_chart.update([row[1] for row in averages])
+        self.length_chart.update([row[2] for row in averages])
+    
+    def finish_benchmark(self, kind, message):
+        """
+        Muestra el resultado final del benchmark.
+        
+        Args:
+            kind: 'done', 'cancelled' o 'error'
+            message: Mensaje de error (solo con 'error')
+        """
+        self.worker = None
+        self.cancel_button.config(state=tk.DISABLED)
+        self.run_button.config(state=tk.NORMAL)
+        
+        # Los gráficos finales sustituyen a los gráficos en vivo
+        for chart in (self.time_chart, self.nodes_chart, self.length_chart):
+            chart.detach()
+        
+        if kind == 'error':
+            self.log(f"Error: {message}")
+            messagebox.showerror("Error", f"Error al ejecutar el benchmark: {message}")
+            return
+        
+        if not self.metrics.has_results():
+            self.log("\nBenchmark cancelado sin resultados.")
+            return
+        
+        # Actualizar gráficos
+        self.update_plots()
+        
+        # Habilitar botones de informe y guardar
+        self.report_button.config(state=tk.NORMAL)
+        self.save_button.config(state=tk.NORMAL)
+        
+        # Mostrar resumen
+        self.log("\nResumen de resultados:")
+        for algo, row in self.metrics.summarize().items():
+            if row['successes'] > 0:
+                self.log(f"{algo}:")
+                self.log(f"  - Éxito: {row['successes']}/{row['cases']} ({row['success_rate']:.1f}%)")
+                self.log(f"  - Tiempo promedio: {row['avg_time']:.6f} segundos")
+                self.log(f"  - Nodos expandidos: {row['avg_nodes']:.1f}")
+                self.log(f"  - Longitud del camino: {row['avg_length']:.1f}")
+            else:
+                self.log(f"{algo}: No encontró soluciones.")
+        
+        if kind == 'cancelled':
+            self.log("\nBenchmark cancelado (resultados parciales).")
+        else:
+            self.log("\nBenchmark completado con éxito.")
+    
+    def update_plots(self):
+        """Actualiza los gráficos con los resultados actuales."""
+        # Gráfico de tiempo de ejecución
+        self.metrics.plot_execution_time(self.fig1)
+        self.canvas1.draw()
+        
+        # Gráfico de nodos expandidos
+        self.metrics.plot_nodes_expanded(self.fig2)
+        self.canvas2.draw()
+        
+        # Gráfico de longitud del camino
+        self.metrics.plot_path_length(self.fig3)
+        self.canvas3.draw()
+        
+        # Distribución de tiempos
+        self.update_distribution_plot()
+        
+        # Escalado según la distancia óptima
+        if self.metrics.plot_scaling(self.fig5) is not None:
+            self.canvas5.draw()
+        
+        # Nodos expandidos por segundo
+        self.metrics.plot_throughput(self.fig6)
+        self.canvas6.draw()
+    
+    def update_distribution_plot(self):
+        """Redibuja la distribución de tiempos con el tipo de gráfico elegido."""
+        if not self.metrics.has_results():
+            return
+        self.metrics.plot_time_distribution(self.fig4, kind=self.distribution_kind.get())
+        self.canvas4.draw()
+    
+    def generate_report(self):
+        """Genera y muestra un informe de comparación."""
+        if not self.metrics.has_results():
+            messagebox.showinfo("Información", "No hay resultados para generar un informe. Ejecute el benchmark primero.")
+            return
+        
+        # Solicitar ruta para guardar el informe
+        report_path = filedialog.asksaveasfilename(
+            title="Guardar Informe",
+            filetypes=[("Archivos de texto", "*.txt")],
+            defaultextension=".txt"
+        )
+        
+        if not report_path:
+            return  # El usuario canceló la operación
+        
+        try:
+            # Generar el informe
+            self.log("Generando informe...")
+            report_file = self.metrics.generate_comparison_report(report_path)
+            
+            # Preguntar si desea abrir el informe
+            if messagebox.askyesno("Informe Generado", f"Informe guardado en {report_file}. ¿Desea abrirlo ahora?"):
+                # Abrir el archivo con el visor predeterminado
+                if os.name == 'nt':  # Windows
+                    os.startfile(report_file)
+                elif os.name == 'posix':  # macOS, Linux
+                    subprocess.call(('xdg-open', report_file))
+            
+            self.log(f"Informe guardado en {report_file}")
+        
+        except Exception as e:
+            self.log(f"Error: {str(e)}")
+            messagebox.showerror("Error", f"Error al generar el informe: {str(e)}")
+    
+    def save_plots(self):
+        """Guarda los gráficos como archivos de imagen."""
+        if not self.metrics.has_results():
+            messagebox.showinfo("Información", "No hay gráficos para guardar. Ejecute el benchmark primero.")
+            return
+        
+        # Solicitar directorio para guardar los gráficos
+        save_dir = filedialog.askdirectory(title="Seleccionar directorio para guardar gráficos")
+        
+        if not save_dir:
+            return  # El usuario canceló la operación
+        
+        try:
+            # Guardar los gráficos
+            self.log("Guardando gráficos...")
+            
+            # Tiempo de ejecución
+            time_path = f"{save_dir}/tiempo_ejecucion.png"
+            self.fig1.savefig(time_path)
+            
+            # Nodos expandidos
+            nodes_path = f"{save_dir}/nodos_expandidos.png"
+            self.fig2.savefig(nodes_path)
+            
+            # Longitud del camino
+            path_path = f"{save_dir}/longitud_camino.png"
+            self.fig3.savefig(path_path)
+            
+            # Distribución, escalado y nodos por segundo
+            self.fig4.savefig(f"{save_dir}/distribucion_tiempos.png")
+            self.fig5.savefig(f"{save_dir}/escalado_distancia.png")
+            self.fig6.savefig(f"{save_dir}/nodos_por_segundo.png")
+            
+            self.log(f"Gráficos guardados en {save_dir}")
+            messagebox.showinfo("Gráficos Guardados", f"Los gráficos se guardaron en {save_dir}")
+        
+        except Exception as e:
+            self.log(f"Error: {str(e)}")
+            messagebox.showerror("Error", f"Error al guardar los gráficos: {str(e)}")
+    
+    def close(self):
+        """Cancela el benchmark en curso y cierra la ventana principal."""
+        self.cancel_event.set()
+        self.root.quit()
+    
+    def run(self):
+        """Inicia el bucle principal de la interfaz si es ventana principal."""
+        if self.is_main_window:
+            self.root.mainloop()
+
+if __name__ == "__main__":
+    # Ejemplo de uso independiente
+    app = MetricsUI()
+    app.run()
\ No newline at end of file
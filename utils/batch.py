@@ -0,0 +1,369 @@
+"""
+Resolución por lotes en flujo: tableros por la entrada estándar (o archivos),
+soluciones por la salida estándar, en el mismo orden.
+
+Ejemplos:
+    python -m utils.batch --engine table < tableros.txt > soluciones.tsv
+    zcat tableros.txt.gz | python -m utils.batch --engine astar --workers 8 --format jsonl
+    python -m utils.batch corpus1.txt corpus2.txt --workers 4 --timeout 5
+
+Cada línea de entrada es un tablero en formato compacto ('1,2,3,4,5,6,7,8,0' o
+separado por espacios); las líneas vacías y las que empiezan por '#' se
+ignoran. Cada línea de salida corresponde a un tablero:
+    
+    tsv:   estado, resultado, movimientos, longitud, nodos, tiempo (separados por tabuladores)
+    jsonl: un objeto JSON con los mismos campos y el motor
+
+El resultado es 'ok', 'failed' (sin solución dentro del límite de profundidad),
+'timeout', 'unsolvable' o 'error' (línea inválida; el mensaje va en el campo de
+los movimientos). El resumen se escribe en stderr.
+
+Las entradas también pueden ser corpus binarios (utils.corpus): cada proceso
+de trabajo mapea el archivo y lee su rango de tableros directamente, sin que
+pasen por el proceso principal. Con --output-corpus los tableros válidos y sus
+soluciones se guardan además en ese formato.
+
+Los tableros se reparten en bloques entre los procesos de trabajo y se leen de
+la entrada solo cuando hay sitio: como mucho --max-pending bloques en curso,
+así que la memoria no depende del tamaño de la entrada y un consumidor lento
+frena la lectura (contrapresión).
+"""
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+
+from models.random_state import is_solvable
+from models.solver import ALGORITHM_ALIASES
+from service.engine import (
+    GOAL_BOARD, DEFAULT_DEPTH_LIMIT, TABLE_ENGINE, WEIGHTED_ENGINE, ENGINES,
+    parse_board, solve_board, warm_worker
+)
+from utils.corpus import CorpusFile, CorpusWriter, is_corpus_file
+
+# Alias de los motores en la línea de comandos
+ENGINE_ALIASES = {
+    **ALGORITHM_ALIASES,
+    'table': TABLE_ENGINE,
+    'weighted': WEIGHTED_ENGINE,
+}
+
+# Campos de cada resultado, en el orden de las columnas de la salida tsv
+OUTPUT_FIELDS = ('state', 'status', 'moves', 'path_length', 'nodes_expanded', 'execution_time')
+
+# Tableros por bloque enviado a un proceso de trabajo
+DEFAULT_CHUNK_SIZE = 256
+
+# Corpus binarios abiertos en este proceso, por ruta (los bloques del mismo archivo reutilizan el mapeo)
+_CORPORA = {}
+
+
+def parse_engine(name):
+    """
+    Convierte un nombre o alias de motor en su nombre canónico.
+    
+    Args:
+        name: Alias ('bfs', 'dfs', 'astar', 'table', 'weighted') o nombre completo
+    
+    Returns:
+        str: Uno de ENGINES
+    """
+    if name in ENGINES:
+        return name
+    if name.lower() in ENGINE_ALIASES:
+        return ENGINE_ALIASES[name.lower()]
+    raise argparse.ArgumentTypeError(
+        f"motor desconocido: {name} (opciones: {', '.join(ENGINE_ALIASES)})"
+    )
+
+
+def solve_line(line, goal, engine, depth_limit=DEFAULT_DEPTH_LIMIT, time_limit=None):
+    """
+    Resuelve un tablero en formato compacto.
+    
+    Args:
+        line: Línea de entrada (sin salto de línea)
+        goal: Estado objetivo (tupla plana)
+        engine: Uno de ENGINES
+        depth_limit: Límite de profundidad para "DFS Limitada"
+        time_limit: Tiempo máximo por búsqueda en segundos (None = sin límite)
+    
+    Returns:
+        dict con los campos de OUTPUT_FIELDS y engine
+    """
+    record = {
+        'state': line, 'status': 'error', 'moves': '', 'path_length': 0,
+        'nodes_expanded': 0, 'execution_time': 0.0, 'engine': engine
+    }
+    try:
+        board = parse_board(line)
+    except ValueError as e:
+        record['moves'] = str(e)
+        return record
+    
+    record['state'] = ','.join(map(str, board))
+    if not is_solvable(board, goal):
+        record['status'] = 'unsolvable'
+        return record
+    
+    result = solve_board(board, goal, engine, depth_limit, time_limit)
+    if result['timed_out']:
+        record['status'] = 'timeout'
+    else:
+        record['status'] = 'ok' if result['success'] else 'failed'
+    for field in ('moves', 'path_length', 'nodes_expanded', 'execution_time', 'engine'):
+        record[field] = result[field]
+    return record
+
+
+def format_record(record, output_format):
+    """Convierte un resultado en una línea de salida (sin salto de línea)."""
+    if output_format == 'jsonl':
+        return json.dumps(record)
+    return '\t'.join(
+        f"{record[field]:.6f}" if field == 'execution_time' else str(record[field])
+        for field in OUTPUT_FIELDS
+    )
+
+
+def chunk_lines(chunk):
+    """
+    Líneas de un bloque.
+    
+    Args:
+        chunk: Lista de líneas o tupla (ruta de un corpus binario, inicio, fin)
+    
+    Returns:
+        Lista de tableros en formato compacto
+    """
+    if isinstance(chunk, list):
+        return chunk
+    
+    path, start, stop = chunk
+    corpus = _CORPORA.get(path)
+    if corpus is None:
+        corpus = _CORPORA[path] = CorpusFile(path)
+    return [','.join(map(str, board)) for board in corpus.boards(start, stop).tolist()]
+
+
+def solve_chunk(chunk, goal, engine, depth_limit, time_limit, output_format, keep_solutions=False):
+    """
+    Resuelve un bloque de tableros en un proceso de trabajo.
+    
+    Devuelve el texto ya formateado para que el proceso principal solo tenga
+    que escribirlo.
+    
+    Args:
+        chunk: Lista de líneas o rango de un corpus binario (ver chunk_lines)
+        keep_solutions: Si es True, devuelve también los tableros válidos y sus soluciones
+    
+    Returns:
+        Tupla (texto de salida del bloque, Counter de resultados, lista de
+        (tablero, movimientos o None) o None)
+    """
+    output = []
+    statuses = Counter()
+    solutions = [] if keep_solutions else None
+    for line in chunk_lines(chunk):
+        record = solve_line(line, goal, engine, depth_limit, time_limit)
+        statuses[record['status']] += 1
+        output.append(format_record(record, output_format) + '\n')
+        if keep_solutions and record['status'] != 'error':
+            moves = record['moves'] if record['status'] == 'ok' else None
+            solutions.append((parse_board(record['state']), moves))
+    return ''.join(output), statuses, solutions
+
+
+def iter_chunks(paths, size):
+    """
+    Divide las entradas en bloques de `size` tableros.
+    
+    Los archivos de texto se leen línea a línea a medida que se piden bloques;
+    de un corpus binario solo se envía el rango, que el proceso de trabajo lee
+    del archivo mapeado.
+    
+    Args:
+        paths: Archivos de texto o corpus binarios ('-' = entrada estándar)
+        size: Tableros por bloque
+    
+    Yields:
+        Listas de líneas o tuplas (ruta, inicio, fin)
+    """
+    for path in paths:
+        if path != '-' and is_corpus_file(path):
+            with CorpusFile(path) as corpus:
+                count = len(corpus)
+            for start in range(0, count, size):
+                yield (path, start, min(start + size, count))
+            continue
+        
+        f = sys.stdin if path == '-' else open(path)
+        try:
+            lines = (line.strip() for line in f)
+            lines = (line for line in lines if line and not line.startswith('#'))
+            while True:
+                chunk = list(itertools.islice(lines, size))
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            if f is not sys.stdin:
+                f.close()
+
+
+def run_batch(paths, out, goal=GOAL_BOARD, engine="A* Manhattan", workers=1,
+              chunk_size=DEFAULT_CHUNK_SIZE, max_pending=None, depth_limit=DEFAULT_DEPTH_LIMIT,
+              time_limit=None, output_format='tsv', corpus_writer=None):
+    """
+    Resuelve un flujo de tableros y escribe los resultados en orden.
+    
+    Args:
+        paths: Archivos de texto o corpus binarios ('-' = entrada estándar)
+        out: Archivo de texto de salida
+        goal: Estado objetivo (tupla plana)
+        engine: Uno de ENGINES
+        workers: Procesos de trabajo (0 = resolver en este proceso)
+        chunk_size: Tableros por bloque
+        max_pending: Bloques en curso como máximo (por defecto, 2 por proceso)
+        depth_limit: Límite de profundidad para "DFS Limitada"
+        time_limit: Tiempo máximo por búsqueda en segundos
+        output_format: 'tsv' o 'jsonl'
+        corpus_writer: CorpusWriter con soluciones donde guardar además los resultados
+    
+    Returns:
+        Counter con el número de tableros por resultado
+    """
+    options = (goal, engine, depth_limit, time_limit, output_format, corpus_writer is not None)
+    statuses = Counter()
+    
+    def emit(text, chunk_statuses, solutions):
+        out.write(text)
+        out.flush()
+        statuses.update(chunk_statuses)
+        if corpus_writer is not None:
+            for board, moves in solutions:
+                corpus_writer.add(board, moves)
+    
+    chunks = iter_chunks(paths, chunk_size)
+    if workers == 0:
+        for chunk in chunks:
+            emit(*solve_chunk(chunk, *options))
+        return statuses
+    
+    max_pending = max_pending or 2 * workers
+    initializer = warm_worker if engine == TABLE_ENGINE and goal == GOAL_BOARD else None
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=initializer)
+    try:
+        # Cola FIFO de bloques enviados: se escriben en el orden de entrada
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(solve_chunk, chunk, *options))
+            # Contrapresión: no leer más entrada hasta que salga el bloque más antiguo
+            if len(pending) >= max_pending:
+                emit(*pending.popleft().result())
+        while pending:
+            emit(*pending.popleft().result())
+    finally:
+        # Ante un error o Ctrl-C no esperar a los bloques pendientes
+        executor.shutdown(wait=False, cancel_futures=True)
+    return statuses
+
+
+def build_parser():
+    """Crea el parser de argumentos de la línea de comandos."""
+    parser = argparse.ArgumentParser(
+        prog="python -m utils.batch",
+        description="Resuelve tableros del 8-puzzle en flujo: uno por línea de entrada, "
+                    "un resultado por línea de salida, en el mismo orden."
+    )
+    parser.add_argument('inputs', nargs='*', default=['-'],
+                        help="Archivos con un tablero por línea o corpus binarios .8pz "
+                             "('-' o nada = entrada estándar)")
+    parser.add_argument('--engine', type=parse_engine, default="A* Manhattan",
+                        help="Motor: bfs, dfs, astar, table (tabla de distancias, óptimo) o "
+                             "weighted (A* ponderado, no óptimo). Por defecto, astar")
+    parser.add_argument('--goal', type=parse_board, default=GOAL_BOARD,
+                        help="Estado objetivo (por defecto 1,2,3,4,5,6,7,8,0)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Procesos de trabajo (0 = en el propio proceso)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="Tableros por bloque enviado a un proceso")
+    parser.add_argument('--max-pending', type=int, default=None,
+                        help="Bloques en curso como máximo (por defecto, 2 por proceso)")
+    parser.add_argument('--format', choices=('tsv', 'jsonl'), default='tsv',
+                        help="Formato de salida")
+    parser.add_argument('--timeout', type=float, default=None,
+                        help="Tiempo máximo por búsqueda en segundos")
+    parser.add_argument('--dfs-depth-limit', type=int, default=DEFAULT_DEPTH_LIMIT,
+                        help="Límite de profundidad de DFS Limitada")
+    parser.add_argument('--output-corpus', default=None,
+                        help="Guarda además los tableros válidos y sus soluciones en un corpus binario")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="Semilla que se anota en la cabecera de --output-corpus")
+    parser.add_argument('--quiet', action='store_true', help="No escribe el resumen en stderr")
+    return parser
+
+
+def main(argv=None):
+    """
+    Punto de entrada de la línea de comandos.
+    
+    Args:
+        argv: Lista de argumentos (por defecto, sys.argv[1:])
+    
+    Returns:
+        int: Código de salida (1 si algún tablero dio error o agotó el límite de tiempo)
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.workers < 0 or args.chunk_size < 1:
+        parser.error("--workers no puede ser negativo y --chunk-size debe ser al menos 1")
+    
+    corpus_writer = None
+    if args.output_corpus:
+        corpus_writer = CorpusWriter(args.output_corpus, goal=args.goal, seed=args.seed, with_solutions=True)
+    
+    start = time.perf_counter()
+    try:
+        statuses = run_batch(
+            args.inputs,
+            sys.stdout,
+            goal=args.goal,
+            engine=args.engine,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            max_pending=args.max_pending,
+            depth_limit=args.dfs_depth_limit,
+            time_limit=args.timeout,
+            output_format=args.format,
+            corpus_writer=corpus_writer
+        )
+        if corpus_writer is not None:
+            corpus_writer.close()
+    except BrokenPipeError:
+        # El consumidor cerró la salida (por ejemplo, `| head`): terminar sin traza.
+        # stdout se redirige a /dev/null para que el vaciado al salir no vuelva a fallar.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 0
+    except (OSError, ValueError) as error:
+        # Archivos que no se pueden leer o corpus binarios truncados o dañados
+        print(f"Error: {error}", file=sys.stderr)
+        return 2
+    
+    elapsed = time.perf_counter() - start
+    total = sum(statuses.values())
+    if not args.quiet:
+        counts = ", ".join(f"{status} {count}" for status, count in sorted(statuses.items()))
+        rate = total / elapsed if elapsed else 0.0
+        print(f"Tableros: {total} ({counts or 'ninguno'}) en {elapsed:.2f} s ({rate:.1f} tableros/s)",
+              file=sys.stderr)
+    return 1 if statuses['error'] or statuses['timeout'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,330 @@
+"""
+Benchmark de algoritmos en línea de comandos (sin interfaz gráfica).
+
+Ejemplo:
+    python -m utils.bench --algorithms bfs astar --cases 20 --seed 1 \
+        --repetitions 3 --workers 4 --timeout 10 --output-dir resultados
+
+Con --log cada resultado se escribe en un archivo JSONL en cuanto termina; si la
+ejecución se interrumpe, repetir el mismo comando con --resume continúa donde
+se quedó.
+
+Este módulo no importa Tkinter ni matplotlib, así que funciona en máquinas sin
+pantalla (CI, contenedores).
+"""
+import argparse
+import contextlib
+import csv
+import json
+import os
+import sys
+
+from models.encoding import parse_state
+from models.solver import ALGORITHMS, parse_algorithm
+from utils.corpus import CorpusFile, is_corpus_file
+from utils.metrics import AlgorithmMetrics
+from utils.result_log import RECORD_FIELDS
+
+
+def algorithm_argument(name):
+    """
+    Tipo de argparse para --algorithms: models.solver.parse_algorithm con el
+    error que argparse muestra al usuario.
+    
+    Args:
+        name: Alias ('bfs', 'dfs', 'astar') o nombre completo
+    
+    Returns:
+        str: Nombre del algoritmo tal como aparece en ALGORITHMS
+    """
+    try:
+        return parse_algorithm(name)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def parse_layers(text):
+    """
+    Convierte una lista de distancias ('5,10,15') o un rango ('10-20') en una lista.
+    """
+    layers = []
+    for part in text.split(','):
+        if '-' in part:
+            first, last = part.split('-')
+            layers.extend(range(int(first), int(last) + 1))
+        else:
+            layers.append(int(part))
+    return layers
+
+
+def load_corpus(path):
+    """
+    Lee un corpus de estados desde un archivo de texto, uno por línea, o
+    desde un corpus binario (.8pz, ver utils.corpus).
+    
+    En los archivos de texto, las líneas vacías y las que empiezan por '#' se
+    ignoran.
+    
+    Args:
+        path: Ruta del archivo
+    
+    Returns:
+        Lista de estados iniciales
+    """
+    if is_corpus_file(path):
+        with CorpusFile(path) as corpus:
+            return list(corpus)
+    
+    states = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                states.append(parse_state(line))
+    return states
+
+
+def format_summary(summary):
+    """
+    Genera la tabla de resumen en texto.
+    
+    Args:
+        summary: Resultado de AlgorithmMetrics.summarize()
+    
+    Returns:
+        str: Tabla con una fila por algoritmo
+    """
+    lines = [
+        f"{'Algoritmo':<15} | {'Éxito (%)':<10} | {'Límite':<6} | {'Mediana (s)':<12} | "
+        f"{'P95 (s)':<12} | {'Nodos':<10} | {'Longitud':<8} | {'Ruidosos':<8}",
+        "-" * 104
+    ]
+    for algo, row in summary.items():
+        lines.append(
+            f"{algo:<15} | {row['success_rate']:<10.1f} | {row['timeouts']:<6} | "
+            f"{row['median_time']:<12.6f} | {row['p95_time']:<12.6f} | "
+            f"{row['avg_nodes']:<10.1f} | {row['avg_length']:<8.1f} | {row['noisy_cases']}/{row['cases']}"
+        )
+    return "\n".join(lines)
+
+
+def write_outputs(args, config, metrics):
+    """
+    Escribe los archivos JSON, CSV, JSONL y NPZ pedidos en la línea de comandos.
+    
+    Los registros se recorren de nuevo para cada formato, sin cargarlos todos
+    en memoria.
+    
+    Args:
+        args: Argumentos de la línea de comandos
+        config: Configuración de la ejecución
+        metrics: AlgorithmMetrics con los resultados
+    """
+    json_path, csv_path, jsonl_path, npz_path = args.json, args.csv, args.jsonl, args.npz
+    summary = metrics.summarize()
+    records = metrics.iter_records
+    
+    # Con --output-dir se escriben los tres formatos con nombres por defecto
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+        json_path = json_path or os.path.join(args.output_dir, 'results.json')
+        csv_path = csv_path or os.path.join(args.output_dir, 'results.csv')
+        jsonl_path = jsonl_path or os.path.join(args.output_dir, 'results.jsonl')
+        npz_path = npz_path or os.path.join(args.output_dir, 'results.npz')
+    
+    if json_path:
+        with open(json_path, 'w') as f:
+            json.dump({'config': config, 'summary': summary, 'results': list(records())}, f, indent=2)
+    
+    if csv_path:
+        with open(csv_path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=RECORD_FIELDS, extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(records())
+    
+    if jsonl_path:
+        with open(jsonl_path, 'w') as f:
+            for record in records():
+                f.write(json.dumps(record) + "\n")
+    
+    if npz_path:
+        metrics.save_table(npz_path)
+
+
+def run_regression(metrics, args):
+    """
+    Modo --regression: compara con la referencia e imprime el resultado.
+    
+    Returns:
+        int: 0 si no hay regresiones, 1 en caso contrario
+    """
+    with contextlib.redirect_stdout(sys.stderr):
+        report = metrics.check_regression(
+            args.regression,
+            time_tolerance=args.time_tolerance,
+            workers=args.workers,
+            verbose=args.verbose
+        )
+    
+    print(format_summary(metrics.summarize()))
+    print()
+    for algo, row in report['timing'].items():
+        print(f"{algo}: tiempo x{row['ratio']:.2f} (IC x{row['ci_low']:.2f} - x{row['ci_high']:.2f})")
+    for message in report['improvements']:
+        print(f"MEJORA: {message}")
+    for message in report['regressions']:
+        print(f"REGRESIÓN: {message}")
+    
+    print("Sin regresiones." if report['passed'] else f"{len(report['regressions'])} regresiones detectadas.")
+    return 0 if report['passed'] else 1
+
+
+def build_parser():
+    """Crea el parser de argumentos de la línea de comandos."""
+    parser = argparse.ArgumentParser(
+        prog="python -m utils.bench",
+        description="Compara los algoritmos de búsqueda del 8-puzzle sin interfaz gráfica."
+    )
+    parser.add_argument('--algorithms', nargs='+', type=algorithm_argument, default=list(ALGORITHMS),
+                        help="Algoritmos a comparar: bfs, dfs, astar (por defecto, todos)")
+    parser.add_argument('--corpus', default='random',
+                        help="'random' (movimientos aleatorios), 'uniform' (estados resolubles "
+                             "uniformes), 'stratified' (muestreo uniforme por "
+                             "distancia óptima), ruta a un archivo con un estado por línea o "
+                             "ruta a un corpus binario .8pz")
+    parser.add_argument('--cases', type=int, default=5,
+                        help="Número de casos a generar con --corpus random o uniform")
+    parser.add_argument('--min-difficulty', type=int, default=5,
+                        help="Movimientos aleatorios mínimos desde el objetivo")
+    parser.add_argument('--max-difficulty', type=int, default=15,
+                        help="Movimientos aleatorios máximos desde el objetivo")
+    parser.add_argument('--per-layer', type=int, default=5,
+                        help="Casos por distancia óptima con --corpus stratified")
+    parser.add_argument('--layers', type=parse_layers, default=None,
+                        help="Distancias a incluir con --corpus stratified, por ejemplo '10-20' o '5,10,15'")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="Semilla para generar el corpus aleatorio")
+    parser.add_argument('--repetitions', type=int, default=1,
+                        help="Ejecuciones medidas por (estado, algoritmo); se informa la mediana")
+    parser.add_argument('--warmup', type=int, default=0,
+                        help="Ejecuciones de calentamiento (no medidas) por caso")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Número de procesos en paralelo")
+    parser.add_argument('--timeout', type=float, default=None,
+                        help="Tiempo máximo por búsqueda en segundos")
+    parser.add_argument('--dfs-depth-limit', type=int, default=20,
+                        help="Límite de profundidad de DFS Limitada")
+    parser.add_argument('--instrument', action='store_true',
+                        help="Mide el tiempo de cada fase de la búsqueda")
+    parser.add_argument('--output-dir', default=None,
+                        help="Directorio donde escribir results.json, results.csv, results.jsonl y results.npz")
+    parser.add_argument('--json', default=None, help="Ruta del archivo JSON de resultados")
+    parser.add_argument('--csv', default=None, help="Ruta del archivo CSV de resultados")
+    parser.add_argument('--jsonl', default=None, help="Ruta del archivo JSONL de resultados")
+    parser.add_argument('--npz', default=None,
+                        help="Ruta de la tabla columnar de resultados (NumPy .npz)")
+    parser.add_argument('--save-corpus', default=None,
+                        help="Guarda los estados (con la semilla y las soluciones del primer "
+                             "algoritmo) en un corpus binario .8pz")
+    parser.add_argument('--log', default=None,
+                        help="Archivo JSONL donde se escribe cada resultado en cuanto termina")
+    parser.add_argument('--resume', action='store_true',
+                        help="Con --log, continúa una ejecución interrumpida omitiendo los casos registrados")
+    parser.add_argument('--save-baseline', default=None,
+                        help="Guarda los resultados como referencia para --regression")
+    parser.add_argument('--regression', default=None,
+                        help="Ejecuta el corpus de un archivo de referencia y sale con código 1 "
+                             "si hay regresiones (nodos, longitud, caminos inválidos o tiempo)")
+    parser.add_argument('--time-tolerance', type=float, default=0.10,
+                        help="Ralentización relativa tolerada en modo --regression (0.10 = 10 %%)")
+    parser.add_argument('--verbose', action='store_true', help="Muestra el progreso en stderr")
+    return parser
+
+
+def main(argv=None):
+    """
+    Punto de entrada de la línea de comandos.
+    
+    Args:
+        argv: Lista de argumentos (por defecto, sys.argv[1:])
+    
+    Returns:
+        int: Código de salida
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.resume and not args.log:
+        parser.error("--resume requiere --log")
+    if args.log and args.save_baseline:
+        parser.error("--save-baseline no se puede combinar con --log")
+    
+    metrics = AlgorithmMetrics(dfs_depth_limit=args.dfs_depth_limit)
+    
+    if args.regression:
+        return run_regression(metrics, args)
+    
+    # Preparar el corpus
+    if args.corpus == 'random':
+        states = metrics.generate_test_cases(
+            num_cases=args.cases,
+            min_difficulty=args.min_difficulty,
+            max_difficulty=args.max_difficulty,
+            seed=args.seed
+        )
+    elif args.corpus == 'uniform':
+        states = metrics.generate_uniform_cases(num_cases=args.cases, seed=args.seed)
+    elif args.corpus == 'stratified':
+        states = metrics.generate_stratified_cases(
+            per_layer=args.per_layer,
+            layers=args.layers,
+            seed=args.seed if args.seed is not None else 0
+        )
+    else:
+        states = load_corpus(args.corpus)
+    
+    # El progreso va a stderr para no mezclarse con la tabla de resumen
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            metrics.run_benchmark(
+                states,
+                algorithms=args.algorithms,
+                instrument=args.instrument,
+                repetitions=args.repetitions,
+                warmup=args.warmup,
+                workers=args.workers,
+                time_limit=args.timeout,
+                verbose=args.verbose,
+                log_path=args.log,
+                resume=args.resume
+            )
+    except ValueError as error:
+        # Registro de otro corpus al reanudar
+        print(f"Error: {error}", file=sys.stderr)
+        return 2
+    
+    config = {
+        'algorithms': args.algorithms,
+        'corpus': args.corpus,
+        'cases': len(states),
+        'seed': args.seed,
+        'repetitions': args.repetitions,
+        'warmup': args.warmup,
+        'workers': args.workers,
+        'timeout': args.timeout,
+        'dfs_depth_limit': args.dfs_depth_limit
+    }
+    write_outputs(args, config, metrics)
+    
+    if args.save_corpus:
+        metrics.save_corpus(args.save_corpus, states, algorithm=args.algorithms[0], seed=args.seed)
+    
+    if args.save_baseline:
+        with contextlib.redirect_stdout(sys.stderr):
+            metrics.save_baseline(args.save_baseline)
+    
+    print(format_summary(metrics.summarize()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
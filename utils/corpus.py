@@ -0,0 +1,486 @@
+"""
+Formato binario versionado para corpus de tableros y sus soluciones (.8pz).
+
+Ejemplos:
+    python -m utils.corpus pack tableros.txt corpus.8pz --seed 1
+    python -m utils.corpus info corpus.8pz
+    python -m utils.corpus unpack corpus.8pz | head
+
+Estructura del archivo (little-endian, secciones alineadas a 8 bytes):
+    
+    cabecera (64 bytes)   magic '8PZC', versión, lado del tablero, flags,
+                          número de tableros, objetivo empaquetado, semilla y
+                          número total de movimientos
+    estados               uint64 por tablero: 4 bits por casilla, la primera en
+                          los bits más significativos (models.encoding.pack_state)
+    longitudes            int16 por tablero, -1 = sin solución (solo con soluciones)
+    offsets               uint64 por tablero + 1: primer movimiento de cada solución
+    movimientos           2 bits por movimiento (U=0, D=1, L=2, R=3), cuatro por
+                          byte empezando por los bits altos, sin huecos entre soluciones
+
+CorpusFile abre el archivo con mmap y expone las secciones como arrays de
+NumPy sin copiarlas: abrir un corpus de millones de tableros es inmediato, y
+varios procesos que abren el mismo archivo comparten las páginas en memoria.
+"""
+import argparse
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from models.encoding import pack_board
+from models.solver import MOVE_CODES
+from utils.lazy import lazy_import
+
+# NumPy se carga en el primer uso, no al importar el módulo
+np = lazy_import('numpy')
+
+# Identificación y versión del formato
+MAGIC = b'8PZC'
+FORMAT_VERSION = 1
+
+# Extensión recomendada
+CORPUS_SUFFIX = '.8pz'
+
+# magic, versión, lado, flags, tableros, objetivo, semilla, movimientos totales
+HEADER = struct.Struct('<4sHBBQQqQ')
+HEADER_SIZE = 64
+
+# Bits de flags
+HAS_SOLUTIONS = 1
+HAS_SEED = 2
+
+# Código de 2 bits de cada movimiento ('U', 'D', 'L', 'R' en el orden de MOVE_CODES)
+MOVE_LETTERS = ''.join(MOVE_CODES.values())
+LETTER_BITS = {letter: code for code, letter in enumerate(MOVE_LETTERS)}
+
+# Longitud guardada para los tableros sin solución
+NO_SOLUTION = -1
+
+# Movimientos como máximo por solución (las longitudes se guardan en int16)
+MAX_MOVES = 2 ** 15 - 1
+
+
+def _align(offset):
+    """Redondea un desplazamiento al siguiente múltiplo de 8."""
+    return (offset + 7) & ~7
+
+
+def pad_rows(values, counts):
+    """
+    Reparte un array plano en las filas de una matriz rellena con ceros.
+    
+    Args:
+        values: Array plano con los elementos de todas las filas seguidos
+        counts: Número de elementos de cada fila
+    
+    Returns:
+        Array de forma (len(counts), max(counts)) con el tipo de `values`
+    """
+    counts = np.asarray(counts, dtype=np.int64)
+    width = int(counts.max()) if len(counts) else 0
+    matrix = np.zeros((len(counts), width), dtype=values.dtype)
+    
+    # Fila y columna de cada elemento: la columna es su posición dentro de la fila
+    rows = np.repeat(np.arange(len(counts)), counts)
+    starts = np.cumsum(counts) - counts
+    columns = np.arange(len(values)) - np.repeat(starts, counts)
+    matrix[rows, columns] = values
+    return matrix
+
+
+def is_corpus_file(path):
+    """Indica si un archivo empieza por la marca del formato binario."""
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+class CorpusWriter:
+    """
+    Escribe un corpus binario tablero a tablero.
+    
+    Los estados y los movimientos se acumulan en arrays compactos (8 bytes por
+    tablero más 2 bits por movimiento) y el archivo se escribe al cerrar.
+    
+    Uso:
+        with CorpusWriter('corpus.8pz', seed=1, with_solutions=True) as writer:
+            writer.add((1, 2, 3, 4, 5, 6, 7, 0, 8), 'R')
+    """
+    def __init__(self, path, size=3, goal=None, seed=None, with_solutions=False):
+        """
+        Args:
+            path: Ruta del archivo
+            size: Lado del tablero (hasta 4: el estado cabe en 64 bits)
+            goal: Estado objetivo plano (por defecto, 1..n-1 y el hueco al final)
+            seed: Semilla con la que se generó el corpus (None = no se guarda)
+            with_solutions: Si es True, cada tablero lleva su solución
+        """
+        if not 2 <= size <= 4:
+            raise ValueError("El formato admite tableros de 2x2 a 4x4")
+        cells = size * size
+        self.path = path
+        self.size = size
+        self.goal = tuple(goal) if goal is not None else tuple(range(1, cells)) + (0,)
+        self.seed = seed
+        self.with_solutions = with_solutions
+        
+        self.states = array('Q')
+        self.lengths = array('h')
+        self.offsets = array('Q', [0])
+        self.moves = bytearray()
+        self._total_moves = 0
+    
+    def add(self, board, moves=None):
+        """
+        Añade un tablero.
+        
+        Args:
+            board: Tablero plano (tupla o lista) o array NumPy
+            moves: Solución como cadena 'UDLR' (None = sin solución). Solo con
+                with_solutions.
+        """
+        if hasattr(board, 'ravel'):
+            board = board.ravel().tolist()
+        if sorted(board) != list(range(self.size * self.size)):
+            raise ValueError(f"Tablero inválido: {board} (deben estar los números del 0 al {self.size * self.size - 1})")
+        
+        # Validar todo antes de tocar los arrays: un error no puede dejar
+        # states, lengths y offsets desalineados
+        if moves is not None:
+            if not self.with_solutions:
+                raise ValueError("El corpus se creó sin soluciones")
+            if not set(moves) <= LETTER_BITS.keys():
+                raise ValueError(f"Movimientos inválidos: {moves!r} (solo se admiten las letras {MOVE_LETTERS})")
+            if len(moves) > MAX_MOVES:
+                raise ValueError(f"Solución demasiado larga: {len(moves)} movimientos (máximo {MAX_MOVES})")
+        
+        self.states.append(pack_board(board))
+        if not self.with_solutions:
+            return
+        
+        self.lengths.append(NO_SOLUTION if moves is None else len(moves))
+        for letter in moves or '':
+            position = self._total_moves
+            if position % 4 == 0:
+                self.moves.append(0)
+            self.moves[-1] |= LETTER_BITS[letter] << (6 - 2 * (position % 4))
+            self._total_moves += 1
+        self.offsets.append(self._total_moves)
+    
+    def close(self):
+        """Escribe el archivo."""
+        flags = (HAS_SOLUTIONS if self.with_solutions else 0) | (HAS_SEED if self.seed is not None else 0)
+        header = HEADER.pack(
+            MAGIC, FORMAT_VERSION, self.size, flags, len(self.states),
+            pack_board(self.goal), self.seed or 0, self._total_moves
+        )
+        
+        # Se escribe a un temporal y se renombra: un lector nunca ve un archivo a medias
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(header.ljust(HEADER_SIZE, b'\0'))
+            self._write_section(f, self.states)
+            if self.with_solutions:
+                self._write_section(f, self.lengths)
+                self._write_section(f, self.offsets)
+                f.write(self.moves)
+        os.replace(tmp_path, self.path)
+    
+    @staticmethod
+    def _write_section(f, values):
+        """Escribe un array en little-endian y rellena hasta múltiplo de 8."""
+        if sys.byteorder != 'little':
+            values = array(values.typecode, values)
+            values.byteswap()
+        values.tofile(f)
+        f.write(b'\0' * (_align(f.tell()) - f.tell()))
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        return False
+
+
+def write_corpus(path, boards, solutions=None, goal=None, seed=None, size=3):
+    """
+    Escribe un corpus completo.
+    
+    Args:
+        path: Ruta del archivo
+        boards: Iterable de tableros (planos o arrays)
+        solutions: Iterable de cadenas de movimientos (o None por tablero), en el
+            mismo orden. None = corpus sin soluciones.
+        goal: Estado objetivo plano
+        seed: Semilla del corpus
+        size: Lado del tablero
+    
+    Returns:
+        int: Número de tableros escritos
+    """
+    with CorpusWriter(path, size=size, goal=goal, seed=seed, with_solutions=solutions is not None) as writer:
+        if solutions is None:
+            for board in boards:
+                writer.add(board)
+        else:
+            for board, moves in zip(boards, solutions):
+                writer.add(board, moves)
+    return len(writer.states)
+
+
+class CorpusFile:
+    """
+    Lector de un corpus binario respaldado por mmap.
+    
+    Se comporta como una secuencia de estados (arrays size x size), de modo que
+    se puede pasar tal cual a AlgorithmMetrics.run_benchmark(). Las secciones
+    están en `states`, `lengths` y `offsets` como arrays de NumPy que apuntan
+    al archivo mapeado, sin copias.
+    """
+    def __init__(self, path):
+        """
+        Args:
+            path: Ruta del archivo .8pz
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        if len(self._mmap) < HEADER_SIZE:
+            raise ValueError(f"{path} no es un corpus binario (archivo demasiado corto)")
+        magic, version, size, flags, count, goal, seed, total_moves = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            raise ValueError(f"{path} no es un corpus binario")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{path} usa la versión {version} del formato (se admite la {FORMAT_VERSION})")
+        
+        self.version = version
+        self.size = size
+        self.count = count
+        self.seed = seed if flags & HAS_SEED else None
+        self.has_solutions = bool(flags & HAS_SOLUTIONS)
+        self.total_moves = total_moves
+        self.goal_code = goal
+        
+        cells = size * size
+        self._shifts = np.array([4 * (cells - 1 - i) for i in range(cells)], dtype=np.uint64)
+        
+        # Secciones como vistas del archivo mapeado
+        offset = HEADER_SIZE
+        self.states = np.frombuffer(self._mmap, dtype='<u8', count=count, offset=offset)
+        offset = _align(offset + 8 * count)
+        self.lengths = self.offsets = self._moves = None
+        if self.has_solutions:
+            self.lengths = np.frombuffer(self._mmap, dtype='<i2', count=count, offset=offset)
+            offset = _align(offset + 2 * count)
+            self.offsets = np.frombuffer(self._mmap, dtype='<u8', count=count + 1, offset=offset)
+            offset += 8 * (count + 1)
+            self._moves = np.frombuffer(self._mmap, dtype=np.uint8, count=(total_moves + 3) // 4, offset=offset)
+            offset += (total_moves + 3) // 4
+        
+        if offset > len(self._mmap):
+            raise ValueError(f"{path} está truncado")
+    
+    @property
+    def goal(self):
+        """Estado objetivo como tupla plana."""
+        return self._unpack_code(self.goal_code)
+    
+    def _unpack_code(self, code):
+        """Desempaqueta un estado en una tupla plana."""
+        cells = self.size * self.size
+        return tuple((code >> (4 * (cells - 1 - i))) & 0xF for i in range(cells))
+    
+    def __len__(self):
+        return self.count
+    
+    def __getitem__(self, index):
+        """Estado `index` como array size x size (admite índices negativos)."""
+        return np.array(self.board(index)).reshape(self.size, self.size)
+    
+    def __iter__(self):
+        for index in range(self.count):
+            yield self[index]
+    
+    def board(self, index):
+        """Estado `index` como tupla plana."""
+        return self._unpack_code(int(self.states[index]))
+    
+    def boards(self, start=0, stop=None):
+        """
+        Desempaqueta de una vez un rango de estados.
+        
+        Returns:
+            Array uint8 de forma (n, size * size)
+        """
+        codes = self.states[start:stop]
+        return ((codes[:, None] >> self._shifts[None, :]) & np.uint64(0xF)).astype(np.uint8)
+    
+    def moves(self, index):
+        """
+        Solución del tablero `index`.
+        
+        Returns:
+            str: Movimientos 'UDLR...', o None si no tiene solución
+        """
+        if not self.has_solutions:
+            raise ValueError("El corpus no contiene soluciones")
+        if index < 0:
+            index += self.count
+        if self.lengths[index] == NO_SOLUTION:
+            return None
+        first, last = int(self.offsets[index]), int(self.offsets[index + 1])
+        if first == last:
+            return ''
+        
+        # Bytes que contienen la solución y posición de cada movimiento en ellos
+        chunk = self._moves[first // 4:(last + 3) // 4]
+        positions = np.arange(first, last) - (first // 4) * 4
+        codes = (chunk[positions // 4] >> (6 - 2 * (positions % 4)).astype(np.uint8)) & 3
+        return ''.join(MOVE_LETTERS[code] for code in codes.tolist())
+    
+    def move_codes(self, start=0, stop=None):
+        """
+        Desempaqueta de una vez las soluciones de un rango de tableros.
+        
+        Returns:
+            Tupla (codes, lengths): matriz uint8 (n, longitud máxima) con el
+            código de 2 bits de cada movimiento (índice en MOVE_LETTERS, ceros
+            de relleno) y array con la longitud de cada solución (-1 = sin
+            solución), listos para utils.verify.verify_batch()
+        """
+        if not self.has_solutions:
+            raise ValueError("El corpus no contiene soluciones")
+        first, last, _ = slice(start, stop).indices(self.count)
+        lengths = self.lengths[first:last].astype(np.int64)
+        
+        # Movimientos del rango: son contiguos en la sección de movimientos
+        positions = np.arange(int(self.offsets[first]), int(self.offsets[last]))
+        codes = (self._moves[positions // 4] >> (6 - 2 * (positions % 4)).astype(np.uint8)) & 3
+        return pad_rows(codes, np.maximum(lengths, 0)), lengths
+    
+    def close(self):
+        """
+        Libera el mapeo.
+        
+        Las vistas (states, lengths, offsets) dejan de ser válidas; si queda
+        alguna referencia a ellas fuera del objeto, mmap no se puede cerrar y
+        se libera cuando se recoja la última.
+        """
+        self.states = self.lengths = self.offsets = self._moves = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+    
+    def __getstate__(self):
+        # Al enviarlo a otro proceso basta la ruta: el receptor mapea el mismo archivo
+        return {'path': self.path}
+    
+    def __setstate__(self, state):
+        self.__init__(state['path'])
+
+
+def read_text_boards(path):
+    """
+    Lee un archivo de texto con un tablero por línea (formato compacto).
+    
+    Las líneas vacías y las que empiezan por '#' se ignoran.
+    
+    Yields:
+        Tableros como listas planas de enteros
+    """
+    f = sys.stdin if path == '-' else open(path)
+    try:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                try:
+                    yield [int(num) for num in line.replace(',', ' ').split()]
+                except ValueError:
+                    raise ValueError(f"Tablero inválido: {line}")
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def build_parser():
+    """Crea el parser de argumentos de la línea de comandos."""
+    parser = argparse.ArgumentParser(
+        prog="python -m utils.corpus",
+        description="Convierte corpus de tableros entre texto y el formato binario .8pz."
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+    
+    pack = commands.add_parser('pack', help="Texto (un tablero por línea) a binario")
+    pack.add_argument('input', help="Archivo de texto ('-' = entrada estándar)")
+    pack.add_argument('output', help="Archivo .8pz")
+    pack.add_argument('--seed', type=int, default=None, help="Semilla con la que se generó el corpus")
+    pack.add_argument('--size', type=int, default=3, help="Lado del tablero")
+    
+    info = commands.add_parser('info', help="Muestra la cabecera y el tamaño de un corpus")
+    info.add_argument('input', help="Archivo .8pz")
+    
+    unpack = commands.add_parser('unpack', help="Binario a texto (con la solución si la tiene)")
+    unpack.add_argument('input', help="Archivo .8pz")
+    return parser
+
+
+def main(argv=None):
+    """
+    Punto de entrada de la línea de comandos.
+    
+    Returns:
+        int: Código de salida
+    """
+    args = build_parser().parse_args(argv)
+    try:
+        if args.command == 'pack':
+            count = write_corpus(args.output, read_text_boards(args.input), seed=args.seed, size=args.size)
+            print(f"{count} tableros escritos en {args.output} ({os.path.getsize(args.output)} bytes)",
+                  file=sys.stderr)
+        elif args.command == 'info':
+            with CorpusFile(args.input) as corpus:
+                print(f"Versión: {corpus.version}")
+                print(f"Tablero: {corpus.size}x{corpus.size}")
+                print(f"Objetivo: {','.join(map(str, corpus.goal))}")
+                print(f"Semilla: {corpus.seed}")
+                print(f"Tableros: {len(corpus)}")
+                if corpus.has_solutions:
+                    solved = int((corpus.lengths >= 0).sum())
+                    print(f"Soluciones: {solved} ({corpus.total_moves} movimientos)")
+                print(f"Tamaño: {os.path.getsize(args.input)} bytes")
+        else:
+            with CorpusFile(args.input) as corpus:
+                for index in range(len(corpus)):
+                    line = ','.join(map(str, corpus.board(index)))
+                    if corpus.has_solutions:
+                        moves = corpus.moves(index)
+                        line += '\t' + ('-' if moves is None else moves)
+                    sys.stdout.write(line + '\n')
+    except BrokenPipeError:
+        # El consumidor cerró la salida (por ejemplo, `| head`): terminar sin traza
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 0
+    except (OSError, ValueError) as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+import importlib
+import importlib.util
+import sys
+
+
+def lazy_import(name):
+    """
+    Importa un módulo de forma diferida.
+    
+    El módulo se registra en sys.modules pero su código no se ejecuta hasta el
+    primer acceso a uno de sus atributos (importlib.util.LazyLoader). Así el
+    núcleo del juego (modelo, solucionadores, tablas) se puede importar sin
+    pagar el arranque de NumPy hasta que realmente se usa.
+    
+    Tras la primera carga el objeto devuelto es un módulo normal, sin coste
+    adicional en cada acceso.
+    
+    Args:
+        name: Nombre completo del módulo (por ejemplo 'numpy')
+    
+    Returns:
+        El módulo (ya cargado si alguien lo importó antes)
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f"No se encontró el módulo {name}", name=name)
+    
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def preload(*names):
+    """
+    Carga ya los módulos indicados, aunque se hayan importado de forma diferida.
+    
+    La carga diferida de LazyLoader no es segura si varios hilos acceden a la
+    vez a un módulo aún sin cargar (Python < 3.12): uno de ellos puede ver el
+    módulo a medio ejecutar. Los programas con hilos (servidores) deben
+    llamar a esta función antes de empezar a atender peticiones.
+    
+    Args:
+        names: Nombres completos de los módulos
+    """
+    for name in names:
+        # Cualquier acceso a un atributo completa la carga del módulo diferido
+        importlib.import_module(name).__dict__
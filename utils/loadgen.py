@@ -0,0 +1,562 @@
+"""
+Generador de carga para dimensionar el servicio de resolución.
+
+Ejemplos:
+    # Bucle abierto: llegadas de Poisson a 20 peticiones/s durante 30 s contra el servicio
+    python -m utils.loadgen --target http://localhost:8000 --mode open --rate 20 --duration 30
+
+    # Bucle cerrado: 8 clientes que envían una petición tras otra, sin servidor
+    python -m utils.loadgen --target direct --workers 4 --mode closed --concurrency 8 --requests 200
+
+    # Mezcla de algoritmos y dificultades (distancia óptima al objetivo)
+    python -m utils.loadgen --mix astar=0.8,bfs=0.2 --layers 10-24 --seed 1
+
+En bucle abierto las peticiones llegan a su ritmo aunque las anteriores no
+hayan terminado, y la latencia se mide desde el instante previsto de llegada:
+si el destino se satura, la espera cuenta (no hay omisión coordinada). En
+bucle cerrado cada cliente espera su respuesta antes de enviar la siguiente,
+así que el ritmo lo marca el destino.
+
+El destino 'direct' resuelve con service.engine.solve_board (PuzzleSolver) en
+un ProcessPoolExecutor; una URL http:// envía POST /api/solve al servicio
+(service.server). El cliente HTTP usa asyncio directamente (solo biblioteca
+estándar).
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlsplit
+
+from models.distance_table import get_distance_table
+from models.encoding import unpack_state
+from service.engine import GOAL_BOARD, DEFAULT_DEPTH_LIMIT, solve_board, warm_worker
+from utils.bench import algorithm_argument, parse_layers, load_corpus
+from utils.lazy import lazy_import
+
+# NumPy se carga en el primer uso, no al importar el módulo
+np = lazy_import('numpy')
+
+# Resultados posibles de una petición
+OUTCOMES = ('ok', 'failed', 'timeout', 'rejected', 'error', 'dropped')
+
+# Percentiles de latencia del informe
+PERCENTILES = (50, 90, 95, 99)
+
+# Mezcla de algoritmos por defecto
+DEFAULT_MIX = "astar=1"
+
+# Distancias óptimas por defecto de los tableros sintéticos
+DEFAULT_LAYERS = "5-20"
+
+
+def parse_mix(text):
+    """
+    Convierte una mezcla 'astar=0.7,bfs=0.2,dfs=0.1' en pesos normalizados.
+    
+    Returns:
+        dict: Algoritmo -> probabilidad
+    """
+    weights = {}
+    for part in text.split(','):
+        name, _, weight = part.partition('=')
+        algorithm = algorithm_argument(name.strip())
+        try:
+            weights[algorithm] = float(weight) if weight else 1.0
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"peso inválido en la mezcla: {part}")
+    total = sum(weights.values())
+    if total <= 0 or any(weight < 0 for weight in weights.values()):
+        raise argparse.ArgumentTypeError("los pesos de la mezcla deben ser positivos")
+    return {algo: weight / total for algo, weight in weights.items()}
+
+
+class TrafficMix:
+    """
+    Genera las peticiones: un tablero y un algoritmo por llegada.
+    
+    Los tableros salen de un corpus (recorrido en ciclo) o, sin corpus, se
+    eligen al azar entre los estados con una distancia óptima de `layers`.
+    """
+    def __init__(self, mix, layers=None, corpus=None, seed=None):
+        """
+        Args:
+            mix: dict algoritmo -> probabilidad (ver parse_mix)
+            layers: Distancias óptimas de los tableros sintéticos
+            corpus: Lista de estados; si se indica, se usa en lugar de layers
+            seed: Semilla para reproducir la secuencia de peticiones
+        """
+        self.rng = random.Random(seed)
+        self.algorithms = list(mix)
+        self.weights = [mix[algo] for algo in self.algorithms]
+        self.corpus = [tuple(int(tile) for tile in np.asarray(state).ravel()) for state in corpus or []]
+        self.count = 0
+        
+        if not self.corpus:
+            table = get_distance_table()
+            layers = layers or parse_layers(DEFAULT_LAYERS)
+            self.layers = [table.layers[depth] for depth in layers if depth < len(table.layers)]
+            if not self.layers:
+                raise ValueError("Ninguna de las distancias pedidas existe en el 8-puzzle")
+    
+    def next_request(self):
+        """
+        Returns:
+            Tupla (tablero como tupla plana, algoritmo)
+        """
+        algorithm = self.rng.choices(self.algorithms, self.weights)[0]
+        if self.corpus:
+            board = self.corpus[self.count % len(self.corpus)]
+        else:
+            layer = self.rng.choice(self.layers)
+            board = tuple(unpack_state(layer[self.rng.randrange(len(layer))]).ravel().tolist())
+        self.count += 1
+        return board, algorithm
+
+
+def classify(result):
+    """Resultado de una búsqueda terminada: 'ok', 'failed' o 'timeout'."""
+    if result.get('timed_out'):
+        return 'timeout'
+    return 'ok' if result.get('success') else 'failed'
+
+
+class DirectTarget:
+    """
+    Destino sin servidor: solve_board en un ProcessPoolExecutor.
+    """
+    def __init__(self, workers=None, time_limit=None, depth_limit=DEFAULT_DEPTH_LIMIT):
+        """
+        Args:
+            workers: Número de procesos (None = número de CPU)
+            time_limit: Tiempo máximo por búsqueda en segundos
+            depth_limit: Límite de profundidad de DFS Limitada
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=warm_worker)
+        self.time_limit = time_limit
+        self.depth_limit = depth_limit
+    
+    def describe(self):
+        """Descripción del destino para el informe."""
+        return f"direct ({self.workers} procesos)"
+    
+    async def solve(self, board, algorithm):
+        """
+        Returns:
+            Tupla (resultado, motor que resolvió)
+        """
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            self.executor, solve_board, board, GOAL_BOARD, algorithm, self.depth_limit, self.time_limit
+        )
+        return classify(result), result['engine']
+    
+    async def close(self):
+        """Detiene los procesos sin esperar a las búsquedas pendientes."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class HttpTarget:
+    """
+    Destino HTTP: POST /api/solve de service.server con una conexión por petición.
+    """
+    def __init__(self, url, time_limit=None):
+        """
+        Args:
+            url: URL base del servicio (http://host:puerto)
+            time_limit: Tiempo máximo por búsqueda enviado en la petición
+        """
+        parts = urlsplit(url)
+        if parts.scheme != 'http' or not parts.hostname:
+            raise ValueError(f"URL no soportada: {url} (solo http://host:puerto)")
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.path = parts.path.rstrip('/') + '/api/solve'
+        self.time_limit = time_limit
+    
+    def describe(self):
+        """Descripción del destino para el informe."""
+        return f"http://{self.host}:{self.port}{self.path}"
+    
+    async def solve(self, board, algorithm):
+        """
+        Returns:
+            Tupla (resultado, motor que resolvió o None)
+        """
+        payload = {'state': ','.join(map(str, board)), 'algorithm': algorithm}
+        if self.time_limit is not None:
+            payload['timeout'] = self.time_limit
+        status, data = await self._post(payload)
+        
+        if status == 200:
+            return classify(data), data.get('engine')
+        if status == 504:
+            return 'timeout', None
+        if status == 503:
+            return 'rejected', None
+        return 'error', None
+    
+    async def _post(self, payload):
+        """Envía un POST con cuerpo JSON y devuelve (código, JSON de la respuesta)."""
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            body = json.dumps(payload).encode('utf-8')
+            writer.write(
+                f"POST {self.path} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\n"
+                f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+                f"Connection: close\r\n\r\n".encode('latin-1') + body
+            )
+            await writer.drain()
+            
+            status = int((await reader.readline()).split()[1])
+            length = None
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                if name.strip().lower() == 'content-length':
+                    length = int(value)
+            
+            data = await (reader.readexactly(length) if length is not None else reader.read())
+            return status, json.loads(data) if data else {}
+        finally:
+            writer.close()
+    
+    async def close(self):
+        """No hay conexiones persistentes que cerrar."""
+
+
+class LoadRecorder:
+    """
+    Acumula el resultado y la latencia de cada petición.
+    """
+    def __init__(self):
+        self.records = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+    
+    async def issue(self, target, board, algorithm, scheduled, timeout):
+        """
+        Envía una petición y registra su resultado.
+        
+        Args:
+            target: DirectTarget o HttpTarget
+            board: Tablero como tupla plana
+            algorithm: Algoritmo pedido
+            scheduled: Instante (perf_counter) desde el que se mide la latencia
+            timeout: Tiempo máximo de espera del cliente en segundos (None = sin límite)
+        """
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        engine = None
+        try:
+            outcome, engine = await asyncio.wait_for(target.solve(board, algorithm), timeout)
+        except asyncio.TimeoutError:
+            outcome = 'timeout'
+        except (OSError, ValueError, IndexError, asyncio.IncompleteReadError):
+            # Conexión rechazada o cortada, respuesta malformada
+            outcome = 'error'
+        finally:
+            self.in_flight -= 1
+        self.records.append((algorithm, engine, outcome, time.perf_counter() - scheduled))
+    
+    def drop(self, algorithm):
+        """Registra una llegada descartada por el límite de peticiones en curso del cliente."""
+        self.records.append((algorithm, None, 'dropped', 0.0))
+
+
+async def run_open_loop(target, mix, recorder, rate, duration=None, requests=None,
+                        timeout=None, max_in_flight=1000, seed=None):
+    """
+    Bucle abierto: llegadas de Poisson a `rate` peticiones por segundo.
+    
+    Args:
+        target: Destino de las peticiones
+        mix: TrafficMix
+        recorder: LoadRecorder
+        rate: Peticiones por segundo (media)
+        duration: Segundos de generación de llegadas
+        requests: Número de llegadas (el primero de los dos límites que se alcance)
+        timeout: Tiempo máximo de espera por petición
+        max_in_flight: Peticiones en curso a partir de las que las llegadas se
+            descartan (protege al propio generador)
+        seed: Semilla de los tiempos entre llegadas
+    
+    Returns:
+        float: Segundos desde la primera llegada hasta la última respuesta
+    """
+    rng = random.Random(seed)
+    tasks = set()
+    start = time.perf_counter()
+    next_arrival = start
+    sent = 0
+    
+    while (requests is None or sent < requests) and (duration is None or next_arrival - start < duration):
+        # Esperar hasta la llegada prevista (sin acumular el retraso del bucle de eventos)
+        delay = next_arrival - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        
+        board, algorithm = mix.next_request()
+        if recorder.in_flight >= max_in_flight:
+            recorder.drop(algorithm)
+        else:
+            task = asyncio.create_task(recorder.issue(target, board, algorithm, next_arrival, timeout))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        
+        sent += 1
+        next_arrival += rng.expovariate(rate)
+    
+    if tasks:
+        await asyncio.gather(*tasks)
+    return time.perf_counter() - start
+
+
+async def run_closed_loop(target, mix, recorder, concurrency, duration=None, requests=None,
+                          timeout=None, think_time=0.0):
+    """
+    Bucle cerrado: `concurrency` clientes que envían una petición al recibir la anterior.
+    
+    Args:
+        target: Destino de las peticiones
+        mix: TrafficMix
+        recorder: LoadRecorder
+        concurrency: Número de clientes simultáneos
+        duration: Segundos durante los que se envían peticiones
+        requests: Número total de peticiones
+        timeout: Tiempo máximo de espera por petición
+        think_time: Pausa de cada cliente entre respuesta y siguiente petición
+    
+    Returns:
+        float: Segundos desde la primera petición hasta la última respuesta
+    """
+    start = time.perf_counter()
+    sent = 0
+    
+    async def client():
+        nonlocal sent
+        while (requests is None or sent < requests) and (duration is None or time.perf_counter() - start < duration):
+            sent += 1
+            board, algorithm = mix.next_request()
+            await recorder.issue(target, board, algorithm, time.perf_counter(), timeout)
+            if think_time:
+                await asyncio.sleep(think_time)
+    
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return time.perf_counter() - start
+
+
+def summarize(records, elapsed):
+    """
+    Resume una ejecución.
+    
+    Args:
+        records: Lista de tuplas (algoritmo, motor, resultado, latencia) de LoadRecorder
+        elapsed: Duración de la ejecución en segundos
+    
+    Returns:
+        dict con requests, elapsed, throughput (respuestas ok por segundo),
+        completed_rate (respuestas de cualquier tipo por segundo), outcomes
+        (número por resultado), rates (fracción por resultado), latency
+        (percentiles, media y máximo de las respuestas recibidas, en segundos),
+        engines (respuestas por motor) y per_algorithm (lo mismo por algoritmo)
+    """
+    def describe(rows):
+        outcomes = dict.fromkeys(OUTCOMES, 0)
+        for row in rows:
+            outcomes[row[2]] += 1
+        
+        # Las peticiones descartadas por el cliente no tienen latencia
+        latencies = np.array([row[3] for row in rows if row[2] != 'dropped'], dtype=float)
+        latency = None
+        if latencies.size:
+            values = np.percentile(latencies, PERCENTILES)
+            latency = {f'p{p}': float(value) for p, value in zip(PERCENTILES, values)}
+            latency['mean'] = float(latencies.mean())
+            latency['max'] = float(latencies.max())
+        
+        total = len(rows)
+        return {
+            'requests': total,
+            'throughput': outcomes['ok'] / elapsed if elapsed else 0.0,
+            'completed_rate': (total - outcomes['dropped']) / elapsed if elapsed else 0.0,
+            'outcomes': outcomes,
+            'rates': {outcome: count / total if total else 0.0 for outcome, count in outcomes.items()},
+            'latency': latency
+        }
+    
+    summary = describe(records)
+    summary['elapsed'] = elapsed
+    
+    engines = {}
+    for row in records:
+        if row[1] is not None:
+            engines[row[1]] = engines.get(row[1], 0) + 1
+    summary['engines'] = engines
+    
+    algorithms = sorted({row[0] for row in records})
+    summary['per_algorithm'] = {
+        algo: describe([row for row in records if row[0] == algo]) for algo in algorithms
+    }
+    return summary
+
+
+def format_report(summary, config):
+    """
+    Genera el informe en texto.
+    
+    Args:
+        summary: Resultado de summarize()
+        config: Configuración de la ejecución
+    
+    Returns:
+        str: Informe
+    """
+    lines = [
+        f"Destino: {config['target']}  Modo: {config['mode']}  Duración: {summary['elapsed']:.2f} s",
+        f"Peticiones: {summary['requests']}  Throughput: {summary['throughput']:.2f} ok/s  "
+        f"Respuestas: {summary['completed_rate']:.2f}/s",
+        "Resultados: " + ", ".join(
+            f"{outcome} {count} ({summary['rates'][outcome] * 100:.1f} %)"
+            for outcome, count in summary['outcomes'].items() if count
+        ),
+    ]
+    if summary['engines']:
+        lines.append("Motores: " + ", ".join(f"{engine} {count}" for engine, count in summary['engines'].items()))
+    
+    header = f"{'Algoritmo':<15} | {'Peticiones':<10} | {'ok/s':<8} | " + " | ".join(
+        f"{f'p{p} (s)':<9}" for p in PERCENTILES
+    ) + f" | {'Máx (s)':<9} | {'Errores':<7} | {'Límite':<6}"
+    lines += ["", header, "-" * len(header)]
+    for algo, row in summary['per_algorithm'].items():
+        latency = row['latency'] or {}
+        cells = " | ".join(f"{latency.get(f'p{p}', 0.0):<9.4f}" for p in PERCENTILES)
+        errors = row['outcomes']['error'] + row['outcomes']['rejected'] + row['outcomes']['dropped']
+        lines.append(
+            f"{algo:<15} | {row['requests']:<10} | {row['throughput']:<8.2f} | {cells} | "
+            f"{latency.get('max', 0.0):<9.4f} | {errors:<7} | {row['outcomes']['timeout']:<6}"
+        )
+    return "\n".join(lines)
+
+
+def build_parser():
+    """Crea el parser de argumentos de la línea de comandos."""
+    parser = argparse.ArgumentParser(
+        prog="python -m utils.loadgen",
+        description="Genera carga contra el solucionador o el servicio HTTP y mide throughput y latencia."
+    )
+    parser.add_argument('--target', default='direct',
+                        help="'direct' (PuzzleSolver en procesos locales) o URL del servicio (http://host:puerto)")
+    parser.add_argument('--mode', choices=('open', 'closed'), default='open',
+                        help="Bucle abierto (llegadas a ritmo fijo) o cerrado (clientes que esperan la respuesta)")
+    parser.add_argument('--rate', type=float, default=10.0,
+                        help="Peticiones por segundo en bucle abierto (llegadas de Poisson)")
+    parser.add_argument('--concurrency', type=int, default=4,
+                        help="Clientes simultáneos en bucle cerrado")
+    parser.add_argument('--think-time', type=float, default=0.0,
+                        help="Pausa de cada cliente entre peticiones en bucle cerrado (segundos)")
+    parser.add_argument('--duration', type=float, default=None,
+                        help="Segundos de carga (por defecto 10 si no se indica --requests)")
+    parser.add_argument('--requests', type=int, default=None,
+                        help="Número total de peticiones")
+    parser.add_argument('--mix', type=parse_mix, default=parse_mix(DEFAULT_MIX),
+                        help="Mezcla de algoritmos con pesos, por ejemplo 'astar=0.7,bfs=0.2,dfs=0.1'")
+    parser.add_argument('--layers', type=parse_layers, default=None,
+                        help=f"Distancias óptimas de los tableros sintéticos, por ejemplo '10-20' "
+                             f"(por defecto {DEFAULT_LAYERS})")
+    parser.add_argument('--corpus', default=None,
+                        help="Archivo con un estado por línea (sustituye a los tableros sintéticos)")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="Semilla de la secuencia de peticiones y de llegadas")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Procesos del destino 'direct' (por defecto, número de CPU)")
+    parser.add_argument('--search-timeout', type=float, default=10.0,
+                        help="Tiempo máximo por búsqueda enviado al destino (segundos)")
+    parser.add_argument('--timeout', type=float, default=30.0,
+                        help="Tiempo máximo que el cliente espera cada respuesta (segundos)")
+    parser.add_argument('--max-in-flight', type=int, default=1000,
+                        help="Peticiones en curso a partir de las que el bucle abierto descarta llegadas")
+    parser.add_argument('--json', default=None, help="Ruta donde guardar el resumen en JSON")
+    return parser
+
+
+async def run(args):
+    """Ejecuta la carga descrita por los argumentos y devuelve (resumen, configuración)."""
+    corpus = load_corpus(args.corpus) if args.corpus else None
+    mix = TrafficMix(args.mix, layers=args.layers, corpus=corpus, seed=args.seed)
+    if args.target == 'direct':
+        target = DirectTarget(workers=args.workers, time_limit=args.search_timeout)
+    else:
+        target = HttpTarget(args.target, time_limit=args.search_timeout)
+    
+    duration = args.duration if args.duration is not None or args.requests is not None else 10.0
+    recorder = LoadRecorder()
+    try:
+        if args.mode == 'open':
+            elapsed = await run_open_loop(
+                target, mix, recorder, args.rate, duration=duration, requests=args.requests,
+                timeout=args.timeout, max_in_flight=args.max_in_flight, seed=args.seed
+            )
+        else:
+            elapsed = await run_closed_loop(
+                target, mix, recorder, args.concurrency, duration=duration, requests=args.requests,
+                timeout=args.timeout, think_time=args.think_time
+            )
+    finally:
+        await target.close()
+    
+    config = {
+        'target': target.describe(),
+        'mode': args.mode,
+        'rate': args.rate if args.mode == 'open' else None,
+        'concurrency': args.concurrency if args.mode == 'closed' else None,
+        'duration': duration,
+        'requests': args.requests,
+        'mix': args.mix,
+        'layers': args.layers,
+        'corpus': args.corpus,
+        'seed': args.seed,
+        'max_in_flight_observed': recorder.max_in_flight
+    }
+    return summarize(recorder.records, elapsed), config
+
+
+def main(argv=None):
+    """
+    Punto de entrada de la línea de comandos.
+    
+    Args:
+        argv: Lista de argumentos (por defecto, sys.argv[1:])
+    
+    Returns:
+        int: Código de salida (1 si ninguna petición terminó bien)
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.mode == 'open' and args.rate <= 0:
+        parser.error("--rate debe ser positivo")
+    if args.mode == 'closed' and args.concurrency < 1:
+        parser.error("--concurrency debe ser al menos 1")
+    
+    try:
+        summary, config = asyncio.run(run(args))
+    except ValueError as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 2
+    
+    print(format_report(summary, config))
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'config': config, 'summary': summary}, f, indent=2)
+    return 0 if summary['outcomes']['ok'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
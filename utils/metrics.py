@@ -1,23 +1,131 @@
+import gc
+import json
+import math
 import time
-import numpy as np
-import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
-import matplotlib.pyplot as plt
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 from models.puzzle import Puzzle
-from models.solver import PuzzleSolver
+from models.distance_table import get_distance_table
+from models.random_state import random_boards
+from models.encoding import format_state, parse_state
+from models.solver import PuzzleSolver, ALGORITHMS, TIMING_PHASES
+from utils.stats import describe, bootstrap_ci
+from utils.result_log import ResultLog, make_record
+from utils.result_table import ResultTable
+from utils.corpus import CorpusFile, write_corpus
+from utils.verify import verify_batch, describe_failure
+from utils.lazy import lazy_import
+from utils.telemetry import BENCHMARK_CASES, record_search
+
+# NumPy se carga en el primer uso, no al importar el módulo
+np = lazy_import('numpy')
+
+# Estado objetivo usado en todas las comparaciones
+GOAL_STATE = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+
+# Algoritmos que siempre devuelven un camino óptimo
+OPTIMAL_ALGORITHMS = ("BFS", "A* Manhattan")
+
+# Versión del formato de los archivos de referencia (baseline)
+BASELINE_VERSION = 1
+
+
+def run_case(state, algorithm, dfs_depth_limit=20, instrument=False, time_limit=None,
+             repetitions=1, warmup=0):
+    """
+    Resuelve un estado con un algoritmo, repitiendo la búsqueda si se pide.
+    
+    Las ejecuciones de calentamiento se descartan. Cada repetición medida se
+    cronometra con perf_counter_ns y con el recolector de basura desactivado,
+    para que una pausa de GC no se atribuya al algoritmo.
+    
+    Es una función de módulo para poder ejecutarla en un ProcessPoolExecutor.
+    
+    Args:
+        state: Estado inicial del tablero
+        algorithm: Nombre del algoritmo (ver ALGORITHMS)
+        dfs_depth_limit: Límite de profundidad para "DFS Limitada"
+        instrument: Si es True, incluye el desglose de tiempo por fase
+        time_limit: Tiempo máximo por búsqueda en segundos (None = sin límite)
+        repetitions: Número de ejecuciones medidas
+        warmup: Número de ejecuciones previas que no se miden
+    
+    Returns:
+        dict: Resultado de la última ejecución, con 'execution_time' igual a la
+        mediana, 'execution_times' con el tiempo de cada repetición,
+        'timing_stats' con el resumen estadístico (ver utils.stats.describe) y
+        'searches' con el resumen de cada búsqueda ejecutada, calentamiento
+        incluido (para utils.telemetry.record_search en el proceso principal).
+    """
+    solver = PuzzleSolver(
+        initial_state=state,
+        goal_state=np.array(GOAL_STATE),
+        instrument=instrument,
+        time_limit=time_limit
+    )
+    
+    searches = []
+    
+    def summary(run):
+        return {key: run[key] for key in ('success', 'timed_out', 'nodes_expanded', 'execution_time')}
+    
+    # Calentamiento (cachés, asignador de memoria, código de NumPy)
+    for _ in range(warmup):
+        warm = solver.solve(algorithm, depth_limit=dfs_depth_limit)
+        searches.append(summary(warm))
+        if warm['timed_out']:
+            break
+    
+    times_ns = []
+    gc_was_enabled = gc.isenabled()
+    for _ in range(repetitions):
+        # Partir de un heap limpio y medir sin GC
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter_ns()
+            result = solver.solve(algorithm, depth_limit=dfs_depth_limit)
+            times_ns.append(time.perf_counter_ns() - start)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        searches.append(summary(result))
+        
+        # No repetir búsquedas que agotan el límite de tiempo
+        if result['timed_out']:
+            break
+    
+    times = [ns / 1e9 for ns in times_ns]
+    result['execution_times'] = times
+    result['timing_stats'] = describe(times)
+    result['execution_time'] = result['timing_stats']['median']
+    result['searches'] = searches
+    return result
+
 
 class AlgorithmMetrics:
     """
     Clase para medir y comparar el rendimiento de diferentes algoritmos de búsqueda.
     """
-    def __init__(self):
-        """Inicializa el sistema de métricas."""
+    def __init__(self, dfs_depth_limit=20):
+        """
+        Inicializa el sistema de métricas.
+        
+        Args:
+            dfs_depth_limit: Límite de profundidad usado para "DFS Limitada"
+        """
         self.results = {}
+        self.dfs_depth_limit = dfs_depth_limit
+        self.run_settings = {}
+        
+        # Registro JSONL: si está definido, los resultados se leen de él
+        self.log = None
+        
+        # Tabla columnar de los resultados (se construye al agregarlos)
+        self._table = None
     
-    def run_benchmark(self, initial_states, algorithms=None):
+    def run_benchmark(self, initial_states, algorithms=None, instrument=False,
+                      repetitions=1, warmup=0, workers=1, time_limit=None, verbose=True,
+                      log_path=None, resume=False, progress=None, should_stop=None):
         """
         Ejecuta una comparación de rendimiento para varios estados iniciales
         y algoritmos.
@@ -25,47 +133,259 @@ class AlgorithmMetrics:
         Args:
             initial_states: Lista de estados iniciales para probar
             algorithms: Lista de algoritmos para probar. Si es None, se usan todos.
-            
+            instrument: Si es True, los solucionadores miden el tiempo de cada
+                fase de la búsqueda y el informe incluye el desglose.
+            repetitions: Número de ejecuciones medidas por (estado, algoritmo)
+            warmup: Número de ejecuciones de calentamiento (no medidas) por caso
+            workers: Número de procesos. Con más de uno los casos se reparten en
+                un ProcessPoolExecutor (los tiempos compiten por la CPU).
+            time_limit: Tiempo máximo por búsqueda en segundos (None = sin límite)
+            verbose: Si es True, imprime el progreso
+            log_path: Archivo JSONL donde se escribe cada resultado en cuanto
+                termina. Con un registro, los resultados no se guardan en memoria
+                (self.results queda vacío) y los informes y gráficos lo leen.
+            resume: Si es True, conserva el registro existente y omite los
+                (caso, algoritmo) que ya contiene.
+            progress: Función llamada tras cada resultado con (completados, total,
+                caso, algoritmo, resultado). Se llama desde el hilo que ejecuta
+                run_benchmark.
+            should_stop: Función sin argumentos que devuelve True para cancelar.
+                Los casos pendientes se descartan y sus entradas en self.results
+                quedan a None.
+        
         Returns:
-            Dictionary con los resultados para cada algoritmo y cada estado.
+            Dictionary con los resultados para cada algoritmo y cada estado
+            (vacío si se usa log_path).
         """
         if algorithms is None:
-            algorithms = ["BFS", "DFS Limitada", "A* Manhattan"]
-        
-        goal_state = np.array([[1, 2, 3], [4, 5, 6], [7, 8, 0]])
+            algorithms = list(ALGORITHMS)
         
-        results = {algo: [] for algo in algorithms}
+        self.results = {}
+        self.run_settings = {'repetitions': repetitions, 'warmup': warmup}
+        self._table = None
+        
+        # Casos ya registrados (solo al reanudar)
+        completed = {}
+        if log_path is not None:
+            self.log = ResultLog(log_path)
+            if resume:
+                self.log.repair()
+                completed = self.log.completed()
+            else:
+                self.log.reset()
+        else:
+            self.log = None
+            self.results = {algo: [None] * len(initial_states) for algo in algorithms}
         
-        # Para cada estado inicial
-        for i, state in enumerate(initial_states):
-            print(f"Evaluando estado {i+1}/{len(initial_states)}")
+        tasks = []
+        for case, state in enumerate(initial_states):
+            for algo in algorithms:
+                if (case, algo) in completed:
+                    if completed[(case, algo)] != format_state(state):
+                        raise ValueError(f"El registro {log_path} corresponde a otro corpus (caso {case})")
+                    continue
+                tasks.append((case, state, algo))
+        
+        if verbose and completed:
+            print(f"Reanudando: {len(completed)} resultados ya registrados, {len(tasks)} pendientes")
+        
+        # Distancia óptima real de cada caso (para las curvas de escalado)
+        table = get_distance_table(GOAL_STATE)
+        options = (self.dfs_depth_limit, instrument, time_limit, repetitions, warmup)
+        
+        done = 0
+        
+        def store(case, state, algo, result):
+            """Guarda un resultado en el registro o en memoria y avisa del progreso."""
+            nonlocal done
+            searches = result.pop('searches', [])
+            result['initial_state'] = state
+            result['optimal_length'] = table.distance(state)
+            if self.log is not None:
+                self.log.append(make_record(case, algo, result))
+            else:
+                self.results[algo][case] = result
             
-            # Crear el solucionador
-            solver = PuzzleSolver(initial_state=state, goal_state=goal_state)
+            # Cada búsqueda ejecutada (calentamiento incluido) cuenta una vez,
+            # con uno o varios procesos: el solucionador registra las de este
+            # proceso y las de los procesos hijos se suman aquí
+            if workers > 1:
+                for search in searches:
+                    record_search(algo, search)
+            BENCHMARK_CASES.inc(algo)
             
-            # Ejecutar cada algoritmo
-            for algo in algorithms:
-                print(f"  Ejecutando {algo}...")
-                
-                # Medir el tiempo de inicio
-                start_time = time.time()
-                
-                # Resolver con el algoritmo seleccionado
-                if algo == "BFS":
-                    result = solver.solve_bfs()
-                elif algo == "DFS Limitada":
-                    result = solver.solve_dfs_limited(depth_limit=20)
-                elif algo == "A* Manhattan":
-                    result = solver.solve_astar()
+            done += 1
+            if progress is not None:
+                progress(done, len(tasks), case, algo, result)
+        
+        def stopped():
+            return should_stop is not None and should_stop()
+        
+        try:
+            if workers > 1:
+                # multiprocessing solo se importa si se usan varios procesos
+                from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
                 
-                # Guardar los resultados
-                result['initial_state'] = state
-                results[algo].append(result)
+                # Repartir los casos entre los procesos y guardarlos según terminan
+                executor = ProcessPoolExecutor(max_workers=workers)
+                try:
+                    futures = {
+                        executor.submit(run_case, state, algo, *options): (case, state, algo)
+                        for case, state, algo in tasks
+                    }
+                    pending = set(futures)
+                    # Esperas cortas para atender una cancelación sin esperar al caso más lento
+                    while pending and not stopped():
+                        finished, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                        for future in finished:
+                            case, state, algo = futures[future]
+                            store(case, state, algo, future.result())
+                            if verbose:
+                                print(f"Completado {done}/{len(futures)}: caso {case + 1}, {algo}")
+                finally:
+                    # Ante un error, una cancelación o Ctrl-C no esperar a los casos pendientes
+                    executor.shutdown(wait=False, cancel_futures=True)
+            else:
+                for case, state, algo in tasks:
+                    if stopped():
+                        break
+                    if verbose:
+                        print(f"Evaluando estado {case + 1}/{len(initial_states)}: {algo}")
+                    store(case, state, algo, run_case(state, algo, *options))
+        finally:
+            if self.log is not None:
+                self.log.close()
+        
+        return self.results
+    
+    def load_log(self, log_path):
+        """
+        Usa un registro JSONL existente como fuente de los informes y gráficos.
+        
+        Args:
+            log_path: Ruta del archivo generado por run_benchmark(log_path=...)
+        """
+        self.log = ResultLog(log_path)
+        self.results = {}
+        self._table = None
+    
+    def load_table(self, table_path):
+        """
+        Usa una tabla columnar guardada con save_table() como fuente de los
+        informes y gráficos.
+        
+        Args:
+            table_path: Ruta del archivo .npz
+        """
+        self._table = ResultTable.load(table_path)
+        self.log = None
+        self.results = {}
+    
+    def save_table(self, table_path):
+        """
+        Guarda los resultados en formato columnar (.npz).
+        
+        Args:
+            table_path: Ruta del archivo
+        """
+        return self.aggregate().save(table_path)
+    
+    def save_corpus(self, corpus_path, initial_states, algorithm=None, seed=None):
+        """
+        Guarda los estados del benchmark en un corpus binario (.8pz).
+        
+        Args:
+            corpus_path: Ruta del archivo
+            initial_states: Estados iniciales, en el orden de los casos
+            algorithm: Si se indica, se guarda la solución encontrada por este
+                algoritmo en cada caso (None si no la encontró)
+            seed: Semilla con la que se generaron los estados
+        
+        Returns:
+            int: Número de tableros escritos
+        """
+        solutions = None
+        if algorithm is not None:
+            solutions = [None] * len(initial_states)
+            for record in self.iter_records():
+                if record['algorithm'] == algorithm and record['success']:
+                    solutions[record['case']] = record['moves']
+        return write_corpus(corpus_path, initial_states, solutions, seed=seed)
+    
+    @staticmethod
+    def load_corpus(corpus_path):
+        """
+        Abre un corpus binario guardado con save_corpus().
+        
+        Returns:
+            CorpusFile: Se puede recorrer como una lista de estados 3x3
+        """
+        return CorpusFile(corpus_path)
+    
+    def has_results(self):
+        """True si hay resultados en memoria, en el registro o en una tabla."""
+        if self._table is not None:
+            return len(self._table) > 0
+        if self.log is not None:
+            return self.log.exists()
+        return bool(self.results)
+    
+    def iter_records(self):
+        """
+        Recorre los resultados como registros compactos (ver make_record).
+        
+        Con un registro JSONL se leen del archivo línea a línea; en otro caso
+        se convierten los resultados en memoria.
+        
+        Yields:
+            Diccionarios de registro
+        """
+        if self.log is not None:
+            yield from self.log.iter_records()
+            return
+        
+        for algo, algo_results in self.results.items():
+            for case, res in enumerate(algo_results):
+                # Casos sin resultado si la ejecución se canceló
+                if res is not None:
+                    yield make_record(case, algo, res)
+    
+    def aggregate(self):
+        """
+        Convierte los resultados en una tabla columnar, en una sola pasada.
+        
+        La tabla se construye la primera vez y se reutiliza hasta la siguiente
+        ejecución, así que todos los informes y gráficos comparten las mismas
+        agregaciones.
+        
+        Returns:
+            ResultTable
+        """
+        if self._table is None:
+            self._table = ResultTable.from_records(self.iter_records())
+        return self._table
+    
+    def summarize(self, table=None):
+        """
+        Resume los resultados por algoritmo.
+        
+        Las estadísticas de tiempo (mediana, p95, desviación típica e intervalo
+        de confianza de la mediana) se calculan sobre el tiempo de cada caso
+        exitoso. 'noisy_cases' cuenta los casos cuyas repeticiones tienen
+        valores atípicos o mucha variación.
         
-        self.results = results
-        return results
+        Args:
+            table: Resultado de aggregate(). Si es None, se calcula.
+        
+        Returns:
+            dict: Algoritmo -> métricas agregadas (casos, éxitos, tiempos agotados,
+            tasa de éxito, promedios de tiempo, nodos y longitud de los casos
+            exitosos y estadísticas de tiempo)
+        """
+        table = table if table is not None else self.aggregate()
+        return table.summary()
     
-    def generate_test_cases(self, num_cases=5, min_difficulty=5, max_difficulty=25):
+    def generate_test_cases(self, num_cases=5, min_difficulty=5, max_difficulty=25, seed=None):
         """
         Genera casos de prueba aleatorios con diferentes niveles de dificultad.
         
@@ -73,11 +393,14 @@ class AlgorithmMetrics:
             num_cases: Número de casos a generar
             min_difficulty: Número mínimo de movimientos desde el estado objetivo
             max_difficulty: Número máximo de movimientos desde el estado objetivo
-            
+            seed: Semilla para reproducir los casos. Si es None, se usa el
+                generador global de NumPy.
+        
         Returns:
             Lista de estados iniciales.
         """
         test_cases = []
+        rng = np.random.RandomState(seed) if seed is not None else np.random
         
         # Generar varios casos con diferentes niveles de dificultad
         for _ in range(num_cases):
@@ -85,12 +408,12 @@ class AlgorithmMetrics:
             puzzle = Puzzle()
             
             # Determinar la dificultad (número de movimientos aleatorios)
-            difficulty = np.random.randint(min_difficulty, max_difficulty + 1)
+            difficulty = rng.randint(min_difficulty, max_difficulty + 1)
             
             # Realizar una serie de movimientos aleatorios
             for _ in range(difficulty):
                 moves = puzzle.get_possible_moves()
-                move = np.random.choice(moves)
+                move = rng.choice(moves)
                 puzzle.move(move)
             
             # Guardar el estado generado
@@ -98,34 +421,258 @@ class AlgorithmMetrics:
         
         return test_cases
     
+    def generate_uniform_cases(self, num_cases=5, seed=None):
+        """
+        Genera casos de prueba elegidos de forma uniforme entre todos los
+        estados resolubles (models.random_state), sin movimientos aleatorios.
+        
+        Args:
+            num_cases: Número de casos a generar
+            seed: Semilla para reproducir los casos
+        
+        Returns:
+            Lista de estados iniciales.
+        """
+        boards = random_boards(num_cases, seed=seed)
+        return [board.reshape(3, 3).astype(int) for board in boards]
+    
+    def generate_stratified_cases(self, per_layer=5, layers=None, seed=0):
+        """
+        Genera casos de prueba estratificados por distancia óptima exacta.
+        
+        A diferencia de generate_test_cases(), que aplica movimientos aleatorios
+        (y a menudo deshace los anteriores), aquí cada estado se elige de forma
+        uniforme entre todos los que están exactamente a `d` movimientos del
+        objetivo, usando la tabla de distancias construida por BFS.
+        
+        Args:
+            per_layer: Casos por distancia. Un entero (la misma cuota para todas
+                las capas) o un diccionario {distancia: cuota}.
+            layers: Distancias a incluir. Si es None, todas (0 a 31) o las claves
+                de per_layer si es un diccionario.
+            seed: Semilla para reproducir el corpus
+        
+        Returns:
+            Lista de estados iniciales ordenados por distancia óptima.
+        """
+        table = get_distance_table(GOAL_STATE)
+        rng = np.random.default_rng(seed)
+        
+        # Cuota de cada capa
+        if isinstance(per_layer, dict):
+            quotas = per_layer if layers is None else {d: per_layer.get(d, 0) for d in layers}
+        else:
+            if layers is None:
+                layers = range(table.max_distance + 1)
+            quotas = {d: per_layer for d in layers}
+        
+        test_cases = []
+        for depth in sorted(quotas):
+            if not 0 <= depth <= table.max_distance:
+                raise ValueError(f"Distancia fuera de rango: {depth} (máximo {table.max_distance})")
+            test_cases.extend(table.sample_layer(depth, quotas[depth], rng))
+        
+        return test_cases
+    
+    def scaling_by_depth(self, table=None):
+        """
+        Agrupa los resultados por distancia óptima del estado inicial.
+        
+        Args:
+            table: Resultado de aggregate(). Si es None, se calcula.
+        
+        Returns:
+            dict: Algoritmo -> {distancia: {'cases', 'successes', 'median_time',
+            'avg_nodes'}} (tiempo y nodos solo de los casos exitosos)
+        """
+        table = table if table is not None else self.aggregate()
+        return table.scaling()
+    
+    def verify_results(self):
+        """
+        Verifica todos los caminos devueltos con utils.verify.verify_batch(),
+        que reproduce a la vez las cadenas de movimientos de todos los casos.
+        
+        Las soluciones de los algoritmos óptimos (OPTIMAL_ALGORITHMS) también
+        se comparan con la distancia óptima del caso.
+        
+        Returns:
+            Lista de diccionarios {'algorithm', 'case', 'error'} con los caminos
+            incorrectos (vacía si todos son correctos)
+        """
+        keys, states, moves, optimal = [], [], [], []
+        for record in self.iter_records():
+            if not record['success']:
+                continue
+            keys.append((record['algorithm'], record['case']))
+            states.append(parse_state(record['state']).ravel())
+            moves.append(record['moves'])
+            known = record['algorithm'] in OPTIMAL_ALGORITHMS and record['optimal_length'] is not None
+            optimal.append(record['optimal_length'] if known else -1)
+        if not keys:
+            return []
+        
+        report = verify_batch(np.array(states), moves, goal=GOAL_STATE, oracle=optimal)
+        failures = []
+        for index in np.flatnonzero(~report['valid']):
+            algo, case = keys[index]
+            failures.append({'algorithm': algo, 'case': case, 'error': describe_failure(report, index)})
+        return failures
+    
+    def save_baseline(self, baseline_path):
+        """
+        Guarda los resultados actuales como referencia para check_regression().
+        
+        El archivo fija el corpus, los algoritmos y las repeticiones usadas, de
+        modo que la comprobación repite exactamente la misma ejecución.
+        
+        Args:
+            baseline_path: Ruta del archivo JSON
+        """
+        if not self.results:
+            # El registro JSONL no guarda los tiempos de cada repetición
+            raise ValueError("La referencia requiere una ejecución sin registro (log_path=None)")
+        
+        algorithms = list(self.results.keys())
+        first = self.results[algorithms[0]]
+        
+        baseline = {
+            'version': BASELINE_VERSION,
+            'config': {
+                'algorithms': algorithms,
+                'dfs_depth_limit': self.dfs_depth_limit,
+                'repetitions': self.run_settings['repetitions'],
+                'warmup': self.run_settings['warmup']
+            },
+            'corpus': [format_state(res['initial_state']) for res in first],
+            'results': {
+                algo: [
+                    {
+                        'success': res['success'],
+                        'nodes_expanded': res['nodes_expanded'],
+                        'path_length': res['path_length'],
+                        'execution_times': res.get('execution_times', [res['execution_time']])
+                    }
+                    for res in algo_results
+                ]
+                for algo, algo_results in self.results.items()
+            }
+        }
+        
+        with open(baseline_path, 'w') as f:
+            json.dump(baseline, f, indent=1)
+        
+        print(f"Referencia guardada: {baseline_path}")
+        return baseline_path
+    
+    def check_regression(self, baseline_path, time_tolerance=0.10, confidence=0.95,
+                         workers=1, verbose=True):
+        """
+        Ejecuta el corpus fijado en un archivo de referencia y lo compara con ella.
+        
+        - Nodos expandidos, éxito y longitud del camino deben coincidir exactamente.
+        - Todas las cadenas de movimientos se reproducen a la vez con
+          utils.verify.verify_batch() (verify_results); las de los algoritmos
+          óptimos deben tener además la longitud óptima del caso.
+        - El tiempo se compara con la media geométrica de la razón
+          actual/referencia por caso: hay regresión si el límite inferior de su
+          intervalo de confianza bootstrap supera 1 + time_tolerance.
+        
+        Args:
+            baseline_path: Ruta del archivo generado por save_baseline()
+            time_tolerance: Ralentización relativa tolerada (0.10 = 10 %)
+            confidence: Nivel de confianza del intervalo
+            workers: Número de procesos
+            verbose: Si es True, imprime el progreso
+        
+        Returns:
+            dict con 'passed' (bool), 'regressions' (lista de mensajes),
+            'improvements' (lista de mensajes) y 'timing' (razón de tiempos e
+            intervalo por algoritmo)
+        """
+        with open(baseline_path) as f:
+            baseline = json.load(f)
+        
+        if baseline.get('version') != BASELINE_VERSION:
+            raise ValueError(f"Versión de referencia no soportada: {baseline.get('version')}")
+        
+        config = baseline['config']
+        self.dfs_depth_limit = config['dfs_depth_limit']
+        states = [parse_state(text) for text in baseline['corpus']]
+        
+        self.run_benchmark(
+            states,
+            algorithms=config['algorithms'],
+            repetitions=config['repetitions'],
+            warmup=config['warmup'],
+            workers=workers,
+            verbose=verbose
+        )
+        
+        regressions = []
+        improvements = []
+        timing = {}
+        
+        # Corrección de los caminos
+        for failure in self.verify_results():
+            regressions.append(f"{failure['algorithm']} caso {failure['case']}: {failure['error']}")
+        
+        for algo in config['algorithms']:
+            log_ratios = []
+            for case, (res, ref) in enumerate(zip(self.results[algo], baseline['results'][algo])):
+                # Métricas deterministas: deben coincidir exactamente
+                for key in ('success', 'nodes_expanded', 'path_length'):
+                    if res[key] != ref[key]:
+                        regressions.append(f"{algo} caso {case}: {key} {ref[key]} -> {res[key]}")
+                
+                if res['success'] and ref['success']:
+                    ref_time = float(np.median(ref['execution_times']))
+                    if ref_time > 0 and res['execution_time'] > 0:
+                        log_ratios.append(math.log(res['execution_time'] / ref_time))
+            
+            if not log_ratios:
+                continue
+            
+            # Razón media (geométrica) de tiempos e intervalo de confianza
+            low, high = bootstrap_ci(log_ratios, statistic=np.mean, confidence=confidence)
+            ratio = math.exp(float(np.mean(log_ratios)))
+            timing[algo] = {'ratio': ratio, 'ci_low': math.exp(low), 'ci_high': math.exp(high)}
+            
+            if math.exp(low) > 1 + time_tolerance:
+                regressions.append(
+                    f"{algo}: tiempo x{ratio:.2f} respecto a la referencia "
+                    f"(IC {confidence:.0%}: x{math.exp(low):.2f} - x{math.exp(high):.2f})"
+                )
+            elif math.exp(high) < 1 / (1 + time_tolerance):
+                improvements.append(f"{algo}: tiempo x{ratio:.2f} respecto a la referencia")
+        
+        return {
+            'passed': not regressions,
+            'regressions': regressions,
+            'improvements': improvements,
+            'timing': timing
+        }
+    
     def plot_execution_time(self, figure=None):
         """
         Genera un gráfico comparativo de tiempos de ejecución.
         
         Args:
             figure: Figura de matplotlib para dibujar. Si es None, se crea una nueva.
-            
+        
         Returns:
             Figura de matplotlib con el gráfico.
         """
-        if not self.results:
+        if not self.has_results():
             print("No hay resultados para graficar. Ejecute run_benchmark primero.")
             return None
         
-        # Preparar los datos para el gráfico
-        algorithms = list(self.results.keys())
-        
-        # Calcular tiempos promedio
-        avg_times = {}
-        for algo in algorithms:
-            times = [res['execution_time'] for res in self.results[algo] if res['success']]
-            if times:
-                avg_times[algo] = sum(times) / len(times)
-            else:
-                avg_times[algo] = 0
+        # Calcular tiempos promedio (casos exitosos) del resumen de la tabla columnar
+        avg_times = {algo: row['avg_time'] for algo, row in self.summarize().items()}
         
         # Crear o usar la figura proporcionada
         if figure is None:
+            from matplotlib.figure import Figure
             fig = Figure(figsize=(8, 5))
         else:
             fig = figure
@@ -157,28 +704,20 @@ class AlgorithmMetrics:
         
         Args:
             figure: Figura de matplotlib para dibujar. Si es None, se crea una nueva.
-            
+        
         Returns:
             Figura de matplotlib con el gráfico.
         """
-        if not self.results:
+        if not self.has_results():
             print("No hay resultados para graficar. Ejecute run_benchmark primero.")
             return None
         
-        # Preparar los datos para el gráfico
-        algorithms = list(self.results.keys())
-        
-        # Calcular nodos promedio
-        avg_nodes = {}
-        for algo in algorithms:
-            nodes = [res['nodes_expanded'] for res in self.results[algo] if res['success']]
-            if nodes:
-                avg_nodes[algo] = sum(nodes) / len(nodes)
-            else:
-                avg_nodes[algo] = 0
+        # Calcular nodos promedio (casos exitosos) del resumen de la tabla columnar
+        avg_nodes = {algo: row['avg_nodes'] for algo, row in self.summarize().items()}
         
         # Crear o usar la figura proporcionada
         if figure is None:
+            from matplotlib.figure import Figure
             fig = Figure(figsize=(8, 5))
         else:
             fig = figure
@@ -210,28 +749,20 @@ class AlgorithmMetrics:
         
         Args:
             figure: Figura de matplotlib para dibujar. Si es None, se crea una nueva.
-            
+        
         Returns:
             Figura de matplotlib con el gráfico.
         """
-        if not self.results:
+        if not self.has_results():
             print("No hay resultados para graficar. Ejecute run_benchmark primero.")
             return None
         
-        # Preparar los datos para el gráfico
-        algorithms = list(self.results.keys())
-        
-        # Calcular longitudes promedio
-        avg_length = {}
-        for algo in algorithms:
-            lengths = [res['path_length'] for res in self.results[algo] if res['success']]
-            if lengths:
-                avg_length[algo] = sum(lengths) / len(lengths)
-            else:
-                avg_length[algo] = 0
+        # Calcular longitudes promedio (casos exitosos) del resumen de la tabla columnar
+        avg_length = {algo: row['avg_length'] for algo, row in self.summarize().items()}
         
         # Crear o usar la figura proporcionada
         if figure is None:
+            from matplotlib.figure import Figure
             fig = Figure(figsize=(8, 5))
         else:
             fig = figure
@@ -257,6 +788,269 @@ class AlgorithmMetrics:
         fig.tight_layout()
         return fig
     
+    def plot_time_distribution(self, figure=None, kind='box'):
+        """
+        Genera un gráfico de la distribución de tiempos de cada algoritmo.
+        
+        Se dibuja a partir de percentiles e histogramas ya agregados en la tabla
+        columnar, así que el coste no depende del número de casos.
+        
+        Args:
+            figure: Figura de matplotlib para dibujar. Si es None, se crea una nueva.
+            kind: 'box' (caja p25-p75, bigotes p5-p95) o 'violin' (densidad por
+                intervalos logarítmicos)
+        
+        Returns:
+            Figura de matplotlib con el gráfico.
+        """
+        if not self.has_results():
+            print("No hay resultados para graficar. Ejecute run_benchmark primero.")
+            return None
+        
+        table = self.aggregate()
+        positions = np.arange(1, len(table.algorithms) + 1)
+        
+        # Crear o usar la figura proporcionada
+        if figure is None:
+            from matplotlib.figure import Figure
+            fig = Figure(figsize=(8, 5))
+        else:
+            fig = figure
+            fig.clear()
+        
+        ax = fig.add_subplot(111)
+        
+        if kind == 'violin':
+            # Silueta simétrica proporcional al histograma de cada algoritmo
+            edges, counts = table.histograms('execution_time')
+            if edges is not None:
+                centers = np.sqrt(edges[:-1] * edges[1:])
+                for position, row in zip(positions, counts):
+                    if row.max() > 0:
+                        width = row / row.max() * 0.4
+                        ax.fill_betweenx(centers, position - width, position + width,
+                                         color='skyblue', edgecolor='steelblue', alpha=0.8)
+            
+            # Mediana de cada algoritmo
+            stats = table.algorithm_stats('execution_time', quantiles=(0.5,))
+            solved = stats['count'] > 0
+            ax.scatter(positions[solved], stats['quantiles'][0.5][solved], color='black', s=15, zorder=3)
+            title = 'Distribución de tiempos de ejecución (punto: mediana)'
+        else:
+            # Diagrama de caja con los percentiles precalculados (sin datos crudos)
+            quantiles = (0.05, 0.25, 0.5, 0.75, 0.95)
+            stats = table.algorithm_stats('execution_time', quantiles=quantiles)
+            q = stats['quantiles']
+            boxes = []
+            box_positions = []
+            for i, algo in enumerate(table.algorithms):
+                if stats['count'][i]:
+                    boxes.append({
+                        'label': algo, 'whislo': q[0.05][i], 'q1': q[0.25][i], 'med': q[0.5][i],
+                        'q3': q[0.75][i], 'whishi': q[0.95][i], 'fliers': []
+                    })
+                    box_positions.append(positions[i])
+            if boxes:
+                ax.bxp(boxes, positions=box_positions, showfliers=False, patch_artist=True,
+                       boxprops={'facecolor': 'skyblue'}, medianprops={'color': 'black'})
+            title = 'Distribución de tiempos de ejecución (bigotes: p5-p95)'
+        
+        # Añadir etiquetas y título
+        ax.set_yscale('log')
+        ax.set_xticks(positions)
+        ax.set_xticklabels(table.algorithms)
+        ax.set_xlabel('Algoritmo')
+        ax.set_ylabel('Tiempo (segundos, escala log)')
+        ax.set_title(title)
+        
+        fig.tight_layout()
+        return fig
+    
+    def plot_scaling(self, figure=None):
+        """
+        Genera las curvas de tiempo y nodos expandidos frente a la distancia
+        óptima, en escala logarítmica.
+        
+        Args:
+            figure: Figura de matplotlib para dibujar. Si es None, se crea una nueva.
+        
+        Returns:
+            Figura de matplotlib con el gráfico.
+        """
+        if not self.has_results():
+            print("No hay resultados para graficar. Ejecute run_benchmark primero.")
+            return None
+        
+        # Mediana y rango intercuartílico por (algoritmo, distancia)
+        table = self.aggregate()
+        depths, times = table.depth_stats('execution_time', quantiles=(0.25, 0.5, 0.75))
+        _, nodes = table.depth_stats('nodes_expanded', quantiles=(0.5,))
+        if times is None:
+            print("Los resultados no incluyen la distancia óptima de los casos.")
+            return None
+        
+        # Crear o usar la figura proporcionada
+        if figure is None:
+            from matplotlib.figure import Figure
+            fig = Figure(figsize=(10, 5))
+        else:
+            fig = figure
+            fig.clear()
+        
+        ax_time = fig.add_subplot(121)
+        ax_nodes = fig.add_subplot(122)
+        
+        for i, algo in enumerate(table.algorithms):
+            solved = times['count'][i] > 0
+            if not solved.any():
+                continue
+            
+            x = depths[solved]
+            line, = ax_time.plot(x, times['quantiles'][0.5][i][solved], marker='o', markersize=3, label=algo)
+            ax_time.fill_between(x, times['quantiles'][0.25][i][solved], times['quantiles'][0.75][i][solved],
+                                 color=line.get_color(), alpha=0.2)
+            ax_nodes.plot(x, nodes['quantiles'][0.5][i][solved], marker='o', markersize=3,
+                          color=line.get_color(), label=algo)
+        
+        # Añadir etiquetas y título (los valores 0 no se dibujan en escala log)
+        ax_time.set_yscale('log', nonpositive='mask')
+        ax_time.set_xlabel('Distancia óptima')
+        ax_time.set_ylabel('Tiempo (segundos, mediana y p25-p75)')
+        ax_time.set_title('Tiempo según la distancia')
+        ax_time.legend(fontsize=8)
+        
+        ax_nodes.set_yscale('log', nonpositive='mask')
+        ax_nodes.set_xlabel('Distancia óptima')
+        ax_nodes.set_ylabel('Nodos expandidos (mediana)')
+        ax_nodes.set_title('Nodos según la distancia')
+        
+        fig.tight_layout()
+        return fig
+    
+    def plot_throughput(self, figure=None):
+        """
+        Genera un gráfico de nodos expandidos por segundo de cada algoritmo.
+        
+        Args:
+            figure: Figura de matplotlib para dibujar. Si es None, se crea una nueva.
+        
+        Returns:
+            Figura de matplotlib con el gráfico.
+        """
+        if not self.has_results():
+            print("No hay resultados para graficar. Ejecute run_benchmark primero.")
+            return None
+        
+        # Mediana y rango intercuartílico de nodos/s de los casos exitosos
+        table = self.aggregate()
+        stats = table.throughput_stats()
+        median = stats['quantiles'][0.5]
+        errors = [median - stats['quantiles'][0.25], stats['quantiles'][0.75] - median]
+        
+        # Crear o usar la figura proporcionada
+        if figure is None:
+            from matplotlib.figure import Figure
+            fig = Figure(figsize=(8, 5))
+        else:
+            fig = figure
+            fig.clear()
+        
+        ax = fig.add_subplot(111)
+        
+        # Crear el gráfico de barras
+        bars = ax.bar(table.algorithms, median, yerr=errors, capsize=4, color='plum')
+        
+        # Añadir etiquetas y título
+        ax.set_xlabel('Algoritmo')
+        ax.set_ylabel('Nodos expandidos por segundo (mediana)')
+        ax.set_title('Rendimiento de la búsqueda (barras de error: p25-p75)')
+        
+        # Añadir valores sobre las barras
+        for bar in bars:
+            height = bar.get_height()
+            ax.text(bar.get_x() + bar.get_width()/2., height,
+                   f'{int(height)}',
+                   ha='center', va='bottom')
+        
+        fig.tight_layout()
+        return fig
+    
+    def _write_timing_stats(self, f, summary):
+        """
+        Escribe en el informe la distribución de tiempos de cada algoritmo.
+        
+        Args:
+            f: Archivo abierto del informe
+            summary: Resultado de summarize()
+        """
+        f.write("ESTADÍSTICAS DE TIEMPO (casos exitosos, segundos)\n")
+        f.write("-" * 90 + "\n")
+        f.write(f"{'Algoritmo':<15} | {'Mediana':<10} | {'P95':<10} | {'Desv.':<10} | "
+                f"{'IC 95% mediana':<23} | {'Ruidosos':<8}\n")
+        f.write("-" * 90 + "\n")
+        
+        for algo, row in summary.items():
+            ci = f"[{row['ci_low']:.6f}, {row['ci_high']:.6f}]"
+            f.write(f"{algo:<15} | {row['median_time']:<10.6f} | {row['p95_time']:<10.6f} | "
+                    f"{row['std_time']:<10.6f} | {ci:<23} | {row['noisy_cases']}/{row['cases']}\n")
+        
+        f.write("-" * 90 + "\n\n")
+    
+    def _write_scaling(self, f, table):
+        """
+        Escribe en el informe el tiempo y los nodos según la distancia óptima.
+        
+        Args:
+            f: Archivo abierto del informe
+            table: Resultado de aggregate()
+        """
+        algorithms = table.algorithms
+        scaling = self.scaling_by_depth(table)
+        depths = sorted({d for algo in algorithms for d in scaling[algo]})
+        if len(depths) < 2:
+            return
+        
+        f.write("ESCALADO POR DISTANCIA ÓPTIMA (mediana de tiempo en ms / nodos promedio)\n")
+        f.write("-" * 70 + "\n")
+        f.write(f"{'Distancia':<10} | " + " | ".join(f"{algo:<22}" for algo in algorithms) + "\n")
+        f.write("-" * 70 + "\n")
+        
+        for depth in depths:
+            cells = []
+            for algo in algorithms:
+                row = scaling[algo].get(depth)
+                if row and row['successes']:
+                    cells.append(f"{row['median_time'] * 1000:>9.3f} / {row['avg_nodes']:<10.1f}")
+                else:
+                    cells.append(f"{'-':<22}")
+            f.write(f"{depth:<10} | " + " | ".join(cells) + "\n")
+        
+        f.write("-" * 70 + "\n\n")
+    
+    def _write_timing_breakdown(self, f, table):
+        """
+        Escribe en el informe el tiempo promedio de cada fase de la búsqueda.
+        
+        Args:
+            f: Archivo abierto del informe
+            table: Resultado de aggregate()
+        """
+        phases = TIMING_PHASES + ('other',)
+        rows = {algo: row for algo, row in table.breakdown().items() if row}
+        
+        if not rows:
+            return
+        
+        f.write("DESGLOSE DE TIEMPO POR FASE (promedio, milisegundos)\n")
+        f.write("-" * 90 + "\n")
+        f.write(f"{'Algoritmo':<15} | " + " | ".join(f"{phase:<9}" for phase in phases) + "\n")
+        f.write("-" * 90 + "\n")
+        
+        for algo, row in rows.items():
+            f.write(f"{algo:<15} | " + " | ".join(f"{row[phase] * 1000:<9.3f}" for phase in phases) + "\n")
+        
+        f.write("-" * 90 + "\n\n")
+    
     def generate_comparison_report(self, report_path="comparison_report.txt"):
         """
         Genera un informe comparativo de los algoritmos.
@@ -264,18 +1058,22 @@ class AlgorithmMetrics:
         Args:
             report_path: Ruta para guardar el informe.
         """
-        if not self.results:
+        if not self.has_results():
             print("No hay resultados para generar el informe. Ejecute run_benchmark primero.")
             return
         
+        # Agregaciones calculadas una sola vez sobre la tabla columnar
+        table = self.aggregate()
+        summary = self.summarize(table)
+        
         # Abrir el archivo para escribir
         with open(report_path, 'w') as f:
             f.write("INFORME COMPARATIVO DE ALGORITMOS DE BÚSQUEDA PARA 8-PUZZLE\n")
             f.write("=" * 70 + "\n\n")
             
             # Información general
-            algorithms = list(self.results.keys())
-            num_cases = len(self.results[algorithms[0]])
+            algorithms = list(summary.keys())
+            num_cases = max(row['cases'] for row in summary.values())
             f.write(f"Algoritmos evaluados: {', '.join(algorithms)}\n")
             f.write(f"Número de casos de prueba: {num_cases}\n\n")
             
@@ -285,58 +1083,45 @@ class AlgorithmMetrics:
             f.write(f"{'Algoritmo':<15} | {'Éxito (%)':<10} | {'Tiempo (s)':<12} | {'Nodos':<10} | {'Longitud':<8}\n")
             f.write("-" * 70 + "\n")
             
-            # Calcular métricas promedio para cada algoritmo
-            for algo in algorithms:
-                # Tasa de éxito
-                success_rate = sum(1 for res in self.results[algo] if res['success']) / num_cases * 100
-                
-                # Promedios (solo para casos exitosos)
-                successful_results = [res for res in self.results[algo] if res['success']]
-                
-                if successful_results:
-                    avg_time = sum(res['execution_time'] for res in successful_results) / len(successful_results)
-                    avg_nodes = sum(res['nodes_expanded'] for res in successful_results) / len(successful_results)
-                    avg_length = sum(res['path_length'] for res in successful_results) / len(successful_results)
-                else:
-                    avg_time = avg_nodes = avg_length = 0
-                
-                # Escribir fila de la tabla
-                f.write(f"{algo:<15} | {success_rate:<10.1f} | {avg_time:<12.6f} | {avg_nodes:<10.1f} | {avg_length:<8.1f}\n")
+            # Métricas promedio para cada algoritmo (solo casos exitosos)
+            for algo, row in summary.items():
+                f.write(f"{algo:<15} | {row['success_rate']:<10.1f} | {row['avg_time']:<12.6f} | "
+                        f"{row['avg_nodes']:<10.1f} | {row['avg_length']:<8.1f}\n")
             
             f.write("-" * 70 + "\n\n")
             
+            # Distribución de tiempos
+            self._write_timing_stats(f, summary)
+            
+            # Desglose de tiempo por fase (solo si se ejecutó con instrumentación)
+            self._write_timing_breakdown(f, table)
+            
+            # Escalado según la distancia óptima real de cada caso
+            self._write_scaling(f, table)
+            
             # Análisis y recomendaciones
             f.write("ANÁLISIS Y RECOMENDACIONES\n")
             f.write("-" * 70 + "\n")
             
+            # Promedios de los algoritmos con algún caso exitoso
+            solved = {algo: row for algo, row in summary.items() if row['successes']}
+            
             # Algoritmo más rápido
-            avg_times = {}
-            for algo in algorithms:
-                times = [res['execution_time'] for res in self.results[algo] if res['success']]
-                if times:
-                    avg_times[algo] = sum(times) / len(times)
+            avg_times = {algo: row['avg_time'] for algo, row in solved.items()}
             
             if avg_times:
                 fastest_algo = min(avg_times, key=avg_times.get)
                 f.write(f"- Algoritmo más rápido: {fastest_algo} ({avg_times[fastest_algo]:.6f} segundos en promedio)\n")
             
             # Algoritmo más eficiente en memoria
-            avg_nodes = {}
-            for algo in algorithms:
-                nodes = [res['nodes_expanded'] for res in self.results[algo] if res['success']]
-                if nodes:
-                    avg_nodes[algo] = sum(nodes) / len(nodes)
+            avg_nodes = {algo: row['avg_nodes'] for algo, row in solved.items()}
             
             if avg_nodes:
                 most_efficient_algo = min(avg_nodes, key=avg_nodes.get)
                 f.write(f"- Algoritmo más eficiente en memoria: {most_efficient_algo} ({int(avg_nodes[most_efficient_algo])} nodos expandidos en promedio)\n")
             
             # Algoritmo con caminos más cortos
-            avg_lengths = {}
-            for algo in algorithms:
-                lengths = [res['path_length'] for res in self.results[algo] if res['success']]
-                if lengths:
-                    avg_lengths[algo] = sum(lengths) / len(lengths)
+            avg_lengths = {algo: row['avg_length'] for algo, row in solved.items()}
             
             if avg_lengths:
                 shortest_algo = min(avg_lengths, key=avg_lengths.get)
@@ -354,7 +1139,7 @@ class AlgorithmMetrics:
                 scores = {}
                 for algo in algorithms:
                     # Solo considerar algoritmos con alta tasa de éxito (>80%)
-                    success_rate = sum(1 for res in self.results[algo] if res['success']) / num_cases * 100
+                    success_rate = summary[algo]['success_rate']
                     if success_rate >= 80 and algo in avg_times and algo in avg_nodes and algo in avg_lengths:
                         # Ponderación: 40% tiempo, 30% memoria, 30% longitud
                         norm_time = avg_times[algo] / max_time if max_time > 0 else 0
@@ -388,325 +1173,19 @@ class AlgorithmMetrics:
         return report_path
 
 
-class MetricsUI:
+def __getattr__(name):
     """
-    Interfaz gráfica para ejecutar y visualizar métricas de comparación de algoritmos.
+    Mantiene `from utils.metrics import MetricsUI` sin cargar Tkinter ni
+    matplotlib al importar el módulo de métricas.
     """
-    def __init__(self, root=None):
-        """
-        Inicializa la interfaz gráfica para métricas.
-        
-        Args:
-            root: Ventana principal de Tkinter. Si es None, se crea una nueva.
-        """
-        # Inicializar sistema de métricas
-        self.metrics = AlgorithmMetrics()
-        
-        # Crear ventana principal si no se proporciona
-        self.is_main_window = False
-        if root is None:
-            self.root = tk.Tk()
-            self.root.title("Métricas de Algoritmos 8-Puzzle")
-            self.root.geometry("800x600")
-            self.is_main_window = True
-        else:
-            self.root = root
-        
-        # Variables de estado
-        self.algorithms = ["BFS", "DFS Limitada", "A* Manhattan"]
-        self.selected_algorithms = []
-        for algo in self.algorithms:
-            self.selected_algorithms.append(tk.BooleanVar(value=True))
-        
-        self.num_test_cases = tk.IntVar(value=5)
-        self.min_difficulty = tk.IntVar(value=5)
-        self.max_difficulty = tk.IntVar(value=15)
-        
-        # Crear interfaz
-        self.create_widgets()
-        
-        # Si es ventana principal, configurar cierre
-        if self.is_main_window:
-            self.root.protocol("WM_DELETE_WINDOW", self.root.quit)
-    
-    def create_widgets(self):
-        """Crea y dispone los widgets de la interfaz."""
-        # Frame principal
-        self.main_frame = tk.Frame(self.root)
-        self.main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        
-        # Panel izquierdo - Configuración
-        self.left_frame = tk.Frame(self.main_frame)
-        self.left_frame.pack(side=tk.LEFT, fill=tk.BOTH, padx=10, expand=True)
-        
-        # Panel derecho - Resultados y gráficos
-        self.right_frame = tk.Frame(self.main_frame)
-        self.right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, padx=10, expand=True)
-        
-        # Sección de configuración
-        self.config_frame = tk.LabelFrame(self.left_frame, text="Configuración", padx=10, pady=10)
-        self.config_frame.pack(fill=tk.X, pady=10)
-        
-        # Selección de algoritmos
-        algo_label = tk.Label(self.config_frame, text="Algoritmos a comparar:")
-        algo_label.pack(anchor=tk.W, pady=(5, 0))
-        
-        for i, algo in enumerate(self.algorithms):
-            cb = tk.Checkbutton(self.config_frame, text=algo, variable=self.selected_algorithms[i])
-            cb.pack(anchor=tk.W, padx=20)
-        
-        # Número de casos de prueba
-        tk.Label(self.config_frame, text="Número de casos de prueba:").pack(anchor=tk.W, pady=(10, 0))
-        ttk.Spinbox(self.config_frame, from_=1, to=20, textvariable=self.num_test_cases, width=5).pack(anchor=tk.W, padx=20)
-        
-        # Dificultad mínima
-        tk.Label(self.config_frame, text="Dificultad mínima (movimientos):").pack(anchor=tk.W, pady=(10, 0))
-        ttk.Spinbox(self.config_frame, from_=3, to=30, textvariable=self.min_difficulty, width=5).pack(anchor=tk.W, padx=20)
-        
-        # Dificultad máxima
-        tk.Label(self.config_frame, text="Dificultad máxima (movimientos):").pack(anchor=tk.W, pady=(10, 0))
-        ttk.Spinbox(self.config_frame, from_=5, to=50, textvariable=self.max_difficulty, width=5).pack(anchor=tk.W, padx=20)
-        
-        # Botones de acción
-        self.action_frame = tk.Frame(self.left_frame)
-        self.action_frame.pack(fill=tk.X, pady=10)
-        
-        # Botón de ejecutar benchmark
-        self.run_button = tk.Button(
-            self.action_frame,
-            text="Ejecutar Benchmark",
-            command=self.run_benchmark
-        )
-        self.run_button.pack(fill=tk.X, pady=5)
-        
-        # Botón de generar informe
-        self.report_button = tk.Button(
-            self.action_frame,
-            text="Generar Informe",
-            command=self.generate_report,
-            state=tk.DISABLED
-        )
-        self.report_button.pack(fill=tk.X, pady=5)
-        
-        # Botón de guardar gráficos
-        self.save_button = tk.Button(
-            self.action_frame,
-            text="Guardar Gráficos",
-            command=self.save_plots,
-            state=tk.DISABLED
-        )
-        self.save_button.pack(fill=tk.X, pady=5)
-        
-        # Panel de registro
-        self.log_frame = tk.LabelFrame(self.left_frame, text="Registro", padx=10, pady=10)
-        self.log_frame.pack(fill=tk.BOTH, expand=True, pady=10)
-        
-        # Área de texto para el registro
-        self.log_text = tk.Text(self.log_frame, height=10, width=30)
-        self.log_text.pack(fill=tk.BOTH, expand=True)
-        
-        # Crear figuras para los gráficos
-        self.fig1 = Figure(figsize=(4, 3))
-        self.fig2 = Figure(figsize=(4, 3))
-        self.fig3 = Figure(figsize=(4, 3))
-        
-        # Crear contenedores para los gráficos
-        self.results_notebook = ttk.Notebook(self.right_frame)
-        self.results_notebook.pack(fill=tk.BOTH, expand=True)
-        
-        # Página para tiempo de ejecución
-        self.time_frame = tk.Frame(self.results_notebook)
-        self.results_notebook.add(self.time_frame, text="Tiempo de Ejecución")
-        
-        self.canvas1 = FigureCanvasTkAgg(self.fig1, master=self.time_frame)
-        self.canvas1.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
-        # Página para nodos expandidos
-        self.nodes_frame = tk.Frame(self.results_notebook)
-        self.results_notebook.add(self.nodes_frame, text="Nodos Expandidos")
-        
-        self.canvas2 = FigureCanvasTkAgg(self.fig2, master=self.nodes_frame)
-        self.canvas2.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
-        # Página para longitud del camino
-        self.path_frame = tk.Frame(self.results_notebook)
-        self.results_notebook.add(self.path_frame, text="Longitud del Camino")
-        
-        self.canvas3 = FigureCanvasTkAgg(self.fig3, master=self.path_frame)
-        self.canvas3.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-    
-    def log(self, message):
-        """Añade un mensaje al registro."""
-        self.log_text.insert(tk.END, message + "\n")
-        self.log_text.see(tk.END)
-        self.root.update()
-    
-    def run_benchmark(self):
-        """Ejecuta el benchmark con la configuración actual."""
-        # Obtener algoritmos seleccionados
-        selected = []
-        for i, var in enumerate(self.selected_algorithms):
-            if var.get():
-                selected.append(self.algorithms[i])
-        
-        if not selected:
-            messagebox.showwarning("Advertencia", "Seleccione al menos un algoritmo para comparar.")
-            return
-        
-        # Validar dificultad
-        min_diff = self.min_difficulty.get()
-        max_diff = self.max_difficulty.get()
-        
-        if min_diff >= max_diff:
-            messagebox.showwarning("Advertencia", "La dificultad mínima debe ser menor que la máxima.")
-            return
-        
-        # Desactivar botones durante el benchmark
-        self.run_button.config(state=tk.DISABLED)
-        
-        # Limpiar registro
-        self.log_text.delete(1.0, tk.END)
-        
-        try:
-            # Generar casos de prueba
-            self.log("Generando casos de prueba...")
-            test_cases = self.metrics.generate_test_cases(
-                num_cases=self.num_test_cases.get(),
-                min_difficulty=min_diff,
-                max_difficulty=max_diff
-            )
-            
-            # Ejecutar benchmark
-            self.log(f"Ejecutando benchmark con {len(test_cases)} casos y algoritmos: {', '.join(selected)}")
-            results = self.metrics.run_benchmark(test_cases, algorithms=selected)
-            
-            # Actualizar gráficos
-            self.update_plots()
-            
-            # Habilitar botones de informe y guardar
-            self.report_button.config(state=tk.NORMAL)
-            self.save_button.config(state=tk.NORMAL)
-            
-            # Mostrar resumen
-            self.log("\nResumen de resultados:")
-            for algo in selected:
-                successes = sum(1 for res in results[algo] if res['success'])
-                if successes > 0:
-                    avg_time = sum(res['execution_time'] for res in results[algo] if res['success']) / successes
-                    avg_nodes = sum(res['nodes_expanded'] for res in results[algo] if res['success']) / successes
-                    avg_path = sum(res['path_length'] for res in results[algo] if res['success']) / successes
-                    
-                    self.log(f"{algo}:")
-                    self.log(f"  - Éxito: {successes}/{len(test_cases)} ({successes/len(test_cases)*100:.1f}%)")
-                    self.log(f"  - Tiempo promedio: {avg_time:.6f} segundos")
-                    self.log(f"  - Nodos expandidos: {avg_nodes:.1f}")
-                    self.log(f"  - Longitud del camino: {avg_path:.1f}")
-                else:
-                    self.log(f"{algo}: No encontró soluciones.")
-            
-            self.log("\nBenchmark completado con éxito.")
-            
-        except Exception as e:
-            self.log(f"Error: {str(e)}")
-            messagebox.showerror("Error", f"Error al ejecutar el benchmark: {str(e)}")
-        
-        # Reactivar botones
-        self.run_button.config(state=tk.NORMAL)
-    
-    def update_plots(self):
-        """Actualiza los gráficos con los resultados actuales."""
-        # Gráfico de tiempo de ejecución
-        self.metrics.plot_execution_time(self.fig1)
-        self.canvas1.draw()
-        
-        # Gráfico de nodos expandidos
-        self.metrics.plot_nodes_expanded(self.fig2)
-        self.canvas2.draw()
-        
-        # Gráfico de longitud del camino
-        self.metrics.plot_path_length(self.fig3)
-        self.canvas3.draw()
-    
-    def generate_report(self):
-        """Genera y muestra un informe de comparación."""
-        if not self.metrics.results:
-            messagebox.showinfo("Información", "No hay resultados para generar un informe. Ejecute el benchmark primero.")
-            return
-        
-        # Solicitar ruta para guardar el informe
-        report_path = filedialog.asksaveasfilename(
-            title="Guardar Informe",
-            filetypes=[("Archivos de texto", "*.txt")],
-            defaultextension=".txt"
-        )
-        
-        if not report_path:
-            return  # El usuario canceló la operación
-        
-        try:
-            # Generar el informe
-            self.log("Generando informe...")
-            report_file = self.metrics.generate_comparison_report(report_path)
-            
-            # Preguntar si desea abrir el informe
-            if messagebox.askyesno("Informe Generado", f"Informe guardado en {report_file}. ¿Desea abrirlo ahora?"):
-                # Abrir el archivo con el visor predeterminado
-                import os
-                import subprocess
-                
-                if os.name == 'nt':  # Windows
-                    os.startfile(report_file)
-                elif os.name == 'posix':  # macOS, Linux
-                    subprocess.call(('xdg-open', report_file))
-            
-            self.log(f"Informe guardado en {report_file}")
-            
-        except Exception as e:
-            self.log(f"Error: {str(e)}")
-            messagebox.showerror("Error", f"Error al generar el informe: {str(e)}")
-    
-    def save_plots(self):
-        """Guarda los gráficos como archivos de imagen."""
-        if not self.metrics.results:
-            messagebox.showinfo("Información", "No hay gráficos para guardar. Ejecute el benchmark primero.")
-            return
-        
-        # Solicitar directorio para guardar los gráficos
-        save_dir = filedialog.askdirectory(title="Seleccionar directorio para guardar gráficos")
-        
-        if not save_dir:
-            return  # El usuario canceló la operación
-        
-        try:
-            # Guardar los gráficos
-            self.log("Guardando gráficos...")
-            
-            # Tiempo de ejecución
-            time_path = f"{save_dir}/tiempo_ejecucion.png"
-            self.fig1.savefig(time_path)
-            
-            # Nodos expandidos
-            nodes_path = f"{save_dir}/nodos_expandidos.png"
-            self.fig2.savefig(nodes_path)
-            
-            # Longitud del camino
-            path_path = f"{save_dir}/longitud_camino.png"
-            self.fig3.savefig(path_path)
-            
-            self.log(f"Gráficos guardados en {save_dir}")
-            messagebox.showinfo("Gráficos Guardados", f"Los gráficos se guardaron en {save_dir}")
-            
-        except Exception as e:
-            self.log(f"Error: {str(e)}")
-            messagebox.showerror("Error", f"Error al guardar los gráficos: {str(e)}")
-    
-    def run(self):
-        """Inicia el bucle principal de la interfaz si es ventana principal."""
-        if self.is_main_window:
-            self.root.mainloop()
+    if name == "MetricsUI":
+        from ui.metrics_ui import MetricsUI
+        return MetricsUI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
     # Ejemplo de uso independiente
+    from ui.metrics_ui import MetricsUI
     app = MetricsUI()
     app.run()
\ No newline at end of file
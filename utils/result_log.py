@@ -0,0 +1,145 @@
+import json
+import os
+
+from models.encoding import format_state
+from models.solver import path_to_moves
+
+# Campos de cada registro (una línea JSON por (caso, algoritmo))
+RECORD_FIELDS = (
+    'case', 'algorithm', 'state', 'success', 'timed_out', 'nodes_expanded',
+    'optimal_length', 'path_length', 'execution_time', 'time_std', 'noisy', 'moves'
+)
+
+# Bytes leídos de cada vez al buscar hacia atrás el último salto de línea
+REPAIR_BLOCK_SIZE = 64 * 1024
+
+
+def make_record(case, algorithm, result):
+    """
+    Convierte el resultado de una búsqueda en un registro compacto y serializable.
+    
+    El camino se guarda como cadena de movimientos ("RDLU...") en lugar de la
+    lista de estados NumPy.
+    
+    Args:
+        case: Índice del caso en el corpus
+        algorithm: Nombre del algoritmo
+        result: Diccionario devuelto por run_case()
+    
+    Returns:
+        dict con los campos de RECORD_FIELDS y, si existe, 'timing_breakdown'
+    """
+    timing_stats = result.get('timing_stats', {})
+    record = {
+        'case': case,
+        'algorithm': algorithm,
+        'state': format_state(result['initial_state']),
+        'success': result['success'],
+        'timed_out': result.get('timed_out', False),
+        'nodes_expanded': result['nodes_expanded'],
+        'optimal_length': result.get('optimal_length'),
+        'path_length': result['path_length'],
+        'execution_time': result['execution_time'],
+        'time_std': timing_stats.get('std', 0.0),
+        'noisy': timing_stats.get('noisy', False),
+        'moves': path_to_moves(result['path'])
+    }
+    if result.get('timing_breakdown'):
+        record['timing_breakdown'] = result['timing_breakdown']
+    return record
+
+
+class ResultLog:
+    """
+    Registro de resultados en formato JSONL (una línea por resultado).
+    
+    Cada línea se escribe y se vuelca a disco en cuanto termina la búsqueda, de
+    modo que una interrupción solo pierde los casos en curso.
+    """
+    def __init__(self, path):
+        """
+        Args:
+            path: Ruta del archivo JSONL
+        """
+        self.path = path
+        self._file = None
+    
+    def exists(self):
+        """True si el archivo existe y contiene al menos un registro."""
+        return os.path.exists(self.path) and os.path.getsize(self.path) > 0
+    
+    def reset(self):
+        """Vacía el archivo (nueva ejecución sin reanudar)."""
+        self.close()
+        open(self.path, 'w').close()
+    
+    def repair(self):
+        """
+        Elimina una última línea incompleta (escritura interrumpida) para que
+        los registros añadidos al reanudar empiecen en una línea nueva.
+        
+        Solo se lee el final del archivo: se retrocede por bloques desde el
+        final hasta el último salto de línea y se trunca ahí.
+        """
+        if not self.exists():
+            return
+        with open(self.path, 'rb+') as f:
+            end = f.seek(0, os.SEEK_END)
+            f.seek(end - 1)
+            if f.read(1) == b"\n":
+                return
+            
+            position = end
+            while position > 0:
+                start = max(position - REPAIR_BLOCK_SIZE, 0)
+                f.seek(start)
+                newline = f.read(position - start).rfind(b"\n")
+                if newline >= 0:
+                    f.truncate(start + newline + 1)
+                    return
+                position = start
+            # Ningún registro completo: el archivo entero es una línea cortada
+            f.truncate(0)
+    
+    def append(self, record):
+        """
+        Añade un registro al final del archivo.
+        
+        Args:
+            record: Diccionario serializable (ver make_record)
+        """
+        if self._file is None:
+            self._file = open(self.path, 'a')
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+    
+    def close(self):
+        """Cierra el archivo si está abierto."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    def iter_records(self):
+        """
+        Lee los registros uno a uno sin cargar el archivo completo.
+        
+        Una última línea incompleta (escritura interrumpida) se ignora.
+        
+        Yields:
+            Diccionarios de registro
+        """
+        if not os.path.exists(self.path):
+            return
+        with open(self.path) as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+    
+    def completed(self):
+        """
+        Returns:
+            dict: (caso, algoritmo) -> estado, para los resultados ya registrados
+        """
+        return {(record['case'], record['algorithm']): record['state'] for record in self.iter_records()}
@@ -0,0 +1,405 @@
+from array import array
+
+from models.encoding import BITS_PER_TILE
+from models.solver import ALGORITHMS, TIMING_PHASES
+from utils.lazy import lazy_import
+from utils.stats import median_ci_ranks
+
+# NumPy se carga en el primer uso, no al importar el módulo
+np = lazy_import('numpy')
+
+# Versión del formato de los archivos .npz
+TABLE_VERSION = 1
+
+# Columna -> (código de array.array usado al construirla, dtype final de NumPy)
+COLUMNS = {
+    'algorithm': ('b', 'int8'),         # índice en ResultTable.algorithms
+    'case': ('l', 'int32'),
+    'state': ('Q', 'uint64'),           # estado empaquetado (models.encoding)
+    'optimal_length': ('h', 'int16'),   # -1 si se desconoce
+    'success': ('b', 'bool'),
+    'timed_out': ('b', 'bool'),
+    'noisy': ('b', 'bool'),
+    'nodes_expanded': ('q', 'int64'),
+    'path_length': ('l', 'int32'),
+    'execution_time': ('d', 'float64'),
+    'time_std': ('d', 'float64'),
+}
+
+# Columnas del desglose de tiempo por fase (NaN si no se midió)
+PHASES = TIMING_PHASES + ('other',)
+PHASE_COLUMNS = tuple(f'phase_{phase}' for phase in PHASES)
+
+
+def group_stats(keys, values, num_groups, quantiles=(0.5, 0.95), confidence=0.95):
+    """
+    Estadísticas de un valor agrupado por una clave entera, sin bucles de Python.
+    
+    Si se piden percentiles, los valores se ordenan una sola vez por (clave,
+    valor) y los percentiles y el intervalo de confianza de la mediana se leen
+    después por posición.
+    
+    Args:
+        keys: Array de enteros en [0, num_groups)
+        values: Array de valores, uno por clave
+        num_groups: Número de grupos
+        quantiles: Percentiles a calcular (entre 0 y 1), con interpolación lineal
+        confidence: Nivel de confianza del intervalo de la mediana
+    
+    Returns:
+        dict de arrays de longitud num_groups: 'count', 'mean', 'std' (ddof=1),
+        'quantiles' (dict percentil -> array) y, si hay percentiles, 'ci_low' y
+        'ci_high'. Los grupos vacíos valen 0.
+    """
+    keys = np.asarray(keys, dtype=np.int64)
+    values = np.asarray(values, dtype=np.float64)
+    
+    count = np.bincount(keys, minlength=num_groups)
+    safe_count = np.maximum(count, 1)
+    mean = np.bincount(keys, weights=values, minlength=num_groups) / safe_count
+    
+    # Varianza a partir de las desviaciones (evita la cancelación de sum(x²) - n·media²)
+    deviations = np.bincount(keys, weights=(values - mean[keys]) ** 2, minlength=num_groups)
+    std = np.where(count > 1, np.sqrt(deviations / np.maximum(count - 1, 1)), 0.0)
+    
+    stats = {'count': count, 'mean': mean, 'std': std, 'quantiles': {}}
+    if not quantiles:
+        return stats
+    if values.size == 0:
+        zeros = np.zeros(num_groups)
+        stats.update(ci_low=zeros, ci_high=zeros, quantiles={q: zeros for q in quantiles})
+        return stats
+    
+    # Ordenar por valor y después, de forma estable, por clave (con claves de
+    # 16 bits NumPy usa radix sort, bastante más rápido que lexsort)
+    order = np.argsort(values)
+    small_keys = keys.astype(np.uint16) if num_groups <= np.iinfo(np.uint16).max else keys
+    order = order[np.argsort(small_keys[order], kind='stable')]
+    ordered = values[order]
+    starts = np.concatenate(([0], np.cumsum(count)[:-1]))
+    last = ordered.size - 1
+    
+    def at(positions):
+        """Valor ordenado en cada posición (0 en los grupos vacíos)."""
+        return np.where(count > 0, ordered[np.clip(positions, 0, last)], 0.0)
+    
+    for q in quantiles:
+        position = starts + q * (safe_count - 1)
+        low = np.floor(position).astype(np.int64)
+        fraction = position - low
+        stats['quantiles'][q] = at(low) + (at(low + 1) - at(low)) * np.where(fraction > 0, fraction, 0.0)
+    
+    low_rank, high_rank = median_ci_ranks(count, confidence)
+    stats['ci_low'] = at(starts + low_rank)
+    stats['ci_high'] = at(starts + high_rank)
+    return stats
+
+
+class ResultTable:
+    """
+    Resultados de un benchmark en formato columnar: un array NumPy por métrica,
+    con el algoritmo y la distancia óptima como columnas de índice.
+    
+    Las agregaciones por algoritmo y por distancia se calculan con operaciones
+    vectorizadas y el resumen se guarda tras calcularlo la primera vez, de modo
+    que informes y gráficos de corpus grandes tardan milisegundos.
+    """
+    def __init__(self, columns, algorithms):
+        """
+        Args:
+            columns: dict nombre -> array (COLUMNS y PHASE_COLUMNS)
+            algorithms: Nombres de los algoritmos; la columna 'algorithm' guarda
+                su índice en esta lista
+        """
+        self.columns = columns
+        self.algorithms = list(algorithms)
+        self._summary = None
+    
+    @classmethod
+    def from_records(cls, records):
+        """
+        Construye la tabla a partir de registros (ver utils.result_log.make_record).
+        
+        Los registros se recorren una sola vez y solo se guardan sus columnas
+        numéricas, así que sirve para leer un registro JSONL de cualquier tamaño.
+        
+        Args:
+            records: Iterable de diccionarios de registro
+        
+        Returns:
+            ResultTable con los algoritmos en el orden de ALGORITHMS
+        """
+        builders = {name: array(code) for name, (code, _) in COLUMNS.items()}
+        phases = {name: array('d') for name in PHASE_COLUMNS}
+        algorithms = []
+        
+        for record in records:
+            algo = record['algorithm']
+            if algo not in algorithms:
+                algorithms.append(algo)
+            
+            # Empaquetar el estado '1,2,...' sin pasar por NumPy (ver pack_state)
+            code = 0
+            for tile in record['state'].split(','):
+                code = (code << BITS_PER_TILE) | int(tile)
+            
+            optimal_length = record.get('optimal_length')
+            builders['algorithm'].append(algorithms.index(algo))
+            builders['case'].append(record['case'])
+            builders['state'].append(code)
+            builders['optimal_length'].append(-1 if optimal_length is None else optimal_length)
+            builders['success'].append(bool(record['success']))
+            builders['timed_out'].append(bool(record.get('timed_out')))
+            builders['noisy'].append(bool(record.get('noisy')))
+            builders['nodes_expanded'].append(record['nodes_expanded'])
+            builders['path_length'].append(record['path_length'])
+            builders['execution_time'].append(record['execution_time'])
+            builders['time_std'].append(record.get('time_std', 0.0))
+            
+            breakdown = record.get('timing_breakdown') or {}
+            for phase, name in zip(PHASES, PHASE_COLUMNS):
+                phases[name].append(breakdown.get(phase, np.nan))
+        
+        columns = {name: np.array(builders[name]).astype(dtype) for name, (_, dtype) in COLUMNS.items()}
+        columns.update({name: np.array(values, dtype=np.float64) for name, values in phases.items()})
+        
+        # Ordenar los algoritmos como en ALGORITHMS (los registros pueden llegar
+        # en orden de finalización)
+        order = {algo: i for i, algo in enumerate(ALGORITHMS)}
+        sorted_algorithms = sorted(algorithms, key=lambda algo: order.get(algo, len(order)))
+        remap = np.array([sorted_algorithms.index(algo) for algo in algorithms], dtype=np.int8)
+        if remap.size:
+            columns['algorithm'] = remap[columns['algorithm']]
+        
+        return cls(columns, sorted_algorithms)
+    
+    @classmethod
+    def load(cls, path):
+        """
+        Carga una tabla guardada con save().
+        
+        Args:
+            path: Ruta del archivo .npz
+        
+        Returns:
+            ResultTable
+        """
+        with np.load(path) as data:
+            if int(data['version']) != TABLE_VERSION:
+                raise ValueError(f"Versión de tabla no soportada: {int(data['version'])}")
+            algorithms = [str(algo) for algo in data['algorithms']]
+            columns = {name: data[name] for name in tuple(COLUMNS) + PHASE_COLUMNS}
+        return cls(columns, algorithms)
+    
+    def save(self, path):
+        """
+        Guarda la tabla en un archivo .npz comprimido.
+        
+        Args:
+            path: Ruta del archivo
+        """
+        np.savez_compressed(
+            path,
+            version=np.array(TABLE_VERSION),
+            algorithms=np.array(self.algorithms),
+            **self.columns
+        )
+        return path
+    
+    def __len__(self):
+        return len(self.columns['algorithm'])
+    
+    def algorithm_stats(self, column, successful=True, quantiles=(0.5, 0.95)):
+        """
+        Estadísticas de una columna por algoritmo (ver group_stats).
+        
+        Args:
+            column: Nombre de la columna
+            successful: Si es True, solo se usan los casos exitosos
+            quantiles: Percentiles a calcular
+        
+        Returns:
+            dict de arrays indexados como self.algorithms
+        """
+        mask = self.columns['success'] if successful else slice(None)
+        return group_stats(
+            self.columns['algorithm'][mask],
+            self.columns[column][mask],
+            len(self.algorithms),
+            quantiles
+        )
+    
+    def depth_stats(self, column, successful=True, quantiles=(0.5,)):
+        """
+        Estadísticas de una columna por (algoritmo, distancia óptima).
+        
+        Args:
+            column: Nombre de la columna
+            successful: Si es True, solo se usan los casos exitosos
+            quantiles: Percentiles a calcular
+        
+        Returns:
+            Tupla (depths, stats): array de distancias y dict de arrays de forma
+            (algoritmos, distancias)
+        """
+        known = self.columns['optimal_length'] >= 0
+        depths = np.unique(self.columns['optimal_length'][known])
+        if depths.size == 0:
+            return depths, None
+        
+        # Clave combinada: algoritmo * número de distancias + índice de la distancia
+        mask = known & self.columns['success'] if successful else known
+        depth_index = np.searchsorted(depths, self.columns['optimal_length'][mask])
+        keys = self.columns['algorithm'][mask].astype(np.int64) * depths.size + depth_index
+        
+        stats = group_stats(keys, self.columns[column][mask], len(self.algorithms) * depths.size, quantiles)
+        shape = (len(self.algorithms), depths.size)
+        reshaped = {name: values.reshape(shape) for name, values in stats.items() if name != 'quantiles'}
+        reshaped['quantiles'] = {q: values.reshape(shape) for q, values in stats['quantiles'].items()}
+        return depths, reshaped
+    
+    def throughput_stats(self, quantiles=(0.25, 0.5, 0.75)):
+        """
+        Nodos expandidos por segundo de cada caso exitoso, por algoritmo.
+        
+        Args:
+            quantiles: Percentiles a calcular
+        
+        Returns:
+            dict de arrays indexados como self.algorithms (ver group_stats)
+        """
+        times = self.columns['execution_time']
+        mask = self.columns['success'] & (times > 0)
+        return group_stats(
+            self.columns['algorithm'][mask],
+            self.columns['nodes_expanded'][mask] / times[mask],
+            len(self.algorithms),
+            quantiles
+        )
+    
+    def histograms(self, column, bins=40, log=True, successful=True):
+        """
+        Histograma de una columna por algoritmo, con los mismos intervalos para
+        todos (base de los gráficos de violín).
+        
+        Args:
+            column: Nombre de la columna
+            bins: Número de intervalos
+            log: Si es True, los intervalos son equiespaciados en escala logarítmica
+                (se ignoran los valores <= 0)
+            successful: Si es True, solo se usan los casos exitosos
+        
+        Returns:
+            Tupla (edges, counts): bordes de los intervalos (bins + 1) y array de
+            forma (algoritmos, bins), o (None, None) si no hay valores
+        """
+        mask = self.columns['success'].copy() if successful else np.ones(len(self), dtype=bool)
+        values = self.columns[column].astype(np.float64)
+        if log:
+            mask &= values > 0
+        values = values[mask]
+        if values.size == 0:
+            return None, None
+        
+        low, high = values.min(), values.max()
+        if log:
+            edges = np.geomspace(low, high if high > low else low * 10, bins + 1)
+        else:
+            edges = np.linspace(low, high if high > low else low + 1, bins + 1)
+        
+        # Un solo bincount con la clave combinada algoritmo * bins + intervalo
+        bin_index = np.clip(np.searchsorted(edges, values, side='right') - 1, 0, bins - 1)
+        keys = self.columns['algorithm'][mask].astype(np.int64) * bins + bin_index
+        counts = np.bincount(keys, minlength=len(self.algorithms) * bins)
+        return edges, counts.reshape(len(self.algorithms), bins)
+    
+    def summary(self):
+        """
+        Resumen por algoritmo; se calcula una vez y se reutiliza.
+        
+        El intervalo de confianza de la mediana usa estadísticos de orden (ver
+        utils.stats.median_ci_ranks) en lugar de bootstrap.
+        
+        Returns:
+            dict: Algoritmo -> casos, éxitos, tiempos agotados, tasa de éxito,
+            promedios de tiempo, nodos y longitud de los casos exitosos y
+            estadísticas de tiempo
+        """
+        if self._summary is not None:
+            return self._summary
+        
+        num_groups = len(self.algorithms)
+        algorithm = self.columns['algorithm']
+        cases = np.bincount(algorithm, minlength=num_groups)
+        timeouts = np.bincount(algorithm, weights=self.columns['timed_out'], minlength=num_groups)
+        noisy = np.bincount(algorithm, weights=self.columns['noisy'], minlength=num_groups)
+        
+        times = self.algorithm_stats('execution_time')
+        nodes = self.algorithm_stats('nodes_expanded', quantiles=())
+        lengths = self.algorithm_stats('path_length', quantiles=())
+        successes = times['count']
+        
+        self._summary = {}
+        for i, algo in enumerate(self.algorithms):
+            self._summary[algo] = {
+                'cases': int(cases[i]),
+                'successes': int(successes[i]),
+                'timeouts': int(timeouts[i]),
+                'success_rate': float(successes[i] / cases[i] * 100) if cases[i] else 0,
+                'avg_time': float(times['mean'][i]),
+                'avg_nodes': float(nodes['mean'][i]),
+                'avg_length': float(lengths['mean'][i]),
+                'median_time': float(times['quantiles'][0.5][i]),
+                'p95_time': float(times['quantiles'][0.95][i]),
+                'std_time': float(times['std'][i]),
+                'ci_low': float(times['ci_low'][i]),
+                'ci_high': float(times['ci_high'][i]),
+                'noisy_cases': int(noisy[i])
+            }
+        return self._summary
+    
+    def scaling(self):
+        """
+        Returns:
+            dict: Algoritmo -> {distancia: {'cases', 'successes', 'median_time',
+            'avg_nodes'}} (tiempo y nodos solo de los casos exitosos)
+        """
+        depths, all_cases = self.depth_stats('execution_time', successful=False, quantiles=())
+        if all_cases is None:
+            return {algo: {} for algo in self.algorithms}
+        _, times = self.depth_stats('execution_time')
+        _, nodes = self.depth_stats('nodes_expanded', quantiles=())
+        
+        scaling = {}
+        for i, algo in enumerate(self.algorithms):
+            scaling[algo] = {
+                int(depth): {
+                    'cases': int(all_cases['count'][i, j]),
+                    'successes': int(times['count'][i, j]),
+                    'median_time': float(times['quantiles'][0.5][i, j]),
+                    'avg_nodes': float(nodes['mean'][i, j])
+                }
+                for j, depth in enumerate(depths)
+                if all_cases['count'][i, j]
+            }
+        return scaling
+    
+    def breakdown(self):
+        """
+        Returns:
+            dict: Algoritmo -> tiempo promedio por fase de los casos exitosos
+            con desglose, o None si el algoritmo no se instrumentó
+        """
+        measured = self.columns['success'] & ~np.isnan(self.columns[PHASE_COLUMNS[0]])
+        algorithm = self.columns['algorithm'][measured]
+        num_groups = len(self.algorithms)
+        count = np.bincount(algorithm, minlength=num_groups)
+        
+        means = {
+            phase: np.bincount(algorithm, weights=self.columns[name][measured], minlength=num_groups) / np.maximum(count, 1)
+            for phase, name in zip(PHASES, PHASE_COLUMNS)
+        }
+        return {
+            algo: {phase: float(means[phase][i]) for phase in PHASES} if count[i] else None
+            for i, algo in enumerate(self.algorithms)
+        }
\ No newline at end of file
@@ -0,0 +1,170 @@
+"""
+Tiempo de arranque: mide cuánto tarda en importarse cada módulo del proyecto.
+
+Ejemplo:
+    python -m utils.startup --repetitions 5 --json startup.json
+
+Cada medición se hace en un intérprete nuevo (importación en frío) y se indica
+qué dependencias pesadas (NumPy, matplotlib, Tkinter) quedaron cargadas. Los
+módulos del núcleo no deberían cargar ninguna: NumPy se importa de forma
+diferida (utils.lazy) y la interfaz gráfica solo la cargan los módulos de ui.
+
+Para ver el detalle por submódulo:
+    python -X importtime -c "import utils.metrics"
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Núcleo sin interfaz gráfica: no debe cargar dependencias pesadas al importarse
+CORE_MODULES = (
+    'models.puzzle',
+    'models.solver',
+    'models.distance_table',
+    'models.random_state',
+    'models.hints',
+    'utils.metrics',
+    'utils.bench',
+    'utils.telemetry',
+)
+
+# Capas de interfaz gráfica (cargan Tkinter y, en el caso de métricas, matplotlib)
+UI_MODULES = (
+    'ui.manual_mode',
+    'ui.auto_mode',
+    'ui.metrics_ui',
+    'main',
+)
+
+# Dependencias cuya carga se informa
+HEAVY_MODULES = ('numpy', 'matplotlib', 'tkinter')
+
+# Código ejecutado en el intérprete hijo: importa el módulo y devuelve el tiempo
+# y las dependencias pesadas cargadas (un módulo diferido aún sin usar no cuenta)
+PROBE_CODE = """
+import importlib, json, sys, time
+start = time.perf_counter()
+importlib.import_module(sys.argv[1])
+elapsed = time.perf_counter() - start
+loaded = [name for name in sys.argv[2:]
+          if name in sys.modules and type(sys.modules[name]).__name__ != '_LazyModule']
+print(json.dumps({'import_time': elapsed, 'loaded': loaded}))
+"""
+
+# Directorio raíz del proyecto (el que contiene models/, ui/ y utils/)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure_module(module, repetitions=5):
+    """
+    Importa un módulo en intérpretes nuevos y mide el tiempo.
+    
+    Args:
+        module: Nombre del módulo (por ejemplo 'utils.metrics')
+        repetitions: Número de intérpretes lanzados
+    
+    Returns:
+        dict con 'module', 'import_ms' (mediana del tiempo de importación),
+        'min_ms', 'process_ms' (mediana del tiempo total del proceso, con el
+        arranque del intérprete) y 'loaded' (dependencias pesadas cargadas)
+    """
+    import_times = []
+    process_times = []
+    loaded = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        output = subprocess.run(
+            [sys.executable, '-c', PROBE_CODE, module, *HEAVY_MODULES],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout
+        process_times.append(time.perf_counter() - start)
+        
+        probe = json.loads(output.strip().splitlines()[-1])
+        import_times.append(probe['import_time'])
+        loaded = probe['loaded']
+    
+    return {
+        'module': module,
+        'import_ms': statistics.median(import_times) * 1000,
+        'min_ms': min(import_times) * 1000,
+        'process_ms': statistics.median(process_times) * 1000,
+        'loaded': loaded
+    }
+
+
+def format_table(rows):
+    """
+    Genera la tabla de tiempos en texto.
+    
+    Args:
+        rows: Lista de resultados de measure_module()
+    
+    Returns:
+        str: Tabla con una fila por módulo
+    """
+    lines = [
+        f"{'Módulo':<22} | {'Import (ms)':<11} | {'Mín (ms)':<9} | {'Proceso (ms)':<12} | Dependencias pesadas",
+        "-" * 90
+    ]
+    for row in rows:
+        lines.append(
+            f"{row['module']:<22} | {row['import_ms']:<11.1f} | {row['min_ms']:<9.1f} | "
+            f"{row['process_ms']:<12.1f} | {', '.join(row['loaded']) or '-'}"
+        )
+    return "\n".join(lines)
+
+
+def build_parser():
+    """Crea el parser de argumentos de la línea de comandos."""
+    parser = argparse.ArgumentParser(
+        prog="python -m utils.startup",
+        description="Mide el tiempo de importación en frío de los módulos del proyecto."
+    )
+    parser.add_argument('modules', nargs='*', default=None,
+                        help="Módulos a medir (por defecto, el núcleo y la interfaz gráfica)")
+    parser.add_argument('--repetitions', type=int, default=5,
+                        help="Intérpretes lanzados por módulo; se informa la mediana")
+    parser.add_argument('--json', default=None, help="Ruta del archivo JSON de resultados")
+    parser.add_argument('--check-core', action='store_true',
+                        help="Sale con código 1 si un módulo del núcleo carga NumPy, matplotlib o Tkinter")
+    return parser
+
+
+def main(argv=None):
+    """
+    Punto de entrada de la línea de comandos.
+    
+    Args:
+        argv: Lista de argumentos (por defecto, sys.argv[1:])
+    
+    Returns:
+        int: Código de salida
+    """
+    args = build_parser().parse_args(argv)
+    modules = args.modules or list(CORE_MODULES + UI_MODULES)
+    
+    rows = [measure_module(module, args.repetitions) for module in modules]
+    
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'python': sys.version, 'repetitions': args.repetitions, 'modules': rows}, f, indent=2)
+    
+    print(format_table(rows))
+    
+    if args.check_core:
+        heavy_core = [row['module'] for row in rows if row['module'] in CORE_MODULES and row['loaded']]
+        if heavy_core:
+            print(f"Módulos del núcleo con dependencias pesadas: {', '.join(heavy_core)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,137 @@
+from utils.lazy import lazy_import
+
+# NumPy y statistics se cargan en el primer uso, no al importar el módulo
+np = lazy_import('numpy')
+statistics = lazy_import('statistics')
+
+# Umbral del z-score modificado (Iglewicz y Hoaglin) para marcar valores atípicos
+OUTLIER_Z_THRESHOLD = 3.5
+
+# Coeficiente de variación a partir del cual una medición se considera ruidosa
+NOISE_CV_THRESHOLD = 0.2
+
+# Número máximo de valores remuestreados en memoria a la vez en bootstrap_ci
+BOOTSTRAP_CHUNK_ELEMENTS = 2_000_000
+
+
+def bootstrap_ci(samples, statistic=None, confidence=0.95, resamples=1000, seed=0):
+    """
+    Calcula un intervalo de confianza por bootstrap (método de percentiles).
+    
+    Args:
+        samples: Secuencia de valores
+        statistic: Función que reduce un array 2D por el eje 1 (np.median, np.mean...);
+            por defecto, np.median
+        confidence: Nivel de confianza del intervalo
+        resamples: Número de remuestreos
+        seed: Semilla para que el intervalo sea reproducible
+    
+    Returns:
+        Tupla (límite inferior, límite superior)
+    """
+    statistic = statistic if statistic is not None else np.median
+    samples = np.asarray(samples, dtype=float)
+    if samples.size == 0:
+        return (0.0, 0.0)
+    if samples.size == 1:
+        return (float(samples[0]), float(samples[0]))
+    
+    # Remuestreos en bloques de matrices (filas, n) para acotar la memoria
+    rng = np.random.default_rng(seed)
+    rows = max(1, min(resamples, BOOTSTRAP_CHUNK_ELEMENTS // samples.size))
+    estimates = np.concatenate([
+        statistic(rng.choice(samples, size=(min(rows, resamples - start), samples.size)), axis=1)
+        for start in range(0, resamples, rows)
+    ])
+    
+    alpha = (1 - confidence) / 2
+    low, high = np.percentile(estimates, [alpha * 100, (1 - alpha) * 100])
+    return (float(low), float(high))
+
+
+def median_ci_ranks(n, confidence=0.95):
+    """
+    Posiciones (base 0) de los valores ordenados que delimitan un intervalo de
+    confianza de la mediana sin suponer ninguna distribución (estadísticos de
+    orden, aproximación normal de la binomial).
+    
+    Es la alternativa al bootstrap cuando hay muchos valores: basta con tenerlos
+    ordenados, y acepta un array con el tamaño de cada grupo.
+    
+    Args:
+        n: Número de valores (entero o array NumPy de enteros)
+        confidence: Nivel de confianza del intervalo
+    
+    Returns:
+        Tupla (posición inferior, posición superior), del mismo tipo que n
+    """
+    n = np.asarray(n)
+    z = statistics.NormalDist().inv_cdf(0.5 + confidence / 2)
+    half_width = z * np.sqrt(n) / 2
+    low = np.clip(np.floor(n / 2 - half_width), 0, np.maximum(n - 1, 0)).astype(int)
+    high = np.clip(np.ceil(n / 2 + half_width) - 1, 0, np.maximum(n - 1, 0)).astype(int)
+    return low, high
+
+
+def find_outliers(samples, threshold=OUTLIER_Z_THRESHOLD):
+    """
+    Detecta valores atípicos con el z-score modificado basado en la MAD.
+    
+    Args:
+        samples: Secuencia de valores
+        threshold: Valor absoluto del z-score a partir del cual un valor es atípico
+    
+    Returns:
+        Lista con los índices de los valores atípicos
+    """
+    samples = np.asarray(samples, dtype=float)
+    if samples.size < 3:
+        return []
+    
+    median = np.median(samples)
+    mad = np.median(np.abs(samples - median))
+    if mad == 0:
+        # Más de la mitad de las muestras son idénticas: atípico = distinto de la mediana
+        return [int(i) for i in np.flatnonzero(samples != median)]
+    
+    z_scores = 0.6745 * (samples - median) / mad
+    return [int(i) for i in np.flatnonzero(np.abs(z_scores) > threshold)]
+
+
+def describe(samples, confidence=0.95):
+    """
+    Resume una serie de mediciones.
+    
+    Args:
+        samples: Secuencia de valores (por ejemplo, tiempos en segundos)
+        confidence: Nivel de confianza del intervalo bootstrap de la mediana
+    
+    Returns:
+        dict con n, mean, median, p95, std, ci_low, ci_high, cv, outliers
+        (índices) y noisy (True si hay atípicos o mucha variación)
+    """
+    samples = np.asarray(samples, dtype=float)
+    if samples.size == 0:
+        return {
+            'n': 0, 'mean': 0.0, 'median': 0.0, 'p95': 0.0, 'std': 0.0,
+            'ci_low': 0.0, 'ci_high': 0.0, 'cv': 0.0, 'outliers': [], 'noisy': False
+        }
+    
+    mean = float(np.mean(samples))
+    std = float(np.std(samples, ddof=1)) if samples.size > 1 else 0.0
+    cv = std / mean if mean > 0 else 0.0
+    ci_low, ci_high = bootstrap_ci(samples, confidence=confidence)
+    outliers = find_outliers(samples)
+    
+    return {
+        'n': int(samples.size),
+        'mean': mean,
+        'median': float(np.median(samples)),
+        'p95': float(np.percentile(samples, 95)),
+        'std': std,
+        'ci_low': ci_low,
+        'ci_high': ci_high,
+        'cv': cv,
+        'outliers': outliers,
+        'noisy': bool(outliers) or cv > NOISE_CV_THRESHOLD
+    }
\ No newline at end of file
@@ -0,0 +1,417 @@
+"""
+Métricas de funcionamiento en formato de texto de Prometheus.
+
+El registro vive en el proceso: contadores, medidores e histogramas con
+etiquetas que el solucionador, el servicio y la interfaz actualizan al vuelo.
+Se consultan en GET /metrics del servicio (service.server) o, en la aplicación
+de escritorio, volcándolos periódicamente a un archivo:
+
+    PUZZLE_METRICS_FILE=/tmp/8puzzle.prom python main.py
+
+Ese archivo se puede leer con el textfile collector de node_exporter.
+
+Solo usa la biblioteca estándar: importarlo no carga NumPy ni Tkinter.
+"""
+import bisect
+import os
+import threading
+import time
+
+# Límites (en segundos) de los histogramas de duración de las búsquedas
+SEARCH_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60)
+
+# Límites (en segundos) de los histogramas de duración de un fotograma
+FRAME_BUCKETS = (0.001, 0.002, 0.004, 0.008, 0.016, 0.033, 0.066, 0.1, 0.25)
+
+# Variable de entorno con la ruta del volcado periódico
+METRICS_FILE_ENV = 'PUZZLE_METRICS_FILE'
+
+# Segundos entre volcados
+DEFAULT_DUMP_INTERVAL = 15
+
+
+def _format_value(value):
+    """Formatea un número como lo espera Prometheus."""
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names, values, extra=()):
+    """Construye el bloque {nombre="valor",...} de una serie."""
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ''
+    escaped = (
+        (name, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for name, value in pairs
+    )
+    return '{' + ','.join(f'{name}="{value}"' for name, value in escaped) + '}'
+
+
+class _Metric:
+    """
+    Base de las métricas: nombre, ayuda, etiquetas y un valor por combinación de etiquetas.
+    """
+    kind = None
+    
+    def __init__(self, name, help_text, labels=()):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+        self._values = {}
+    
+    def _key(self, labels):
+        """Convierte los valores de las etiquetas en la clave de la serie."""
+        if len(labels) != len(self.label_names):
+            raise ValueError(f"{self.name} espera las etiquetas {self.label_names}")
+        return tuple(str(value) for value in labels)
+    
+    def clear(self):
+        """Elimina todas las series."""
+        with self._lock:
+            self._values.clear()
+    
+    def samples(self):
+        """
+        Series de la métrica.
+        
+        Returns:
+            Lista de tuplas (sufijo del nombre, valores de las etiquetas,
+            etiquetas adicionales, valor)
+        """
+        with self._lock:
+            return [('', key, (), value) for key, value in sorted(self._values.items())]
+    
+    def render(self):
+        """Devuelve la métrica en formato de texto de Prometheus."""
+        lines = [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} {self.kind}']
+        for suffix, key, extra, value in self.samples():
+            lines.append(
+                f'{self.name}{suffix}{_format_labels(self.label_names, key, extra)} {_format_value(value)}'
+            )
+        return '\n'.join(lines)
+
+
+class Counter(_Metric):
+    """Contador que solo crece."""
+    kind = 'counter'
+    
+    def inc(self, *labels, amount=1):
+        """
+        Incrementa la serie de las etiquetas indicadas.
+        
+        Args:
+            *labels: Valores de las etiquetas, en el orden de label_names
+            amount: Cantidad a sumar (no negativa)
+        """
+        if amount < 0:
+            raise ValueError("Un contador no puede decrecer")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+    
+    def value(self, *labels):
+        """Valor actual de una serie (0 si no existe)."""
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+
+class Gauge(_Metric):
+    """
+    Medidor que puede subir y bajar.
+    
+    Con `function`, el valor se calcula al consultar las métricas: la función
+    devuelve un número o, si la métrica tiene etiquetas, un dict de tuplas de
+    valores de etiquetas -> número.
+    """
+    kind = 'gauge'
+    
+    def __init__(self, name, help_text, labels=(), function=None):
+        super().__init__(name, help_text, labels)
+        self.function = function
+    
+    def set(self, value, *labels):
+        """Fija el valor de una serie."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+    
+    def inc(self, *labels, amount=1):
+        """Suma (o resta, con amount negativo) al valor de una serie."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+    
+    def value(self, *labels):
+        """Valor actual de una serie (0 si no existe)."""
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+    
+    def samples(self):
+        if self.function is None:
+            return super().samples()
+        
+        values = self.function()
+        if not isinstance(values, dict):
+            values = {(): values}
+        return [('', self._key(key), (), value) for key, value in sorted(values.items())]
+
+
+class Histogram(_Metric):
+    """
+    Histograma acumulado con límites fijos (series _bucket, _sum y _count).
+    """
+    kind = 'histogram'
+    
+    def __init__(self, name, help_text, labels=(), buckets=SEARCH_BUCKETS):
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(sorted(buckets))
+    
+    def observe(self, value, *labels):
+        """
+        Registra una observación.
+        
+        Args:
+            value: Valor observado (por ejemplo, segundos)
+            *labels: Valores de las etiquetas
+        """
+        key = self._key(labels)
+        # Índice del primer límite >= value (len(buckets) = solo +Inf)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                # [cuentas por intervalo (la última es +Inf), suma, número]
+                series = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+    
+    def count(self, *labels):
+        """Número de observaciones de una serie."""
+        with self._lock:
+            series = self._values.get(self._key(labels))
+            return series[2] if series else 0
+    
+    def samples(self):
+        with self._lock:
+            snapshot = [(key, list(series[0]), series[1], series[2])
+                        for key, series in sorted(self._values.items())]
+        
+        samples = []
+        for key, counts, total, count in snapshot:
+            # Las series _bucket son acumuladas
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                samples.append(('_bucket', key, (('le', _format_value(bound)),), cumulative))
+            samples.append(('_sum', key, (), total))
+            samples.append(('_count', key, (), count))
+        return samples
+
+
+class MetricsRegistry:
+    """
+    Conjunto de métricas con nombre único.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics = {}
+    
+    def _register(self, metric):
+        """Registra una métrica, o devuelve la existente si ya hay una igual."""
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.label_names != metric.label_names:
+                    raise ValueError(f"La métrica {metric.name} ya está registrada con otra definición")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+    
+    def counter(self, name, help_text, labels=()):
+        """Crea (o devuelve) un contador."""
+        return self._register(Counter(name, help_text, labels))
+    
+    def gauge(self, name, help_text, labels=(), function=None):
+        """
+        Crea (o devuelve) un medidor.
+        
+        Si ya existe y se pasa function, la nueva función reemplaza a la
+        anterior (por ejemplo, al crear un nuevo SolveService).
+        """
+        gauge = self._register(Gauge(name, help_text, labels, function))
+        if function is not None:
+            gauge.function = function
+        return gauge
+    
+    def histogram(self, name, help_text, labels=(), buckets=SEARCH_BUCKETS):
+        """Crea (o devuelve) un histograma."""
+        return self._register(Histogram(name, help_text, labels, buckets))
+    
+    def get(self, name):
+        """Devuelve una métrica por su nombre (None si no existe)."""
+        with self._lock:
+            return self._metrics.get(name)
+    
+    def render(self):
+        """
+        Exporta todas las métricas.
+        
+        Returns:
+            str: Texto en el formato de exposición de Prometheus (versión 0.0.4)
+        """
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        return '\n'.join(metric.render() for metric in metrics) + '\n'
+    
+    def dump(self, path):
+        """
+        Escribe las métricas en un archivo de forma atómica.
+        
+        Args:
+            path: Ruta del archivo (se escribe en path.tmp y se renombra)
+        """
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.render())
+        os.replace(tmp_path, path)
+
+
+class PeriodicDump:
+    """
+    Hilo que vuelca un registro a un archivo cada cierto tiempo.
+    """
+    def __init__(self, registry, path, interval=DEFAULT_DUMP_INTERVAL):
+        """
+        Args:
+            registry: MetricsRegistry a volcar
+            path: Ruta del archivo
+            interval: Segundos entre volcados
+        """
+        self.registry = registry
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="metrics-dump", daemon=True)
+    
+    def start(self):
+        """Inicia los volcados."""
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        """Detiene los volcados y hace uno final."""
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        self._dump()
+    
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._dump()
+    
+    def _dump(self):
+        """Vuelca el registro; un error de escritura se informa sin detener la aplicación."""
+        try:
+            self.registry.dump(self.path)
+        except OSError as e:
+            print(f"No se pudieron volcar las métricas en {self.path}: {e}")
+
+
+def start_dump_from_env(registry=None, interval=DEFAULT_DUMP_INTERVAL):
+    """
+    Inicia el volcado periódico si PUZZLE_METRICS_FILE está definida.
+    
+    Returns:
+        PeriodicDump en marcha, o None si la variable no está definida
+    """
+    path = os.environ.get(METRICS_FILE_ENV)
+    if not path:
+        return None
+    return PeriodicDump(registry or REGISTRY, path, interval).start()
+
+
+# Registro del proceso y métricas comunes
+REGISTRY = MetricsRegistry()
+
+SEARCHES = REGISTRY.counter(
+    'puzzle_searches_total', "Búsquedas terminadas por motor y resultado", ('engine', 'outcome')
+)
+SEARCH_SECONDS = REGISTRY.histogram(
+    'puzzle_search_duration_seconds', "Duración de las búsquedas", ('engine',)
+)
+NODES_EXPANDED = REGISTRY.counter(
+    'puzzle_nodes_expanded_total', "Nodos expandidos", ('engine',)
+)
+NODES_PER_SECOND = REGISTRY.gauge(
+    'puzzle_nodes_per_second', "Nodos expandidos por segundo en la última búsqueda", ('engine',)
+)
+CACHE_REQUESTS = REGISTRY.counter(
+    'puzzle_cache_requests_total', "Consultas a cachés por caché y resultado (hit/miss)", ('cache', 'result')
+)
+BENCHMARK_CASES = REGISTRY.counter(
+    'puzzle_benchmark_cases_total', "Casos de comparación completados por algoritmo", ('algorithm',)
+)
+FRAME_SECONDS = REGISTRY.histogram(
+    'puzzle_ui_frame_seconds', "Tiempo de trabajo por fotograma de la interfaz", ('mode',), FRAME_BUCKETS
+)
+UI_ACTIONS = REGISTRY.counter(
+    'puzzle_ui_actions_total', "Acciones del usuario en la interfaz", ('mode', 'action')
+)
+
+
+def record_search(engine, result):
+    """
+    Registra el resultado de una búsqueda.
+    
+    Args:
+        engine: Algoritmo o motor que la ejecutó
+        result: dict con success, timed_out, nodes_expanded y execution_time
+    """
+    if result.get('timed_out'):
+        outcome = 'timeout'
+    elif result.get('success'):
+        outcome = 'success'
+    else:
+        outcome = 'failure'
+    
+    seconds = result.get('execution_time') or 0.0
+    nodes = result.get('nodes_expanded') or 0
+    SEARCHES.inc(engine, outcome)
+    SEARCH_SECONDS.observe(seconds, engine)
+    NODES_EXPANDED.inc(engine, amount=nodes)
+    if seconds > 0:
+        NODES_PER_SECOND.set(nodes / seconds, engine)
+
+
+def record_cache(cache, hit):
+    """Registra un acierto (hit=True) o un fallo de una caché."""
+    CACHE_REQUESTS.inc(cache, 'hit' if hit else 'miss')
+
+
+class FrameTimer:
+    """
+    Mide el tiempo de trabajo de un fotograma de la interfaz.
+    
+    Uso:
+        with FrameTimer('auto'):
+            ...  # aplicar pasos y dibujar
+    """
+    __slots__ = ('mode', 'start')
+    
+    def __init__(self, mode):
+        self.mode = mode
+        self.start = 0
+    
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc_info):
+        FRAME_SECONDS.observe(time.perf_counter() - self.start, self.mode)
+        return False
@@ -0,0 +1,316 @@
+"""
+Verificación vectorizada de soluciones a escala de corpus.
+
+Ejemplos:
+    python -m utils.verify soluciones.8pz
+    python -m utils.corpus unpack soluciones.8pz | python -m utils.verify -
+    python -m utils.verify soluciones.tsv --moves-column 3
+
+verify_batch() recibe todos los estados iniciales y todas las cadenas de
+movimientos como arrays de NumPy y aplica los movimientos paso a paso a la vez
+en todo el lote: en el paso t se mueve el hueco de todos los tableros cuya
+solución tiene más de t movimientos. El coste en Python es un bucle por paso
+(31 como mucho para soluciones óptimas), no uno por movimiento, así que un
+millón de soluciones se comprueba en segundos en lugar de minutos con
+Puzzle.move.
+
+Para cada solución se informa de:
+    - el primer movimiento ilegal (el hueco saldría del tablero o la letra no
+      es un movimiento),
+    - si el estado final no es el objetivo,
+    - si es más larga que la distancia óptima, cuando hay un oráculo de
+      distancias (models.distance_table).
+"""
+import argparse
+import sys
+
+from models.encoding import neighbor_positions, tile_shift
+from models.solver import MOVE_CODES
+from models.distance_table import DEFAULT_GOAL, get_distance_table
+from utils.corpus import CorpusFile, LETTER_BITS, MOVE_LETTERS, is_corpus_file, pad_rows
+from utils.lazy import lazy_import
+
+# NumPy se carga en el primer uso, no al importar el módulo
+np = lazy_import('numpy')
+
+# Código de las letras que no son un movimiento (siempre ilegal)
+INVALID_MOVE = len(MOVE_LETTERS)
+
+# Valor de illegal_step para las soluciones sin movimientos ilegales
+NO_ILLEGAL_STEP = 0
+
+# Número máximo de fallos que muestra la línea de comandos
+MAX_REPORTED = 10
+
+
+def encode_moves(moves):
+    """
+    Convierte cadenas de movimientos en una matriz de códigos.
+    
+    Args:
+        moves: Secuencia de cadenas 'UDLR...' (None = sin solución)
+    
+    Returns:
+        Tupla (codes, lengths): matriz uint8 (n, longitud máxima) con el índice
+        de cada letra en MOVE_LETTERS (INVALID_MOVE si no es un movimiento) y
+        array con la longitud de cada cadena (-1 = sin solución)
+    """
+    lengths = np.array([-1 if text is None else len(text) for text in moves], dtype=np.int64)
+    
+    # Todas las cadenas seguidas y traducidas con una tabla de 256 entradas
+    letters = np.frombuffer(''.join(text for text in moves if text).encode('ascii', 'replace'), dtype=np.uint8)
+    translation = np.full(256, INVALID_MOVE, dtype=np.uint8)
+    for letter, code in LETTER_BITS.items():
+        translation[ord(letter)] = code
+    return pad_rows(translation[letters], np.maximum(lengths, 0)), lengths
+
+
+def move_targets(size=3):
+    """
+    Tabla de destinos del hueco.
+    
+    Returns:
+        Array int (size * size, INVALID_MOVE + 1): posición a la que pasa el
+        hueco desde cada casilla con cada código de movimiento, o -1 si el
+        movimiento es ilegal
+    """
+    targets = np.full((size * size, INVALID_MOVE + 1), -1, dtype=np.int64)
+    for blank, moves in enumerate(neighbor_positions(size)):
+        for action, position in moves:
+            targets[blank, LETTER_BITS[MOVE_CODES[action]]] = position
+    return targets
+
+
+def pack_boards(boards, size=3):
+    """
+    Empaqueta muchos tableros a la vez, como pack_state().
+    
+    Args:
+        boards: Array (n, size * size) de tableros planos
+    
+    Returns:
+        Array uint64 con el estado empaquetado de cada tablero
+    """
+    shifts = np.array([tile_shift(position, size) for position in range(size * size)], dtype=np.uint64)
+    return np.bitwise_or.reduce(boards.astype(np.uint64) << shifts, axis=1)
+
+
+def verify_batch(starts, moves, goal=None, oracle=None):
+    """
+    Comprueba muchas soluciones a la vez.
+    
+    Args:
+        starts: Estados iniciales, array (n, size * size) o (n, size, size)
+        moves: Secuencia de cadenas 'UDLR...' (None = sin solución, no se
+            comprueba) o tupla (codes, lengths) como la de encode_moves() o
+            CorpusFile.move_codes()
+        goal: Estado objetivo (por defecto, 1..n-1 y el hueco al final)
+        oracle: DistanceTable, array con la distancia óptima de cada estado
+            inicial (-1 = desconocida) o None para no comprobar la longitud
+    
+    Returns:
+        dict de arrays, uno por solución:
+            checked: True si había solución que comprobar
+            illegal_step: Paso (desde 1) del primer movimiento ilegal, o 0
+            illegal_move: Código del movimiento ilegal (INVALID_MOVE si no lo hay)
+            reached_goal: True si los movimientos terminan en el objetivo
+            lengths: Número de movimientos (-1 = sin solución)
+            optimal_length: Distancia óptima del estado inicial (-1 = desconocida)
+            non_optimal: True si la solución es más larga que la óptima
+            valid: True si se comprobó y no tiene ningún problema
+    """
+    boards = np.array(starts, dtype=np.int8)
+    if boards.ndim == 3:
+        boards = boards.reshape(len(boards), -1)
+    cells = boards.shape[1]
+    size = int(round(cells ** 0.5))
+    goal = np.asarray(goal, dtype=np.int8).ravel() if goal is not None else \
+        np.array(list(range(1, cells)) + [0], dtype=np.int8)
+    
+    codes, lengths = encode_moves(moves) if not isinstance(moves, tuple) else moves
+    lengths = np.asarray(lengths, dtype=np.int64)
+    if len(lengths) != len(boards):
+        raise ValueError(f"Hay {len(boards)} estados y {len(lengths)} soluciones")
+    
+    count = len(boards)
+    boards_at_start = boards.copy()
+    targets = move_targets(size)
+    blank = np.argmin(boards, axis=1)
+    illegal_step = np.full(count, NO_ILLEGAL_STEP, dtype=np.int32)
+    illegal_move = np.full(count, INVALID_MOVE, dtype=np.uint8)
+    
+    # Tableros que siguen moviéndose: se descartan los que terminan o fallan
+    rows = np.flatnonzero(lengths > 0)
+    step = 0
+    while len(rows):
+        step_codes = codes[rows, step]
+        destinations = targets[blank[rows], step_codes]
+        
+        illegal = destinations < 0
+        illegal_step[rows[illegal]] = step + 1
+        illegal_move[rows[illegal]] = step_codes[illegal]
+        rows, destinations = rows[~illegal], destinations[~illegal]
+        
+        # Mover la ficha vecina al hueco y el hueco a su casilla
+        boards[rows, blank[rows]] = boards[rows, destinations]
+        boards[rows, destinations] = 0
+        blank[rows] = destinations
+        step += 1
+        rows = rows[lengths[rows] > step]
+    
+    checked = lengths >= 0
+    reached_goal = checked & (illegal_step == NO_ILLEGAL_STEP) & (boards == goal).all(axis=1)
+    
+    # Distancia óptima del estado inicial
+    if oracle is None:
+        optimal_length = np.full(count, -1, dtype=np.int16)
+    elif hasattr(oracle, 'lookup'):
+        optimal_length = oracle.lookup(pack_boards(boards_at_start, size))
+    else:
+        optimal_length = np.asarray(oracle, dtype=np.int16)
+    non_optimal = reached_goal & (optimal_length >= 0) & (lengths > optimal_length)
+    
+    return {
+        'checked': checked,
+        'illegal_step': illegal_step,
+        'illegal_move': illegal_move,
+        'reached_goal': reached_goal,
+        'lengths': lengths,
+        'optimal_length': optimal_length,
+        'non_optimal': non_optimal,
+        'valid': reached_goal & ~non_optimal
+    }
+
+
+def count_failures(report):
+    """
+    Resume un informe de verify_batch().
+    
+    Returns:
+        dict con checked, valid, illegal, wrong_final y non_optimal
+    """
+    illegal = report['illegal_step'] != NO_ILLEGAL_STEP
+    return {
+        'checked': int(report['checked'].sum()),
+        'valid': int(report['valid'].sum()),
+        'illegal': int(illegal.sum()),
+        'wrong_final': int((report['checked'] & ~illegal & ~report['reached_goal']).sum()),
+        'non_optimal': int(report['non_optimal'].sum())
+    }
+
+
+def describe_failure(report, index):
+    """
+    Describe el problema de una solución con un mensaje legible (las letras que
+    no son un movimiento se muestran como '?').
+    
+    Returns:
+        str o None si la solución es correcta o no se comprobó
+    """
+    if not report['checked'][index] or report['valid'][index]:
+        return None
+    step = int(report['illegal_step'][index])
+    if step != NO_ILLEGAL_STEP:
+        code = int(report['illegal_move'][index])
+        letter = MOVE_LETTERS[code] if code < INVALID_MOVE else '?'
+        return f"movimiento ilegal '{letter}' en el paso {step}"
+    if not report['reached_goal'][index]:
+        return "el camino no termina en el estado objetivo"
+    return (f"camino de {int(report['lengths'][index])} movimientos; "
+            f"el óptimo es de {int(report['optimal_length'][index])}")
+
+
+def read_text_solutions(path, moves_column=2):
+    """
+    Lee tableros y soluciones de un archivo de texto separado por tabuladores
+    (salida de `utils.corpus unpack` o de `utils.batch`).
+    
+    Args:
+        path: Ruta del archivo ('-' = entrada estándar)
+        moves_column: Columna (desde 1) con los movimientos; '-' o una columna
+            vacía en una fila sin estado 'ok' se toman como sin solución
+    
+    Returns:
+        Tupla (tableros planos, cadenas de movimientos o None)
+    """
+    boards, moves = [], []
+    f = sys.stdin if path == '-' else open(path)
+    try:
+        for line in f:
+            fields = line.rstrip('\n').split('\t')
+            if not fields[0] or fields[0].startswith('#'):
+                continue
+            try:
+                boards.append([int(num) for num in fields[0].replace(',', ' ').split()])
+            except ValueError:
+                raise ValueError(f"Tablero inválido: {fields[0]}")
+            text = fields[moves_column - 1] if len(fields) >= moves_column else '-'
+            # En la salida de utils.batch la segunda columna es el resultado
+            solved = text != '-' and (moves_column != 3 or fields[1] == 'ok')
+            moves.append(text if solved else None)
+    finally:
+        if f is not sys.stdin:
+            f.close()
+    return boards, moves
+
+
+def build_parser():
+    """Crea el parser de argumentos de la línea de comandos."""
+    parser = argparse.ArgumentParser(
+        prog="python -m utils.verify",
+        description="Comprueba que las soluciones de un corpus son legales, llegan al objetivo "
+                    "y, con la tabla de distancias, que son óptimas."
+    )
+    parser.add_argument('input',
+                        help="Corpus binario .8pz con soluciones o texto 'estado<TAB>movimientos' "
+                             "('-' = entrada estándar)")
+    parser.add_argument('--moves-column', type=int, default=2,
+                        help="Columna de los movimientos en la entrada de texto (3 para la salida "
+                             "TSV de utils.batch)")
+    parser.add_argument('--no-optimality', action='store_true',
+                        help="No comprueba la longitud con la tabla de distancias")
+    return parser
+
+
+def main(argv=None):
+    """
+    Punto de entrada de la línea de comandos.
+    
+    Returns:
+        int: Código de salida (1 si alguna solución es incorrecta)
+    """
+    args = build_parser().parse_args(argv)
+    try:
+        if args.input != '-' and is_corpus_file(args.input):
+            corpus = CorpusFile(args.input)
+            starts, moves, goal, size = corpus.boards(), corpus.move_codes(), corpus.goal, corpus.size
+        else:
+            starts, moves = read_text_solutions(args.input, args.moves_column)
+            starts, goal, size = np.array(starts).reshape(len(starts), -1), None, 3
+    except (OSError, ValueError) as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 2
+    
+    oracle = None
+    if not args.no_optimality and size == 3:
+        # La tabla solo existe para el 8-puzzle (unos segundos la primera vez)
+        oracle = get_distance_table(np.reshape(goal, (3, 3)) if goal is not None else DEFAULT_GOAL)
+    
+    report = verify_batch(starts, moves, goal=goal, oracle=oracle)
+    counts = count_failures(report)
+    
+    failures = np.flatnonzero(report['checked'] & ~report['valid'])
+    for index in failures[:MAX_REPORTED]:
+        board = ','.join(map(str, np.asarray(starts[index]).ravel()))
+        print(f"Tablero {index} ({board}): {describe_failure(report, index)}")
+    if len(failures) > MAX_REPORTED:
+        print(f"... y {len(failures) - MAX_REPORTED} más")
+    
+    print(f"Soluciones: {counts['checked']} comprobadas, {counts['valid']} correctas, "
+          f"{counts['illegal']} con movimientos ilegales, {counts['wrong_final']} sin llegar al objetivo, "
+          f"{counts['non_optimal']} no óptimas")
+    return 1 if len(failures) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())